@@ -0,0 +1,541 @@
+"""
+API Tapes for CRYPTIX Trading Bot
+Records the Binance and Coinbase responses the bot receives into compressed,
+append-only tapes, and serves them back through an offline exchange.
+
+Tape layout (<name>.tape): an 8-byte magic, then blocks of a BLOCK header and
+zlib-compressed JSON lines, one [time, source, endpoint, params, response,
+error] record per line. The sidecar <name>.tape.idx holds one fixed-width
+entry per block (offset, time range, endpoint mask) so readers only
+decompress blocks that cover the requested time range and endpoints.
+Encoding and compression run on a background writer thread; the calling
+thread only queues a reference to the response.
+
+    python api_tape.py info logs/tapes/api-20261001-120000-4242.tape
+"""
+
+import argparse
+import bisect
+import json
+import queue
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import clock
+from fake_exchange import FakeAPIException
+
+MAGIC = b'CXTAPE01'
+INDEX_MAGIC = b'CXTIDX01'
+BLOCK_MARKER = b'BLK1'
+BLOCK = struct.Struct('<4sIIIdd')   # marker, raw length, compressed length, records, first time, last time
+INDEX = struct.Struct('<QIIddI')    # block offset, compressed length, records, first time, last time, endpoint mask
+
+# Bit positions in the index endpoint mask (unknown endpoints share the top bit)
+ENDPOINTS = ('get_klines', 'get_ticker', 'get_account', 'get_exchange_info', 'get_server_time',
+             'order_market_buy', 'order_market_sell', 'coinbase_book', 'coinbase_trades')
+RECORDED_METHODS = frozenset(ENDPOINTS[:7])
+
+ORDER_MATCH_SECONDS = 60   # Recorded order acks replay for orders placed within this distance
+
+_STOP = object()
+
+
+def endpoint_mask(endpoints: Iterable[str]) -> int:
+    mask = 0
+    for name in endpoints:
+        mask |= 1 << ENDPOINTS.index(name) if name in ENDPOINTS else 1 << 31
+    return mask
+
+
+class TapeWriter:
+    """Append-only tape fed from a bounded queue by one writer thread"""
+
+    def __init__(self, path, batch_size: int = 500, flush_interval: float = 1.0,
+                 compression_level: int = 1, max_pending: int = 10000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.path.with_suffix(self.path.suffix + '.idx')
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self.compression_level = int(compression_level)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self.records_written = 0
+        self.blocks_written = 0
+        self.raw_bytes = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self.last_error: Optional[str] = None
+
+    def record(self, source: str, endpoint: str, params: Dict[str, Any], response: Any = None,
+               error: Optional[Dict[str, Any]] = None, ts: Optional[float] = None) -> None:
+        """Queue one response (or API error); never blocks the caller, drops if the queue is full"""
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((clock.time() if ts is None else ts, source, endpoint, params, response, error))
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop, daemon=True, name='tape_writer')
+                self._writer.start()
+
+    def _open(self):
+        tape = open(self.path, 'ab')
+        if tape.seek(0, 2) == 0:
+            tape.write(MAGIC)
+        index = open(self.index_path, 'ab')
+        if index.seek(0, 2) == 0:
+            index.write(INDEX_MAGIC)
+        return tape, index
+
+    def _write_block(self, tape, index, batch: List[tuple]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(json.dumps(record, separators=(',', ':'), default=str).encode('utf-8'))
+            except (TypeError, ValueError) as e:
+                self.last_error = f"Unencodable {record[2]} response: {e}"
+        if not lines:
+            return
+        raw = b'\n'.join(lines)
+        payload = zlib.compress(raw, self.compression_level)
+        times = [record[0] for record in batch]
+        first, last = min(times), max(times)
+        offset = tape.seek(0, 2)
+        tape.write(BLOCK.pack(BLOCK_MARKER, len(raw), len(payload), len(lines), first, last) + payload)
+        tape.flush()
+        index.write(INDEX.pack(offset, len(payload), len(lines), first, last,
+                               endpoint_mask({record[2] for record in batch})))
+        index.flush()
+        self.records_written += len(lines)
+        self.blocks_written += 1
+        self.raw_bytes += len(raw)
+        self.bytes_written += BLOCK.size + len(payload)
+
+    def _writer_loop(self) -> None:
+        tape, index = self._open()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                batch, done_events = [], []
+                deadline = time.monotonic() + self.flush_interval
+                while item is not None and item is not _STOP:
+                    if isinstance(item, threading.Event):
+                        done_events.append(item)
+                    else:
+                        batch.append(item)
+                    if len(batch) >= self.batch_size or done_events:
+                        break
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        item = None
+                if batch:
+                    try:
+                        self._write_block(tape, index, batch)
+                    except Exception as e:
+                        self.last_error = str(e)
+                        print(f"Tape block write failed: {e}")
+                for event in done_events:
+                    event.set()
+                if item is _STOP:
+                    break
+        finally:
+            tape.close()
+            index.close()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far is on disk"""
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(timeout=5)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'path': str(self.path),
+            'records': self.records_written,
+            'blocks': self.blocks_written,
+            'pending': self._queue.qsize(),
+            'dropped': self.dropped,
+            'raw_bytes': self.raw_bytes,
+            'bytes_written': self.bytes_written,
+            'compression_ratio': round(self.raw_bytes / self.bytes_written, 2) if self.bytes_written else None,
+            'last_error': self.last_error
+        }
+
+
+class TapeReader:
+    """Reads tapes through their block index (rebuilt from the tape if missing or behind)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(self.path.suffix + '.idx')
+        self.blocks: List[Tuple[int, int, int, float, float, int]] = self._load_index()
+
+    def _load_index(self) -> List[Tuple[int, int, int, float, float, int]]:
+        blocks = []
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+            if data[:len(INDEX_MAGIC)] == INDEX_MAGIC:
+                body = data[len(INDEX_MAGIC):]
+                usable = len(body) - len(body) % INDEX.size
+                blocks = [INDEX.unpack_from(body, pos) for pos in range(0, usable, INDEX.size)]
+        with open(self.path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a CRYPTIX API tape")
+            pos = blocks[-1][0] + BLOCK.size + blocks[-1][1] if blocks else len(MAGIC)
+            # Blocks written after the last index entry (or an index that was lost)
+            while True:
+                f.seek(pos)
+                header = f.read(BLOCK.size)
+                if len(header) < BLOCK.size:
+                    break
+                marker, _, length, count, first, last = BLOCK.unpack(header)
+                payload = f.read(length)
+                if marker != BLOCK_MARKER or len(payload) < length:
+                    break  # Truncated tail from an interrupted write
+                try:
+                    endpoints = {json.loads(line)[2] for line in zlib.decompress(payload).split(b'\n')}
+                except (zlib.error, ValueError, IndexError):
+                    break
+                blocks.append((pos, length, count, first, last, endpoint_mask(endpoints)))
+                pos += BLOCK.size + length
+        return blocks
+
+    def read_block(self, block: Tuple[int, int, int, float, float, int], f=None) -> List[list]:
+        """Every record in one indexed block"""
+        offset, length = block[0], block[1]
+        if f is None:
+            with open(self.path, 'rb') as f:
+                return self.read_block(block, f)
+        f.seek(offset + BLOCK.size)
+        return [json.loads(line) for line in zlib.decompress(f.read(length)).split(b'\n')]
+
+    def records(self, start: Optional[float] = None, end: Optional[float] = None,
+                endpoints: Optional[Iterable[str]] = None) -> Iterator[list]:
+        """[time, source, endpoint, params, response, error] records in write order"""
+        wanted = set(endpoints) if endpoints else None
+        mask = endpoint_mask(wanted) if wanted else None
+        with open(self.path, 'rb') as f:
+            for block in self.blocks:
+                _, _, _, first, last, block_mask = block
+                if (start is not None and last < start) or (end is not None and first > end):
+                    continue
+                if mask is not None and not block_mask & mask:
+                    continue
+                for record in self.read_block(block, f):
+                    if start is not None and record[0] < start or end is not None and record[0] > end:
+                        continue
+                    if wanted is not None and record[2] not in wanted:
+                        continue
+                    yield record
+
+    def get_stats(self) -> Dict[str, Any]:
+        masks = 0
+        for block in self.blocks:
+            masks |= block[5]
+        return {
+            'path': str(self.path),
+            'blocks': len(self.blocks),
+            'records': sum(block[2] for block in self.blocks),
+            'first_time': min((block[3] for block in self.blocks), default=None),
+            'last_time': max((block[4] for block in self.blocks), default=None),
+            'endpoints': [name for i, name in enumerate(ENDPOINTS) if masks & (1 << i)],
+            'bytes': self.path.stat().st_size
+        }
+
+
+def _params(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    params = dict(kwargs)
+    if args:
+        params['args'] = list(args)
+    return params
+
+
+def error_details(error: Exception) -> Dict[str, Any]:
+    """What a tape keeps of a failed call (enough for TapeExchange to raise it again)"""
+    return {
+        'type': type(error).__name__,
+        'code': getattr(error, 'code', None),
+        'message': getattr(error, 'message', str(error)),
+        'status_code': getattr(error, 'status_code', None)
+    }
+
+
+class RecordingClient:
+    """Wraps a Binance client; recorded methods return as usual and their responses
+    (or API errors) are queued to the tape. Everything else passes through."""
+
+    def __init__(self, client, tape: TapeWriter):
+        self._client = client
+        self._tape = tape
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name not in RECORDED_METHODS or not callable(attr):
+            return attr
+        tape = self._tape
+
+        def recorded(*args, **kwargs):
+            try:
+                response = attr(*args, **kwargs)
+            except Exception as e:
+                tape.record('binance', name, _params(args, kwargs), error=error_details(e))
+                raise
+            tape.record('binance', name, _params(args, kwargs), response)
+            return response
+
+        recorded.__name__ = name
+        setattr(self, name, recorded)  # Later lookups skip __getattr__
+        return recorded
+
+
+def _match_key(endpoint: str, params: Dict[str, Any]) -> tuple:
+    """Recorded responses are matched on these request parameters"""
+    if endpoint == 'get_klines':
+        return params.get('symbol'), params.get('interval')
+    if endpoint in ('coinbase_book', 'coinbase_trades'):
+        return (params.get('product'),)
+    return (params.get('symbol'),)
+
+
+class TapeExchange:
+    """Offline exchange answering each call with the latest recorded response at or
+    before the current (virtual) time. A market order gets the ack recorded for the
+    same symbol and side at about the same time; new orders fill at the latest
+    recorded price with the standard 0.1% fee.
+
+    Blocks are decompressed as the clock reaches them (window_seconds ahead), and
+    records superseded before the current time are dropped, so memory follows the
+    window rather than the length of the tape."""
+
+    APIException = FakeAPIException
+
+    def __init__(self, path, start: Optional[float] = None, end: Optional[float] = None,
+                 fee_rate: float = 0.001, window_seconds: float = 3600):
+        self.path = Path(path)
+        self.API_URL = f"tape://{self.path.name}"
+        self.fee_rate = fee_rate
+        self.start = start
+        self.end = end
+        self.window_seconds = max(float(window_seconds), ORDER_MATCH_SECONDS)
+        self._reader = TapeReader(path)
+        self._blocks = sorted((block for block in self._reader.blocks
+                               if (start is None or block[4] >= start) and (end is None or block[3] <= end)),
+                              key=lambda block: block[3])
+        self._next_block = 0
+        self._series: Dict[tuple, Tuple[List[float], List[list]]] = {}
+        self._prices: Dict[str, Tuple[List[float], List[float]]] = {}
+        self.records = sum(block[2] for block in self._blocks)
+        self.loaded_records = 0
+        first = min((block[3] for block in self._blocks), default=None)
+        last = max((block[4] for block in self._blocks), default=None)
+        self.first_time = max(first, start) if first is not None and start is not None else first
+        self.last_time = min(last, end) if last is not None and end is not None else last
+        self._lock = threading.Lock()
+        self._order_id = 0
+        self._used_orders = set()
+        self.calls: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    def _advance(self, now: float) -> None:
+        """Load the blocks starting within window_seconds of now (called under _lock)"""
+        if self._next_block >= len(self._blocks) or self._blocks[self._next_block][3] > now + ORDER_MATCH_SECONDS:
+            return
+        horizon = now + self.window_seconds
+        touched = {}  # id -> series that received records
+        with open(self.path, 'rb') as f:
+            while self._next_block < len(self._blocks) and self._blocks[self._next_block][3] <= horizon:
+                for record in self._reader.read_block(self._blocks[self._next_block], f):
+                    ts, _, endpoint, params, response, _ = record
+                    if (self.start is not None and ts < self.start) or (self.end is not None and ts > self.end):
+                        continue
+                    series = self._series.setdefault((endpoint, _match_key(endpoint, params or {})), ([], []))
+                    series[0].append(ts)
+                    series[1].append(record)
+                    touched[id(series)] = series
+                    price = self._index_price(ts, endpoint, params or {}, response)
+                    if price is not None:
+                        touched[id(price)] = price
+                    self.loaded_records += 1
+                self._next_block += 1
+        for times, items in touched.values():
+            if any(b < a for a, b in zip(times, times[1:])):
+                order = sorted(range(len(times)), key=times.__getitem__)
+                times[:] = [times[i] for i in order]
+                items[:] = [items[i] for i in order]
+        # Older records are never answered again: keep only the latest one before the order-matching window
+        cutoff = now - ORDER_MATCH_SECONDS
+        for times, items in list(self._series.values()) + list(self._prices.values()):
+            i = bisect.bisect_right(times, cutoff) - 1
+            if i > 0:
+                del times[:i]
+                del items[:i]
+
+    def _index_price(self, ts: float, endpoint: str, params: Dict[str, Any], response: Any):
+        try:
+            if endpoint == 'get_klines' and response:
+                price = float(response[-1][4])
+            elif endpoint == 'get_ticker' and isinstance(response, dict):
+                price = float(response['lastPrice'])
+            else:
+                return None
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+        series = self._prices.setdefault(params.get('symbol'), ([], []))
+        series[0].append(ts)
+        series[1].append(price)
+        return series
+
+    def _count(self, counter: Dict[str, int], endpoint: str) -> None:
+        with self._lock:
+            counter[endpoint] = counter.get(endpoint, 0) + 1
+
+    def _lookup(self, endpoint: str, params: Dict[str, Any]):
+        self._count(self.calls, endpoint)
+        now = clock.time()
+        with self._lock:
+            self._advance(now)
+            series = self._series.get((endpoint, _match_key(endpoint, params)))
+            # Before the first recording of this request, answer with the earliest loaded one
+            record = series[1][max(0, bisect.bisect_right(series[0], now) - 1)] if series else None
+        if record is None:
+            self._count(self.misses, endpoint)
+            raise FakeAPIException(-1121, f"No recorded {endpoint} response for {params}")
+        error = record[5]
+        if error:
+            raise FakeAPIException(error.get('code') or -1000, error.get('message') or 'Recorded error',
+                                   error.get('status_code') or 400)
+        return record[4]
+
+    def get_server_time(self) -> dict:
+        self._count(self.calls, 'get_server_time')
+        return {'serverTime': int(clock.time() * 1000)}
+
+    def get_klines(self, symbol: str, interval: str, limit: int = 500, **kwargs) -> list:
+        rows = self._lookup('get_klines', {'symbol': symbol, 'interval': interval})
+        return rows[-limit:] if limit else rows
+
+    def get_ticker(self, symbol: Optional[str] = None, **kwargs):
+        return self._lookup('get_ticker', {'symbol': symbol})
+
+    def get_account(self, **kwargs) -> dict:
+        return self._lookup('get_account', {})
+
+    def get_exchange_info(self) -> dict:
+        return self._lookup('get_exchange_info', {})
+
+    def coinbase(self, endpoint: str, product: str):
+        """Recorded Coinbase payload ('coinbase_book' or 'coinbase_trades')"""
+        return self._lookup(endpoint, {'product': product})
+
+    def _price(self, symbol: str) -> float:
+        now = clock.time()
+        with self._lock:
+            self._advance(now)
+            series = self._prices.get(symbol)
+            if series and series[0]:
+                return series[1][max(0, bisect.bisect_right(series[0], now) - 1)]
+        raise FakeAPIException(-1121, "Invalid symbol.")
+
+    def _recorded_order(self, endpoint: str, symbol: str) -> Optional[dict]:
+        """Unused ack recorded for this order within ORDER_MATCH_SECONDS of now (a replayed decision)"""
+        now = clock.time()
+        with self._lock:
+            self._advance(now)
+            series = self._series.get((endpoint, (symbol,)))
+            if series is None:
+                return None
+            times, items = series
+            i = bisect.bisect_left(times, now - ORDER_MATCH_SECONDS)
+            while i < len(times) and times[i] <= now + ORDER_MATCH_SECONDS:
+                key = (endpoint, symbol, times[i])
+                if key not in self._used_orders and not items[i][5]:
+                    self._used_orders.add(key)
+                    return items[i][4]
+                i += 1
+        return None
+
+    def _market_order(self, side: str, symbol: str, quantity=None, quoteOrderQty=None) -> dict:
+        self._count(self.calls, 'order')
+        recorded = self._recorded_order('order_market_buy' if side == 'BUY' else 'order_market_sell', symbol)
+        if recorded is not None:
+            return recorded
+        price = self._price(symbol)
+        qty = float(quantity) if quantity is not None else float(quoteOrderQty or 0) / price
+        value = qty * price
+        with self._lock:
+            self._order_id += 1
+            order_id = self._order_id
+        commission, asset = (qty * self.fee_rate, symbol[:-4]) if side == 'BUY' else (value * self.fee_rate, 'USDT')
+        return {
+            'symbol': symbol, 'orderId': order_id, 'orderListId': -1, 'clientOrderId': f"tape{order_id:08d}",
+            'transactTime': int(clock.time() * 1000), 'price': '0.00000000',
+            'origQty': f"{qty:.8f}", 'executedQty': f"{qty:.8f}", 'cummulativeQuoteQty': f"{value:.8f}",
+            'status': 'FILLED', 'timeInForce': 'GTC', 'type': 'MARKET', 'side': side,
+            'fills': [{'price': f"{price:.8f}", 'qty': f"{qty:.8f}", 'commission': f"{commission:.8f}",
+                       'commissionAsset': asset, 'tradeId': order_id}]
+        }
+
+    def order_market_buy(self, symbol: str, quantity=None, quoteOrderQty=None, **kwargs) -> dict:
+        return self._market_order('BUY', symbol, quantity, quoteOrderQty)
+
+    def order_market_sell(self, symbol: str, quantity=None, quoteOrderQty=None, **kwargs) -> dict:
+        return self._market_order('SELL', symbol, quantity, quoteOrderQty)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'tape': str(self.path),
+                'records': self.records,
+                'loaded_records': self.loaded_records,
+                'blocks': len(self._blocks),
+                'loaded_blocks': self._next_block,
+                'first_time': self.first_time,
+                'last_time': self.last_time,
+                'calls': dict(self.calls),
+                'misses': dict(self.misses),
+                'orders': self._order_id
+            }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect CRYPTIX API tapes")
+    sub = parser.add_subparsers(dest='command', required=True)
+    info = sub.add_parser('info', help="Summarize a tape")
+    info.add_argument('path')
+    dump = sub.add_parser('dump', help="Print records as JSON lines")
+    dump.add_argument('path')
+    dump.add_argument('--endpoint', action='append', help="Only these endpoints (repeatable)")
+    args = parser.parse_args(argv)
+
+    reader = TapeReader(args.path)
+    if args.command == 'info':
+        print(json.dumps(reader.get_stats(), indent=2))
+    else:
+        for record in reader.records(endpoints=args.endpoint):
+            print(json.dumps(record, separators=(',', ':')))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,484 @@
+"""
+Asyncio Engine for CRYPTIX Trading Bot
+Runs the scan-decide-execute cycle on one event loop. Every pair in a scan is
+fetched concurrently through an async Binance client, while Coinbase sentiment
+refresh and Telegram delivery run as tasks on the same loop over one shared
+aiohttp session. Decisions, orders and file logging reuse the web_bot
+functions on a single worker thread, so log rows keep their order, the loop
+never waits on disk and the Flask dashboard reads the same bot_status.
+
+    CRYPTIX_ENGINE=asyncio python web_bot.py
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+import clock
+import config
+from api_tape import error_details
+from kline_decoder import decode_klines
+
+DEFAULT_SETTINGS = {
+    'mode': 'threaded',
+    'max_concurrency': 20,
+    'universe': 'default',
+    'max_symbols': 200,
+    'quote_asset': 'USDT',
+    'http_timeout_seconds': 15
+}
+
+# Leveraged tokens trade like their base pair and would crowd a volume-ranked universe
+LEVERAGED_SUFFIXES = ('UP', 'DOWN', 'BULL', 'BEAR')
+
+
+def get_settings() -> Dict[str, Any]:
+    """Merge config.ENGINE over the defaults"""
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(getattr(config, 'ENGINE', {}) or {})
+    return settings
+
+
+class AsyncExchange:
+    """Awaitable Binance calls with at most max_concurrency requests in flight.
+
+    A live python-binance client gets a matching AsyncClient (whose responses go
+    to the API tape when recording); any other client, such as the fake exchange
+    or a tape replay, is synchronous and runs on a thread pool of the same size.
+    """
+
+    def __init__(self, sync_client, async_client=None, tape=None, max_concurrency: int = 20):
+        self.sync_client = sync_client
+        self.async_client = async_client
+        self.tape = tape if async_client is not None else None  # Sync clients record themselves
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.requests = 0
+        self.errors = 0
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._pool = None
+        if async_client is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='exchange_io')
+
+    @classmethod
+    async def connect(cls, bot, max_concurrency: int = 20) -> 'AsyncExchange':
+        """Async counterpart of bot.client"""
+        client = bot.client
+        inner = getattr(client, '_client', client)  # RecordingClient wraps the real client
+        if bot.Client is not None and isinstance(inner, bot.Client):
+            from binance import AsyncClient
+            async_client = await AsyncClient.create(bot.api_key, bot.api_secret, testnet=bot._use_testnet())
+            return cls(client, async_client, tape=bot.api_tape, max_concurrency=max_concurrency)
+        return cls(client, max_concurrency=max_concurrency)
+
+    async def call(self, method: str, **params):
+        async with self._semaphore:
+            self.requests += 1
+            try:
+                if self.async_client is None:
+                    loop = asyncio.get_running_loop()
+                    response, error, timeline = await loop.run_in_executor(
+                        self._pool, partial(self._call_sync, method, params, clock.time()))
+                    if timeline is not None:
+                        clock.advance_to(timeline.now)  # Completion time on a virtual clock
+                    if error is not None:
+                        raise error
+                    return response
+                response = await getattr(self.async_client, method)(**params)
+            except Exception as e:
+                self.errors += 1
+                if self.tape is not None:
+                    self.tape.record('binance', method, params, error=error_details(e))
+                raise
+            if self.tape is not None:
+                self.tape.record('binance', method, params, response)
+            return response
+
+    def _call_sync(self, method: str, params: Dict[str, Any], issued: float):
+        """(response, error, timeline): on a virtual clock the request runs on its own timeline
+        from when it was issued, so the simulated latency of requests in flight together overlaps"""
+        with clock.concurrent(issued) as timeline:
+            try:
+                return getattr(self.sync_client, method)(**params), None, timeline
+            except Exception as e:
+                return None, e, timeline
+
+    async def close(self) -> None:
+        if self.async_client is not None:
+            await self.async_client.close_connection()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'client': type(self.async_client or self.sync_client).__name__,
+            'max_concurrency': self.max_concurrency,
+            'requests': self.requests,
+            'errors': self.errors
+        }
+
+
+class AsyncTradingEngine:
+    """web_bot.trading_loop as coroutines; `bot` is the loaded web_bot module.
+
+    sentiment / notifications: run the Coinbase refresh and Telegram delivery
+    tasks (replays turn both off).
+    """
+
+    def __init__(self, bot, sentiment: bool = True, notifications: bool = True,
+                 settings: Optional[Dict[str, Any]] = None):
+        self.bot = bot
+        self.settings = settings or get_settings()
+        self.sentiment = sentiment
+        self.notifications = notifications
+        self.exchange: Optional[AsyncExchange] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        # One thread: blocking bot steps and log writes run in submission order
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async_engine_io')
+
+    def run(self) -> None:
+        """Run until bot_status['running'] goes False (blocks the calling thread)"""
+        asyncio.run(self.main())
+
+    def running(self) -> bool:
+        return bool(self.bot.bot_status.get('running'))
+
+    async def main(self) -> None:
+        bot = self.bot
+        timeout = aiohttp.ClientTimeout(total=self.settings['http_timeout_seconds'])
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            self.session = session
+            tasks = []
+            if self.sentiment:
+                bot.sentiment_service.set_external(True)
+                tasks.append(asyncio.create_task(self.refresh_sentiment(), name='sentiment_refresh'))
+            notifier = self._notifier()
+            if notifier is not None:
+                tasks.append(asyncio.create_task(notifier.delivery_loop_async(session, self.running),
+                                                 name='telegram_delivery'))
+            try:
+                await self.trading_loop()
+            finally:
+                bot.bot_status['running'] = False
+                if self.sentiment:
+                    bot.sentiment_service.set_external(False)
+                if tasks:
+                    # Queued notifications (e.g. the last trade) get a few seconds to go out
+                    _, pending = await asyncio.wait(tasks, timeout=5)
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                if self.exchange is not None:
+                    await self.exchange.close()
+                self._worker.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'universe': self.settings['universe'],
+            'max_symbols': self.settings['max_symbols'],
+            'exchange': self.exchange.get_stats() if self.exchange is not None else None,
+            'sentiment_task': self.sentiment,
+            'notification_task': self.notifications and self.bot.TELEGRAM_AVAILABLE
+        }
+
+    def _notifier(self):
+        if not self.notifications or not self.bot.TELEGRAM_AVAILABLE:
+            return None
+        module = self.bot._load_telegram()
+        return getattr(module, 'telegram_notifier', None)
+
+    async def blocking(self, fn, *args):
+        """Run a synchronous bot step (client calls, decisions, file writes) on the worker thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._worker, partial(fn, *args))
+
+    def log_error(self, *args) -> None:
+        """log_error_to_csv without waiting; the worker thread writes the row"""
+        self._worker.submit(self.bot.log_error_to_csv, *args)
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep on the bot clock: a virtual clock (replay) advances, real time is waited out"""
+        if getattr(clock.get_clock(), 'virtual', False):
+            await asyncio.to_thread(clock.sleep, seconds)
+        else:
+            await self.wait(seconds)
+
+    async def wait(self, seconds: float) -> None:
+        """Real-time wait that ends early once the bot stops"""
+        deadline = time.monotonic() + seconds
+        while self.running():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, 1.0))
+
+    # --- Scanning ---------------------------------------------------------
+
+    async def universe_tickers(self) -> List[Dict[str, Any]]:
+        """24h tickers of the pairs to scan"""
+        quote = self.settings['quote_asset']
+        if self.settings['universe'] == 'top_volume':
+            rows = await self.exchange.call('get_ticker')  # One request covers every pair
+            pairs = [row for row in rows if row['symbol'].endswith(quote)
+                     and not row['symbol'][:-len(quote)].endswith(LEVERAGED_SUFFIXES)]
+            pairs.sort(key=lambda row: float(row.get('quoteVolume', 0)), reverse=True)
+            return pairs[:self.settings['max_symbols']]
+        symbols = [f"{base}{quote}" for base in self.bot.DEFAULT_SCAN_ASSETS]
+        results = await asyncio.gather(*(self.exchange.call('get_ticker', symbol=symbol) for symbol in symbols),
+                                       return_exceptions=True)
+        tickers = []
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.log_error(f"Error scanning {symbol}: {result}", "SCAN_ERROR", "scan_trading_pairs", "WARNING")
+            else:
+                tickers.append(result)
+        return tickers
+
+    async def refresh_exchange_info(self, ttl_seconds: int = 300) -> None:
+        """Keep get_exchange_info_cached() fresh so balance checks never request it from the loop"""
+        cache = self.bot.bot_status.get('exchange_info_cache')
+        now = self.bot.get_cairo_time()
+        if cache and (now - cache['time']).total_seconds() < ttl_seconds:
+            return
+        data = await self.exchange.call('get_exchange_info')
+        self.bot.bot_status['exchange_info_cache'] = {'time': now, 'data': data}
+
+    async def scan_trading_pairs(self, min_volume_usdt: float = 1000000):
+        """scan_trading_pairs with all pairs fetched concurrently; same scoring and ranking"""
+        bot = self.bot
+        started = time.perf_counter()
+        try:
+            tickers, account, _ = await asyncio.gather(
+                self.universe_tickers(), self.exchange.call('get_account'), self.refresh_exchange_info())
+        except Exception as e:
+            self.log_error(f"Scan setup failed: {e}", "SCAN_ERROR", "scan_trading_pairs", "WARNING")
+            return []
+
+        async def scan_pair(ticker):
+            symbol = ticker['symbol']
+            try:
+                volume_usdt = float(ticker['quoteVolume'])
+                price_change_pct = float(ticker['priceChangePercent'])
+                if volume_usdt < min_volume_usdt:
+                    return None
+                klines = await self.exchange.call('get_klines', symbol=symbol, interval='1h', limit=30)
+                df = decode_klines(klines)
+                if len(df) < 15:
+                    return None
+                # Without indicator columns score_opportunity computes RSI(14), MACD and SMAs from the
+                # closes itself: the same values at a fraction of compute_indicators' cost. It runs on
+                # the loop while other pairs' requests are in flight.
+                balance = bot.check_coin_balance(symbol, account_info=account)
+                return bot.score_opportunity(symbol, df, volume_usdt, price_change_pct, min_volume_usdt, balance)
+            except Exception as e:
+                self.log_error(f"Error scanning {symbol}: {e}", "SCAN_ERROR", "scan_trading_pairs", "WARNING")
+                return None
+
+        results = await asyncio.gather(*(scan_pair(ticker) for ticker in tickers))
+        opportunities = bot.rank_opportunities([opp for opp in results if opp is not None])
+        bot.metrics.observe_stage('pair_scan', time.perf_counter() - started)
+        print(f"⚡ Scanned {len(tickers)} pairs in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return opportunities
+
+    async def prefetch_candles(self, symbols, requirements) -> None:
+        """Fetch one candle series per symbol concurrently, sized so the shared code derives
+        every interval in requirements ({interval: limit}) from the candle store"""
+        bot = self.bot
+        request = bot.candle_request(requirements)
+        if request is None:
+            return
+        interval, limit = request
+
+        async def fetch(symbol):
+            try:
+                klines = await self.exchange.call('get_klines', symbol=symbol, interval=interval, limit=limit)
+                bot.candle_store.put_base(symbol, interval, decode_klines(klines))
+            except Exception as e:
+                self.log_error(f"Candle prefetch failed for {symbol}: {e}", "DATA_FETCH_ERROR", "prefetch_candles", "WARNING")
+
+        await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+
+    async def prefetch_target(self, opportunities) -> None:
+        """Fetch the candles process_opportunities analyzes, so its fetch_data reads the candle store"""
+        symbol = opportunities[0]['symbol'] if opportunities else "BTCUSDT"
+        interval = "1m" if opportunities and self.bot.bot_status.get('hunting_mode') else "5m"
+        await self.prefetch_candles([symbol], {interval: 100})
+
+    async def prefetch_regime(self) -> None:
+        """Fetch the watchlist candles detect_market_regime would request one pair at a time"""
+        await self.prefetch_candles(self.bot.regime_fetch_symbols(), self.bot.REGIME_CANDLES)
+
+    async def prefetch_breakouts(self) -> None:
+        """Fetch the candles detect_breakout_opportunities checks, which also skips its per-pair pauses"""
+        bot = self.bot
+        symbols = [symbol for symbol in bot.BREAKOUT_PAIRS if not bot.candles_stored(symbol, bot.BREAKOUT_CANDLES)]
+        await self.prefetch_candles(symbols, bot.BREAKOUT_CANDLES)
+
+    async def detect_market_regime(self):
+        await self.prefetch_regime()
+        return await self.blocking(self.bot.detect_market_regime)
+
+    async def detect_breakout_opportunities(self):
+        await self.prefetch_breakouts()
+        return await self.blocking(self.bot.detect_breakout_opportunities)
+
+    async def should_scan_now(self):
+        """should_scan_now on candles fetched here for the regime/breakout checks it will run"""
+        bot = self.bot
+        status = bot.bot_status
+        current_time = bot.get_cairo_time()
+        scheduled = not status.get('next_signal_time') or current_time >= status['next_signal_time']
+        if not scheduled:
+            if bot.regime_check_due(current_time):
+                await self.prefetch_regime()
+            elif status.get('market_regime') == 'EXTREME':
+                await self.prefetch_breakouts()
+        return await self.blocking(bot.should_scan_now)
+
+    # --- Sentiment --------------------------------------------------------
+
+    async def _get_json(self, url: str, max_retries: int = 3):
+        """GET with the same backoff as fetch_coinbase_data"""
+        delay = 0.35
+        for attempt in range(max_retries):
+            try:
+                async with self.session.get(url, headers=self.bot.COINBASE_HEADERS) as resp:
+                    if resp.status == 200:
+                        return await resp.json(content_type=None)
+                    status, retry_after, text = resp.status, resp.headers.get('Retry-After'), await resp.text()
+            except Exception:
+                if attempt == max_retries - 1:
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 2.0)
+                continue
+            if status == 429:
+                self.log_error("Coinbase rate limit exceeded", "API_RATE_LIMIT", "fetch_coinbase_data", "WARNING")
+                await asyncio.sleep(float(retry_after) if retry_after else delay)
+            elif attempt == max_retries - 1:
+                raise RuntimeError(f"HTTP {status}: {text[:200]}")
+            else:
+                await asyncio.sleep(delay)
+            delay = min(delay * 2, 2.0)
+        return None
+
+    async def fetch_coinbase_data(self, product: str):
+        """fetch_coinbase_data on the shared session: order book and trades concurrently"""
+        bot = self.bot
+        try:
+            order_book, trades = await asyncio.gather(
+                self._get_json(f"{bot.COINBASE_API_URL}/products/{product}/book?level=2"),
+                self._get_json(f"{bot.COINBASE_API_URL}/products/{product}/trades"))
+            if not bot.coinbase_book_valid(product, order_book):
+                return None
+            return bot.store_coinbase_data(product, order_book, trades if trades is not None else [])
+        except Exception as e:
+            print(f"Coinbase data fetch error: {e}")
+            return None
+
+    async def refresh_sentiment(self) -> None:
+        """The sentiment service's refresh schedule: all tracked products at once"""
+        service = self.bot.sentiment_service
+        while self.running():
+            products = list(service.products)
+            results = await asyncio.gather(*(self.fetch_coinbase_data(product) for product in products))
+            for product, data in zip(products, results):
+                try:
+                    service.update(product, data)
+                except Exception as e:
+                    service.last_errors[product] = str(e)
+            await self.wait(service.refresh_interval)
+
+    # --- Trading loop -----------------------------------------------------
+
+    async def trading_loop(self) -> None:
+        """web_bot.trading_loop's cycle (ScanPolicy, shared helpers) with the fetches awaited here"""
+        bot = self.bot
+        status = bot.bot_status
+        status['running'] = True
+        status['signal_scanning_active'] = True
+        consecutive_errors = 0
+
+        bot.announce_trading_loop(" (asyncio engine)")
+        print(f"⚡ Concurrent scanning: {self.settings['universe']} universe, "
+              f"{self.settings['max_concurrency']} requests in flight")
+
+        if not await self.blocking(bot.prepare_trading_session):
+            status['running'] = False
+            return
+        self.exchange = await AsyncExchange.connect(bot, self.settings['max_concurrency'])
+
+        # Initial market regime detection and IMMEDIATE first scan
+        await self.detect_market_regime()
+        status['last_volatility_check'] = bot.get_cairo_time()
+        initial_interval, initial_mode = bot.calculate_smart_interval()
+        print(f"🎯 Initial scan mode: {initial_mode} ({initial_interval}s)")
+        try:
+            bot.announce_scan("STARTUP_SCAN", "WOLF SCANNING ACTIVATED (STARTUP)")
+            scan_results = await self.scan_trading_pairs()
+            status['last_scan_time'] = bot.get_cairo_time()
+            print(f"✅ Startup scan completed - found {len(scan_results)} opportunities")
+        except Exception as e:
+            print(f"⚠️ Startup scan failed: {e}")
+
+        bot.schedule_next_scan(initial_interval)
+        scan_policy = bot.ScanPolicy(bot.get_cairo_time())
+
+        while self.running():
+            try:
+                cycle_started = time.perf_counter()
+                current_time = bot.get_cairo_time()
+                bot.decay_consecutive_losses(current_time)
+
+                # Health check - only reinitialize if connection is actually lost
+                if not status['api_connected']:
+                    if not await self.blocking(bot.reconnect_client):
+                        await self.sleep(30)
+                        continue
+                    await self.exchange.close()
+                    self.exchange = await AsyncExchange.connect(bot, self.settings['max_concurrency'])
+
+                should_scan, scan_reason = await self.should_scan_now()
+                if not should_scan:
+                    await self.sleep(min(30, status.get('signal_interval', 300) // 10))
+                    continue
+
+                bot.announce_scan(scan_reason)
+                if scan_policy.regime_refresh_due(current_time):
+                    await self.detect_market_regime()
+
+                breakout_opportunities = []
+                if scan_policy.breakout_scan_due():
+                    breakout_opportunities = await self.detect_breakout_opportunities()
+
+                if scan_policy.full_scan_due(current_time, breakout_opportunities):
+                    opportunities = await self.scan_trading_pairs(min_volume_usdt=500000)
+                else:
+                    opportunities = breakout_opportunities
+                status['last_scan_time'] = bot.get_cairo_time()
+
+                # Decide and execute with the shared code, on candles fetched here
+                await self.prefetch_target(opportunities)
+                await self.blocking(bot.process_opportunities, opportunities)
+
+                consecutive_errors = 0
+                next_interval = bot.schedule_next_scan()
+
+                await self.blocking(bot.send_periodic_reports, current_time, scan_policy.last_major_scan)
+                await self.blocking(bot.flush_error_summaries)
+                bot.metrics.observe_stage('trading_cycle', time.perf_counter() - cycle_started)
+
+                await self.sleep(next_interval)
+
+            except Exception as e:
+                consecutive_errors += 1
+                sleep_time = bot.handle_trading_loop_error(e, consecutive_errors, log_error=self.log_error)
+                if sleep_time is None:
+                    break
+                await self.sleep(sleep_time)
+
+        print("\n🐺 === AI TRADING WOLF DEACTIVATED ===")
+        status['running'] = False
+        status['status'] = 'stopped'
@@ -0,0 +1,82 @@
+"""
+Kline fixtures for the CRYPTIX benchmarks
+Deterministic synthetic OHLCV series (seeded per symbol) or series replayed
+from a recorded CSV such as logs/trade_history_combined.csv written by
+Historical_data_fetch.py.
+"""
+
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+START_MS = 1_700_000_000_000 - 1_700_000_000_000 % 60_000
+
+
+def symbol_names(count: int) -> List[str]:
+    """BTCUSDT, ETHUSDT, ... then SYM0005USDT-style names up to count"""
+    majors = ['BTC', 'ETH', 'BNB', 'XRP', 'SOL', 'DOT', 'ADA']
+    return [f"{majors[i]}USDT" if i < len(majors) else f"SYM{i:04d}USDT" for i in range(count)]
+
+
+def synthetic_klines(symbol: str, candles: int, interval_seconds: int = 60, seed: int = 0) -> pd.DataFrame:
+    """Geometric random walk OHLCV frame indexed like fetch_data output"""
+    rng = np.random.default_rng(zlib.crc32(symbol.encode()) ^ seed)
+    returns = rng.normal(0.0, 0.0015, candles)
+    close = 100.0 * np.exp(np.cumsum(returns)) * (1 + rng.random() * 10)
+    open_ = np.empty(candles)
+    open_[0] = close[0]
+    open_[1:] = close[:-1]
+    spread = np.abs(rng.normal(0.0, 0.001, candles)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(3.0, 0.6, candles)
+    index = pd.to_datetime(START_MS + np.arange(candles, dtype=np.int64) * interval_seconds * 1000, unit='ms')
+    index.name = 'timestamp'
+    return pd.DataFrame({'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume}, index=index)
+
+
+class RecordedKlines:
+    """Per-symbol OHLCV series loaded from a recorded CSV (timestamp, open..volume[, symbol])"""
+
+    def __init__(self, path: str):
+        df = pd.read_csv(path)
+        missing = [c for c in ['timestamp'] + OHLCV_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"Fixture {path} is missing columns: {missing}")
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        if 'symbol' not in df.columns:
+            df['symbol'] = 'BTC'
+        self.series: Dict[str, pd.DataFrame] = {
+            str(symbol): group.set_index('timestamp')[OHLCV_COLUMNS].astype(float).sort_index()
+            for symbol, group in df.groupby('symbol')
+        }
+
+    def klines(self, index: int, candles: int) -> Tuple[str, pd.DataFrame]:
+        """Series for the index-th symbol (cycling), tiled to `candles` rows if it is shorter"""
+        names = sorted(self.series)
+        name = names[index % len(names)]
+        df = self.series[name]
+        if len(df) < candles:
+            # Chain copies, rescaling each so prices stay continuous
+            parts, scale = [], 1.0
+            while sum(len(p) for p in parts) < candles:
+                part = df * [scale, scale, scale, scale, 1.0]
+                parts.append(part)
+                scale = float(part['close'].iloc[-1] / df['close'].iloc[0])
+            df = pd.concat(parts).iloc[:candles]
+            step = df.index[1] - df.index[0] if len(self.series[name]) > 1 else pd.Timedelta(minutes=1)
+            df.index = pd.DatetimeIndex(df.index[0] + step * np.arange(candles), name='timestamp')
+        return f"{name}USDT" if not name.endswith('USDT') else name, df.iloc[-candles:].copy()
+
+
+def iter_fixtures(symbols: int, candles: int, recorded: Optional[RecordedKlines] = None,
+                  seed: int = 0) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """(symbol, OHLCV frame) for `symbols` symbols, generated one at a time to bound memory"""
+    for i, name in enumerate(symbol_names(symbols)):
+        if recorded is not None:
+            yield recorded.klines(i, candles)
+        else:
+            yield name, synthetic_klines(name, candles, seed=seed)
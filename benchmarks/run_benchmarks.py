@@ -0,0 +1,304 @@
+"""
+CRYPTIX benchmark suite
+Times kline decoding, indicator math, strategies, CSV logging and ML
+prediction offline against synthetic or recorded kline fixtures, and writes
+JSON results that can be compared between commits to catch regressions.
+
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --symbols 100 --candles 100 1000 100000 --output after.json
+    python benchmarks/run_benchmarks.py --compare before.json after.json --threshold 0.15
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fixtures import RecordedKlines, iter_fixtures
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STRATEGIES = ('STRICT', 'MODERATE', 'ADAPTIVE')
+
+
+def load_bot(workdir: Path):
+    """Import web_bot with its logs/ inside workdir and no background network activity"""
+    os.chdir(workdir)
+    sys.path.insert(0, str(REPO_ROOT))
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        import web_bot
+    return web_bot
+
+
+def summarize(name, params, samples, **extra):
+    ordered = sorted(samples)
+    result = {
+        'name': name,
+        'params': params,
+        'calls': len(samples),
+        'median_s': statistics.median(ordered),
+        'mean_s': statistics.fmean(ordered),
+        'min_s': ordered[0],
+        'p95_s': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'total_s': sum(ordered)
+    }
+    result.update(extra)
+    return result
+
+
+def result_key(result):
+    params = ','.join(f"{k}={v}" for k, v in sorted(result['params'].items()))
+    return f"{result['name']}[{params}]"
+
+
+def timed_calls(fn, args_iter):
+    samples = []
+    for args in args_iter:
+        started = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def reset_signal_rate_limits(bot):
+    """log_signal_to_csv suppresses repeats for 45-180s; clear its state so every call writes"""
+    bot.last_signals.clear()
+    bot.last_signal_time = None
+    bot.bot_status['last_logged_signal'] = {}
+
+
+# ----- benchmark cases -----
+
+def bench_indicators(bot, symbols, candles, recorded, repeat):
+    samples = []
+    for _ in range(repeat):
+        for symbol, df in iter_fixtures(symbols, candles, recorded):
+            samples.extend(timed_calls(bot.compute_indicators, [(df, symbol)]))
+    return summarize('compute_indicators', {'symbols': symbols, 'candles': candles}, samples)
+
+
+def kline_rows(df):
+    """Binance-style kline rows (string prices) for an OHLCV fixture frame"""
+    open_ms = df.index.as_unit('ms').asi8
+    values = df[['open', 'high', 'low', 'close', 'volume']].to_numpy()
+    return [[int(t), *(f"{v:.8f}" for v in row), int(t) + 59_999, '0', 0, '0', '0', '0']
+            for t, row in zip(open_ms, values)]
+
+
+def bench_decode(bot, symbols, candles, recorded, repeat):
+    batches = [kline_rows(df) for _, df in iter_fixtures(min(symbols, 10), candles, recorded)]
+    samples = []
+    for _ in range(repeat):
+        samples.extend(timed_calls(bot.decode_klines, [(rows,) for rows in batches]))
+    return summarize('decode_klines', {'candles': candles}, samples)
+
+
+def bench_rsi_macd(bot, symbols, candles, recorded, repeat):
+    closes = [df['close'].to_numpy() for _, df in iter_fixtures(symbols, candles, recorded)]
+    rsi, macd = [], []
+    for _ in range(repeat):
+        rsi.extend(timed_calls(bot.calculate_rsi, [(c,) for c in closes]))
+        macd.extend(timed_calls(bot.calculate_macd, [(c,) for c in closes]))
+    params = {'symbols': symbols, 'candles': candles}
+    return [summarize('calculate_rsi', params, rsi), summarize('calculate_macd', params, macd)]
+
+
+def bench_strategies(bot, symbols, candles, recorded, repeat):
+    frames = [(symbol, bot.compute_indicators(df, symbol)) for symbol, df in iter_fixtures(symbols, candles, recorded)]
+    results = []
+    for strategy in STRATEGIES:
+        bot.bot_status['trading_strategy'] = strategy
+        samples, signals = [], {}
+        for _ in range(repeat):
+            for symbol, df in frames:
+                reset_signal_rate_limits(bot)
+                started = time.perf_counter()
+                signal = bot.signal_generator(df, symbol)
+                samples.append(time.perf_counter() - started)
+                signals[signal] = signals.get(signal, 0) + 1
+        results.append(summarize('signal_generator', {'strategy': strategy, 'symbols': symbols, 'candles': candles},
+                                 samples, signals=signals))
+    return results
+
+
+def _prefill(path: Path, header, row, rows: int):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        day = datetime(2024, 1, 1)
+        for i in range(rows):
+            stamp = (day + pd.Timedelta(seconds=30 * i)).strftime('%Y-%m-%d %H:%M:%S')
+            writer.writerow(row(i, stamp))
+
+
+def bench_logging(bot, log_rows, appends):
+    csv_files = bot.setup_csv_logging()
+    trade_header = next(csv.reader(open(csv_files['trades'], encoding='utf-8')))
+    signal_header = next(csv.reader(open(csv_files['signals'], encoding='utf-8')))
+    trade = {'timestamp': '', 'signal': 'BUY', 'symbol': 'BTCUSDT', 'quantity': 0.001, 'price': 50000.0,
+             'value': 50.0, 'fee': 0.05, 'status': 'success', 'order_id': 1}
+    indicators = {'symbol': 'BTCUSDT', 'rsi': 45.0, 'macd': 0.1, 'macd_trend': 'BULLISH', 'sentiment': 'neutral',
+                  'sma5': 1.0, 'sma20': 1.0}
+    results = []
+    for rows in log_rows:
+        _prefill(csv_files['trades'], trade_header,
+                 lambda i, stamp: [stamp, stamp + ' EET', 'BUY', 'BTCUSDT', 0.001, 50000, 50, 0.05, 'success', i,
+                                   45, 'BULLISH', 'neutral', 0, 0, 0], rows)
+        _prefill(csv_files['signals'], signal_header,
+                 lambda i, stamp: [stamp, stamp + ' EET', 'BUY', 'BTCUSDT', 50000, 45, 0.1, 'BULLISH',
+                                   'neutral', 1, 1, 'prefill'], rows)
+        for log_type in ('trades', 'signals'):
+            bot._log_journals.pop(log_type, None)
+            for suffix in ('.idx', '.idx.tmp'):
+                Path(str(csv_files[log_type]) + suffix).unlink(missing_ok=True)
+
+        # First append after a rewrite builds the index; report it separately
+        started = time.perf_counter()
+        bot.log_trade_to_csv(trade)
+        bot.get_log_journal('signals').count()
+        results.append(summarize('log_index_build', {'rows': rows}, [time.perf_counter() - started]))
+
+        results.append(summarize('log_trade_to_csv', {'rows': rows},
+                                 timed_calls(bot.log_trade_to_csv, [(trade,)] * appends)))
+        samples = []
+        for i in range(appends):
+            reset_signal_rate_limits(bot)
+            signal = 'BUY' if i % 2 else 'SELL'
+            started = time.perf_counter()
+            bot.log_signal_to_csv(signal, 50000.0, indicators, 'benchmark')
+            samples.append(time.perf_counter() - started)
+        results.append(summarize('log_signal_to_csv', {'rows': rows}, samples))
+    return results
+
+
+def bench_predict(candles_list, repeat):
+    import ml_predictor
+    if not ml_predictor.SKLEARN_AVAILABLE:
+        return [{'name': 'PriceTrendPredictor.predict', 'params': {}, 'skipped': 'sklearn/joblib not installed'}]
+    features = ['rsi', 'macd', 'sma5', 'sma20', 'volatility']
+    rng = np.random.default_rng(0)
+
+    def feature_frame(rows):
+        df = pd.DataFrame(rng.normal(size=(rows, len(features))), columns=features)
+        df['target'] = (df['macd'] + rng.normal(scale=0.5, size=rows) > 0).astype(int)
+        return df
+
+    predictor = ml_predictor.PriceTrendPredictor(model_path='bench_model.pkl')
+    predictor.train(feature_frame(2000), features, 'target')
+    results = []
+    for candles in candles_list:
+        df = feature_frame(candles)
+        samples = timed_calls(predictor.predict, [(df, features)] * repeat)
+        results.append(summarize('PriceTrendPredictor.predict', {'candles': candles}, samples))
+    return results
+
+
+# ----- runner / comparison -----
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run(args):
+    recorded = RecordedKlines(args.fixture) if args.fixture else None
+    fixture_path = Path(args.fixture).resolve() if args.fixture else None
+    output = Path(args.output).resolve() if args.output else None
+    workdir = Path(tempfile.mkdtemp(prefix='cryptix_bench_'))
+    bot = load_bot(workdir)
+
+    results = []
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        for candles in args.candles:
+            print(f"indicators {args.symbols}x{candles}", file=sys.stderr)
+            results.append(bench_indicators(bot, args.symbols, candles, recorded, args.repeat))
+            results.append(bench_decode(bot, args.symbols, candles, recorded, args.repeat))
+            results.extend(bench_rsi_macd(bot, args.symbols, candles, recorded, args.repeat))
+            results.extend(bench_strategies(bot, args.symbols, candles, recorded, args.repeat))
+        print(f"logging {args.log_rows}", file=sys.stderr)
+        results.extend(bench_logging(bot, args.log_rows, args.appends))
+        print("predict", file=sys.stderr)
+        results.extend(bench_predict(args.candles, args.repeat))
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'fixture': str(fixture_path) if fixture_path else 'synthetic',
+            'symbols': args.symbols,
+            'candles': args.candles,
+            'log_rows': args.log_rows,
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+    for result in results:
+        if 'skipped' in result:
+            print(f"{result_key(result):<70} skipped: {result['skipped']}")
+        else:
+            print(f"{result_key(result):<70} median {result['median_s'] * 1000:10.3f} ms  "
+                  f"p95 {result['p95_s'] * 1000:10.3f} ms  calls {result['calls']}")
+    if output:
+        output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {output}")
+    return 0
+
+
+def compare(baseline_path, current_path, threshold):
+    """Print median ratios; exit status 1 if any benchmark slowed down by more than threshold"""
+    baseline = {result_key(r): r for r in json.loads(Path(baseline_path).read_text())['results'] if 'median_s' in r}
+    current = {result_key(r): r for r in json.loads(Path(current_path).read_text())['results'] if 'median_s' in r}
+    regressions = 0
+    for key in sorted(set(baseline) & set(current)):
+        old, new = baseline[key]['median_s'], current[key]['median_s']
+        ratio = new / old if old > 0 else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = '  improved'
+        print(f"{key:<70} {old * 1000:10.3f} -> {new * 1000:10.3f} ms  x{ratio:5.2f}{flag}")
+    for key in sorted(set(baseline) ^ set(current)):
+        print(f"{key:<70} only in {'baseline' if key in baseline else 'current'}")
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CRYPTIX offline benchmarks")
+    parser.add_argument('--symbols', type=int, default=10, help="Symbols per case (10-1000)")
+    parser.add_argument('--candles', type=int, nargs='+', default=[100, 1000, 10000], help="Candle counts (100-100000)")
+    parser.add_argument('--log-rows', type=int, nargs='+', default=[1000, 100000], help="Existing CSV rows before appends")
+    parser.add_argument('--appends', type=int, default=200, help="Timed appends per log size")
+    parser.add_argument('--repeat', type=int, default=3, help="Passes over each case")
+    parser.add_argument('--fixture', help="Recorded kline CSV (timestamp, open, high, low, close, volume[, symbol])")
+    parser.add_argument('--output', help="Write JSON results here")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help="Compare two result files")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed median slowdown for --compare")
+    args = parser.parse_args(argv)
+    if args.compare:
+        return compare(args.compare[0], args.compare[1], args.threshold)
+    return run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Bot State Store for CRYPTIX Trading Bot
+Dict-compatible status store shared by the trading thread and Flask request
+threads. Writes take a lock; readers get a consistent copy of the public
+fields only, so caches and internal bookkeeping never reach the API.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from error_tracking import ErrorRingBuffer
+
+# Fields exposed through snapshots and /api/status
+PUBLIC_FIELDS = (
+    'running', 'status', 'signal_scanning_active', 'last_signal', 'last_strategy',
+    'last_scan_time', 'current_symbol', 'last_price', 'last_update', 'opportunity_score',
+    'api_connected', 'account_type', 'can_trade', 'total_trades', 'errors', 'last_error',
+    'start_time', 'consecutive_errors', 'consecutive_wins', 'consecutive_losses', 'daily_loss',
+    'rsi', 'macd', 'sentiment', 'monitored_pairs', 'trading_strategy', 'next_signal_time',
+    'signal_interval', 'market_regime', 'hunting_mode', 'last_volatility_check',
+    'volatility_metrics', 'adaptive_intervals', 'trading_summary', 'last_daily_summary',
+    'last_btc_scan_time', 'engine_role'
+)
+
+# Caches and internal bookkeeping (never serialized)
+INTERNAL_FIELDS = frozenset({
+    'exchange_info_cache', 'coinbase_cache', 'balance_cache', 'last_logged_signal'
+})
+
+MAX_PUBLIC_ERRORS = 50  # Most recent errors included in snapshots
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy containers so readers never share mutable state with the trading thread"""
+    if isinstance(value, ErrorRingBuffer):
+        return value.messages(MAX_PUBLIC_ERRORS)
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return None  # Raw frames are never part of the public state
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class BotState(dict):
+    """Thread-safe bot status.
+
+    Behaves like the original global dict for existing code. Use `lock` around
+    compound nested updates and `snapshot()` for reads that leave the thread.
+    """
+
+    def __init__(self, *args, public_fields: Iterable[str] = PUBLIC_FIELDS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+        self.public_fields = tuple(public_fields)
+        self._watchers: List[Tuple[frozenset, Callable[[Dict[str, Any]], None]]] = []
+
+    def watch(self, keys: Iterable[str], callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Call callback({key: value}) after any top-level write to one of keys"""
+        self._watchers.append((frozenset(keys), callback))
+
+    def _notify(self, changed: Dict[str, Any]) -> None:
+        for keys, callback in self._watchers:
+            watched = {k: v for k, v in changed.items() if k in keys}
+            if watched:
+                try:
+                    callback(watched)
+                except Exception as e:
+                    print(f"Status watcher failed: {e}")
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            super().__setitem__(key, value)
+        if self._watchers:
+            self._notify({key: value})
+
+    def __delitem__(self, key):
+        with self.lock:
+            super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        changed = dict(*args, **kwargs)
+        with self.lock:
+            super().update(changed)
+        if self._watchers:
+            self._notify(changed)
+
+    def setdefault(self, key, default=None):
+        with self.lock:
+            return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        with self.lock:
+            return super().pop(key, *args)
+
+    def snapshot(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Consistent copy of public fields (datetimes kept as objects, caches excluded)"""
+        fields = tuple(fields) if fields is not None else self.public_fields
+        for attempt in range(3):
+            try:
+                with self.lock:
+                    snap = {k: _copy_value(dict.__getitem__(self, k))
+                            for k in fields if k in self and k not in INTERNAL_FIELDS}
+                break
+            except RuntimeError:
+                # A nested container changed size mid-copy outside the lock; retry
+                if attempt == 2:
+                    raise
+        return snap
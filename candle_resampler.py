@@ -0,0 +1,84 @@
+"""
+Candle Resampler for CRYPTIX Trading Bot
+Derives higher-timeframe OHLCV candles from a finer kline series with
+vectorized bucket aggregation, so one kline request per symbol can serve
+every interval the bot uses.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Binance intervals that align to fixed epoch buckets (weekly/monthly do not)
+INTERVAL_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '8h': 28800, '12h': 43200,
+    '1d': 86400
+}
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def interval_seconds(interval: str) -> int:
+    try:
+        return INTERVAL_SECONDS[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported interval for resampling: {interval}")
+
+
+def can_derive(source_interval: str, target_interval: str) -> bool:
+    """True if target candles are whole multiples of source candles"""
+    if source_interval not in INTERVAL_SECONDS or target_interval not in INTERVAL_SECONDS:
+        return False
+    source, target = INTERVAL_SECONDS[source_interval], INTERVAL_SECONDS[target_interval]
+    return target >= source and target % source == 0
+
+
+def rows_needed(source_interval: str, target_interval: str, limit: int) -> int:
+    """Source candles required for `limit` target candles (one extra bucket covers a partial first bucket)"""
+    ratio = interval_seconds(target_interval) // interval_seconds(source_interval)
+    return ratio * (limit + 1) if ratio > 1 else limit
+
+
+def resample_ohlcv(df: pd.DataFrame, source_interval: str, target_interval: str,
+                   limit: Optional[int] = None) -> pd.DataFrame:
+    """Aggregate an OHLCV frame indexed by candle open time into target_interval candles.
+
+    Buckets are aligned to the epoch like Binance klines. A first bucket that
+    starts before the data is dropped; the last bucket is kept even if partial,
+    matching the still-forming candle Binance returns for the current period.
+    """
+    if not can_derive(source_interval, target_interval):
+        raise ValueError(f"Cannot derive {target_interval} candles from {source_interval}")
+    if source_interval == target_interval or df.empty:
+        out = df[OHLCV_COLUMNS].copy()
+        return out.iloc[-limit:] if limit else out
+
+    unit = df.index.unit
+    ts = df.index.as_unit('ns').asi8
+    step = interval_seconds(target_interval) * 1_000_000_000
+    buckets = ts - ts % step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(ts)]
+    if ts[0] != buckets[0]:
+        starts, ends = starts[1:], ends[1:]  # First bucket is missing its opening candles
+    if not len(starts):
+        return df[OHLCV_COLUMNS].iloc[:0].copy()
+    if limit:
+        starts, ends = starts[-limit:], ends[-limit:]
+
+    # reduceat needs contiguous segments: restrict the arrays to the kept range
+    first, last = starts[0], ends[-1]
+    offsets = starts - first
+    high = df['high'].to_numpy(dtype=np.float64)[first:last]
+    low = df['low'].to_numpy(dtype=np.float64)[first:last]
+    volume = df['volume'].to_numpy(dtype=np.float64)[first:last]
+
+    index = pd.DatetimeIndex(buckets[starts].astype('datetime64[ns]'), name=df.index.name).as_unit(unit)
+    return pd.DataFrame({
+        'open': df['open'].to_numpy(dtype=np.float64)[starts],
+        'high': np.maximum.reduceat(high, offsets),
+        'low': np.minimum.reduceat(low, offsets),
+        'close': df['close'].to_numpy(dtype=np.float64)[ends - 1],
+        'volume': np.add.reduceat(volume, offsets)
+    }, index=index)
@@ -0,0 +1,124 @@
+"""
+Candle Store for CRYPTIX Trading Bot
+Bounded in-memory cache of recently fetched kline DataFrames. Scan results
+keep a small CandleHandle instead of the DataFrame itself. Raw series are
+also kept per (symbol, interval) as bases that higher intervals are derived
+from without another kline request.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import pandas as pd
+
+from candle_resampler import INTERVAL_SECONDS, can_derive, resample_ohlcv, rows_needed
+
+
+@dataclass(frozen=True, slots=True)
+class CandleHandle:
+    """Reference to a cached candle series"""
+    symbol: str
+    interval: str
+    fetched_at: float
+
+
+class CandleStore:
+    """LRU cache of the latest candle DataFrame per (symbol, interval)"""
+
+    def __init__(self, max_entries: int = 64, clock: Callable[[], float] = time.time):
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._frames: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._bases: "OrderedDict[tuple, tuple]" = OrderedDict()  # (symbol, interval) -> (handle, raw OHLCV frame)
+        self._lock = threading.Lock()
+        self.derived = 0
+        self.misses = 0
+
+    def put(self, symbol: str, interval: str, df: pd.DataFrame) -> CandleHandle:
+        """Store df as the latest series for symbol/interval and return its handle"""
+        handle = CandleHandle(symbol, interval, self._clock())
+        key = (symbol, interval)
+        with self._lock:
+            self._frames[key] = (handle, df)
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+        return handle
+
+    def get(self, handle: CandleHandle, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """DataFrame for handle, or None if evicted, replaced by a newer fetch, or too old"""
+        with self._lock:
+            entry = self._frames.get((handle.symbol, handle.interval))
+        if entry is None or entry[0] != handle:
+            return None
+        if max_age is not None and self._clock() - handle.fetched_at > max_age:
+            return None
+        return entry[1]
+
+    def latest(self, symbol: str, interval: str, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """Most recent DataFrame for symbol/interval regardless of handle"""
+        with self._lock:
+            entry = self._frames.get((symbol, interval))
+        if entry is None:
+            return None
+        if max_age is not None and self._clock() - entry[0].fetched_at > max_age:
+            return None
+        return entry[1]
+
+    def put_base(self, symbol: str, interval: str, df: pd.DataFrame) -> CandleHandle:
+        """Keep df (raw OHLCV, not to be mutated) as a series to derive symbol's candles from"""
+        handle = CandleHandle(symbol, interval, self._clock())
+        key = (symbol, interval)
+        with self._lock:
+            self._bases[key] = (handle, df)
+            self._bases.move_to_end(key)
+            while len(self._bases) > self.max_entries:
+                self._bases.popitem(last=False)
+        return handle
+
+    def derive(self, symbol: str, interval: str, limit: int,
+               max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """`limit` candles of `interval` resampled from the finest fresh base series for symbol
+        that covers them, or None if no base qualifies"""
+        now = self._clock()
+        with self._lock:
+            bases = [self._bases[(symbol, source)] for source in INTERVAL_SECONDS if (symbol, source) in self._bases]
+        for handle, df in bases:  # INTERVAL_SECONDS is ordered finest first
+            if max_age is not None and now - handle.fetched_at > max_age:
+                continue
+            if can_derive(handle.interval, interval) and len(df) >= rows_needed(handle.interval, interval, limit):
+                out = resample_ohlcv(df, handle.interval, interval, limit)
+                if len(out) >= limit:
+                    self.derived += 1
+                    return out
+        self.misses += 1
+        return None
+
+    def covers(self, symbol: str, interval: str, limit: int, max_age: Optional[float] = None) -> bool:
+        """True if derive() would find a base series for this request"""
+        now = self._clock()
+        with self._lock:
+            bases = [self._bases[(symbol, source)] for source in INTERVAL_SECONDS if (symbol, source) in self._bases]
+        return any((max_age is None or now - handle.fetched_at <= max_age)
+                   and can_derive(handle.interval, interval) and len(df) >= rows_needed(handle.interval, interval, limit)
+                   for handle, df in bases)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._frames),
+                'bases': [f"{symbol}@{interval}" for symbol, interval in self._bases],
+                'derived': self.derived,
+                'misses': self.misses
+            }
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._bases.clear()
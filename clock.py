@@ -0,0 +1,190 @@
+"""
+Clock for CRYPTIX Trading Bot
+Every time read and sleep on the trading path goes through the active clock.
+SystemClock is the wall clock; VirtualClock runs from a chosen start time and
+either jumps over sleeps instantly (deterministic replay) or runs at a fixed
+speed multiple of real time.
+"""
+
+import threading
+import time as _time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Callable, Optional
+
+
+class SystemClock:
+    """Wall-clock time and real sleeps"""
+
+    virtual = False
+
+    def time(self) -> float:
+        return _time.time()
+
+    def monotonic(self) -> float:
+        return _time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            _time.sleep(seconds)
+
+    def now(self, tz=None) -> datetime:
+        return datetime.now(tz)
+
+    def concurrent(self, start: Optional[float] = None):
+        return nullcontext()  # Real sleeps on different threads already overlap
+
+    def advance_to(self, when: float) -> None:
+        pass
+
+
+class Timeline:
+    """One thread's own time inside VirtualClock.concurrent()"""
+
+    __slots__ = ('now',)
+
+    def __init__(self, now: float):
+        self.now = now
+
+
+class VirtualClock:
+    """Simulated time starting at `start` (epoch seconds).
+
+    speed=None: time only moves when someone sleeps, so a replay is
+    deterministic and runs as fast as the code does. speed=N: time runs N times
+    faster than real time and sleeps last seconds / N real seconds.
+    `until` stops the clock: the sleep that would cross it returns early and
+    calls on_expire (e.g. to stop the trading loop). Work that runs alongside
+    other threads (concurrent requests) sleeps inside concurrent(), so
+    overlapping sleeps cost the longest of them instead of their sum.
+    """
+
+    virtual = True
+
+    def __init__(self, start: float, speed: Optional[float] = None, until: Optional[float] = None,
+                 on_expire: Optional[Callable[[], None]] = None):
+        self.start = float(start)
+        self.speed = float(speed) if speed else None
+        self.until = until
+        self.on_expire = on_expire
+        self.expired = False
+        self.slept = 0.0
+        self.sleeps = 0
+        self._offset = 0.0
+        self._real_origin = _time.monotonic()
+        self._lock = threading.Lock()
+        self._local = threading.local()  # .timeline: the thread's Timeline inside concurrent()
+
+    def time(self) -> float:
+        with self._lock:
+            return self._now_locked()
+
+    def _now_locked(self) -> float:
+        timeline = getattr(self._local, 'timeline', None)
+        if timeline is not None:
+            return timeline.now
+        elapsed = (_time.monotonic() - self._real_origin) * self.speed if self.speed else 0.0
+        return self.start + self._offset + elapsed
+
+    def monotonic(self) -> float:
+        return self.time()
+
+    def now(self, tz=None) -> datetime:
+        return datetime.fromtimestamp(self.time(), tz)
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward without sleeping"""
+        with self._lock:
+            self._offset += max(0.0, seconds)
+
+    def advance_to(self, when: float) -> None:
+        """Move time forward to `when` unless it is already later"""
+        with self._lock:
+            self._offset += max(0.0, when - self._now_locked())
+
+    @contextmanager
+    def concurrent(self, start: Optional[float] = None):
+        """Instant mode: inside, this thread reads and sleeps on its own Timeline from
+        `start` (when the work was issued; default now) and the shared clock does not
+        move. The caller passes the yielded timeline's end to advance_to() once it uses
+        the result, so work in flight together costs its longest sleep, not the sum."""
+        if self.speed or getattr(self._local, 'timeline', None) is not None:
+            yield None
+            return
+        timeline = Timeline(self.time() if start is None else start)
+        self._local.timeline = timeline
+        try:
+            yield timeline
+        finally:
+            self._local.timeline = None
+
+    def sleep(self, seconds: float) -> None:
+        if seconds <= 0 or self.expired:
+            return
+        expire = False
+        with self._lock:
+            self.sleeps += 1
+            now = self._now_locked()
+            if self.until is not None and now + seconds >= self.until:
+                seconds = max(0.0, self.until - now)
+                self.expired = expire = True
+            self.slept += seconds
+            if not self.speed:
+                timeline = getattr(self._local, 'timeline', None)
+                if timeline is not None:
+                    timeline.now += seconds
+                else:
+                    self._offset += seconds
+        if self.speed:
+            _time.sleep(seconds / self.speed)
+        if expire and self.on_expire:
+            self.on_expire()
+
+    def get_stats(self) -> dict:
+        return {
+            'time': self.time(),
+            'speed': self.speed or 'instant',
+            'sleeps': self.sleeps,
+            'slept_seconds': round(self.slept, 3),
+            'expired': self.expired
+        }
+
+
+_clock = SystemClock()
+
+
+def get_clock():
+    return _clock
+
+
+def set_clock(new_clock) -> object:
+    """Install new_clock for all callers; returns the previous clock"""
+    global _clock
+    previous, _clock = _clock, new_clock
+    return previous
+
+
+# Module-level shortcuts that always follow the installed clock
+def time() -> float:
+    return _clock.time()
+
+
+def monotonic() -> float:
+    return _clock.monotonic()
+
+
+def sleep(seconds: float) -> None:
+    _clock.sleep(seconds)
+
+
+def concurrent(start: Optional[float] = None):
+    """Context for work that overlaps other threads' (see VirtualClock.concurrent)"""
+    return _clock.concurrent(start)
+
+
+def advance_to(when: float) -> None:
+    _clock.advance_to(when)
+
+
+def now(tz=None) -> datetime:
+    return _clock.now(tz)
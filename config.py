@@ -60,6 +60,23 @@ ADX = {
     'min_trend_moderate': 20
 }
 
+# Market Sentiment (Coinbase order book + trade flow)
+SENTIMENT = {
+    'product': 'BTC-USD',        # Default Coinbase product for market sentiment
+    'products': ['BTC-USD', 'ETH-USD'],  # Products refreshed in the background
+    'refresh_interval_seconds': 30,      # Background refresh schedule
+    'max_age_seconds': 180,      # Older sentiment is treated as neutral
+    'max_workers': 4,            # Concurrent product refreshes
+    'ttl_seconds': 30,           # Reuse fetched Coinbase data within this window
+    'depth_levels': 10,          # Order book levels per side
+    'weights': {
+        'order_book': 0.5,       # Depth-weighted bid/ask imbalance
+        'trade_flow': 0.3,       # Buy vs sell traded volume
+        'vwap_skew': 0.2         # Recent trade VWAP vs mid price
+    },
+    'vwap_skew_scale_bps': 10.0  # VWAP/mid deviation (bps) treated as a strong skew
+}
+
 # Statistical Parameters
 ZSCORE_THRESHOLD = 2.0  # Z-score threshold for statistical signals
 VAR_CONFIDENCE = 0.95   # Value at Risk confidence level
@@ -160,6 +177,31 @@ API_RATE_LIMITS = {
 # Can be overridden by env vars BINANCE_TESTNET/USE_TESTNET ("1","true","yes")
 USE_TESTNET = False
 
+# Exchange backend ('fake' runs against the offline simulator in fake_exchange.py; no credentials needed)
+EXCHANGE = {
+    'mode': 'live',                  # 'live' or 'fake'; CRYPTIX_EXCHANGE env var overrides
+    'fake': {
+        'symbols': 50,               # Simulated USDT pairs (majors first, then TK001USDT...)
+        'seed': 0,                   # Price paths are deterministic per seed and symbol
+        'latency_ms': 0,             # Added delay per request
+        'jitter_ms': 0,              # Extra random delay (0..jitter_ms)
+        'weight_per_minute': 6000,   # Request weight budget before -1003 (HTTP 429) responses
+        'error_rate': 0.0,           # Share of requests failing with a transient -1001 error
+        'balances': {'USDT': 10000.0}
+    }
+}
+
+# Trading engine: 'threaded' runs the classic blocking loop; 'asyncio' runs scans, sentiment
+# refresh and Telegram delivery concurrently on one event loop (async_engine.py)
+ENGINE = {
+    'mode': 'threaded',              # 'threaded' or 'asyncio'; CRYPTIX_ENGINE env var overrides
+    'max_concurrency': 20,           # Binance requests in flight at once
+    'universe': 'default',           # 'default' (the 10 classic pairs) or 'top_volume'
+    'max_symbols': 200,              # Pairs scanned per cycle with 'top_volume' (by 24h quote volume)
+    'quote_asset': 'USDT',
+    'http_timeout_seconds': 15       # Coinbase/Telegram requests on the shared aiohttp session
+}
+
 # Telegram Notification Settings
 TELEGRAM = {
     'enabled': True,  # Enable/disable Telegram notifications
@@ -180,9 +222,76 @@ TELEGRAM = {
     },
     'rate_limiting': {
         'max_messages_per_minute': 20,  # Rate limit to avoid spam
-        'batch_notifications': True      # Batch similar notifications
+        'batch_notifications': True,     # Combine queued notifications into one message
+        'batch_window_seconds': 1.0,     # Wait this long for more messages before sending a batch
+        'queue_size': 200,               # Max pending notifications (oldest dropped when full)
+        'max_retries': 3,                # Delivery retries for transient failures
+        'retry_backoff_seconds': 2.0     # Initial retry delay (doubles per attempt)
     }
 }
 
+# API response recording (replayable tapes of every Binance/Coinbase response; see api_tape.py)
+RECORDING = {
+    'enabled': False,                # CRYPTIX_RECORD=1 env var overrides
+    'dir': 'logs/tapes',             # One api-<start time>-<pid>.tape (+ .idx) per process
+    'batch_size': 500,               # Records per compressed block
+    'flush_interval_seconds': 1.0,   # Max delay before queued records reach disk
+    'compression_level': 1,          # zlib level (1 = fastest)
+    'max_pending': 10000             # Queued records before new ones are dropped (never blocks trading)
+}
+
+# Log storage (CSV logs are always written; SQLite adds indexed queries for the dashboard)
+STORAGE = {
+    'backend': 'csv',                  # 'csv' or 'sqlite'
+    'sqlite_path': 'logs/cryptix.db',  # Empty tables import the CSV logs on startup; re-import with: python storage.py migrate --replace
+    'batch_size': 100,                 # Rows per batched insert
+    'flush_interval_seconds': 1.0      # Max delay before queued rows are committed
+}
+
+# Candle fetching (higher intervals are resampled from the finest recently fetched series)
+CANDLES = {
+    'resample': True,            # Derive 5m/1h/... candles from a fresh finer series instead of refetching
+    'max_age_seconds': 20,       # How long a fetched series may serve derived requests
+    'max_request_limit': 1000    # Binance klines cap; prefetches needing more rows fall back to per-interval fetches
+}
+
+# Market regime (every monitored pair is classified; breadth can escalate the anchor's regime)
+REGIME = {
+    'anchor': 'BTCUSDT',        # Pair whose own regime is always considered
+    'candle_interval': '5m',    # Results are reused until this candle closes
+    'breadth_extreme': 0.3,     # Share of EXTREME pairs that makes the market EXTREME
+    'breadth_volatile': 0.4,    # Share of VOLATILE-or-worse pairs that makes it VOLATILE
+    'breadth_quiet': 0.6,       # Share of QUIET pairs needed for QUIET breadth
+    'breadth_refresh_seconds': 3600  # Breadth pairs' candles are refetched (together) this often; the anchor every candle
+}
+
+# Dashboard rendering cache
+DASHBOARD = {
+    'page_cache_seconds': 2,       # Rendered dashboard/log pages are reused for this long
+    'balances_cache_seconds': 15,  # Account balance view model TTL (avoids an API call per poll)
+    'view_cache_entries': 256,     # Cached pages/view models kept (least recently used evicted)
+    'stream_queue_size': 100,      # Max pending live-feed events per client (oldest dropped)
+    'stream_keepalive_seconds': 15, # Comment ping on idle /api/stream connections
+    'stream_max_clients': 4,       # Open /api/stream connections (each holds a server thread); more get 503 and poll
+    'stream_max_seconds': 300      # Streams close after this long; EventSource reconnects
+}
+
+# Error aggregation (repeated errors are logged/notified once per window with a count)
+ERROR_AGGREGATION = {
+    'enabled': True,
+    'window_seconds': 300,     # Repeats of the same fingerprint inside this window are counted, not re-sent
+    'max_fingerprints': 500,   # Distinct open windows kept in memory
+    'status_buffer_size': 200  # Recent errors kept in bot_status['errors'] (ring buffer)
+}
+
+# Web server (production mode uses waitress when installed, otherwise threaded Werkzeug)
+SERVER = {
+    'mode': 'production',                            # 'production' or 'development' (Flask dev server)
+    'host': '0.0.0.0',                               # FLASK_HOST env var overrides
+    'port': 10000,                                   # PORT env var overrides
+    'threads': 8,                                    # Request threads (each open /api/stream holds one)
+    'leader_lock_path': 'logs/trading_engine.lock'   # Refuses to trade from a second process on the same logs/
+}
+
 # Simple toggle for sending signal notifications (BUY/SELL); trades remain enabled
 TELEGRAM_SEND_SIGNALS = False
@@ -0,0 +1,186 @@
+"""
+Error Tracking for CRYPTIX Trading Bot
+Fingerprints repeated errors so bursts (e.g. one failing call inside a
+multi-symbol scan loop) are logged and notified once per window with a count,
+and keeps recent errors in a bounded ring buffer for the status API.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Normalization rules applied to messages and function names before fingerprinting
+_NORMALIZERS = [
+    (re.compile(r'\b[A-Z0-9]{2,12}(?:USDT|BUSD|USDC|USD|BTC|ETH)\b'), '<SYMBOL>'),
+    (re.compile(r'\b[A-Z]{2,10}-USD\b'), '<PRODUCT>'),
+    (re.compile(r'0x[0-9a-fA-F]+'), '<HEX>'),
+    (re.compile(r'\b[0-9a-fA-F]{16,}\b'), '<ID>'),
+    (re.compile(r'[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?'), '<N>'),
+    (re.compile(r'\s+'), ' '),
+]
+
+_SEVERITY_RANK = {'DEBUG': 0, 'INFO': 1, 'WARNING': 2, 'ERROR': 3, 'CRITICAL': 4}
+
+
+def normalize_error_text(text: str) -> str:
+    """Strip volatile parts (symbols, numbers, ids) from an error string"""
+    text = str(text or '')
+    for pattern, replacement in _NORMALIZERS:
+        text = pattern.sub(replacement, text)
+    return text.strip()[:300]
+
+
+class ErrorAggregator:
+    """Aggregate repeated errors per fingerprint within a time window.
+
+    The first occurrence of a fingerprint is emitted immediately; repeats inside
+    the window are only counted. When the window closes, pop_summaries() returns
+    one summary per fingerprint that had suppressed repeats.
+    """
+
+    def __init__(self, window_seconds: float = 300.0, max_fingerprints: int = 500,
+                 clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = float(window_seconds)
+        self.max_fingerprints = int(max_fingerprints)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self.total_suppressed = 0
+
+    @staticmethod
+    def fingerprint(error_type: str, function_name: str, message: str) -> str:
+        return f"{error_type}|{normalize_error_text(function_name)}|{normalize_error_text(message)}"
+
+    def record(self, error_type: str, function_name: str, message: str, severity: str = "ERROR") -> bool:
+        """Register an error; returns True if it should be logged/notified now"""
+        key = self.fingerprint(error_type, function_name, message)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry['window_start'] < self.window_seconds:
+                entry['suppressed'] += 1
+                entry['last_message'] = str(message)
+                if _SEVERITY_RANK.get(severity, 3) > _SEVERITY_RANK.get(entry['severity'], 3):
+                    entry['severity'] = severity
+                self.total_suppressed += 1
+                return False
+
+            if entry is not None:
+                self._close(key, entry, now)
+            self._entries[key] = {
+                'window_start': now,
+                'suppressed': 0,
+                'error_type': error_type,
+                'function_name': function_name,
+                'last_message': str(message),
+                'severity': severity
+            }
+            # Bound memory: evict the oldest windows (their summaries are kept)
+            while len(self._entries) > self.max_fingerprints:
+                old_key, old_entry = next(iter(self._entries.items()))
+                self._close(old_key, old_entry, now)
+            return True
+
+    def _close(self, key: str, entry: Dict[str, Any], now: float) -> None:
+        """Close a window (lock held); queue a summary if repeats were suppressed"""
+        self._entries.pop(key, None)
+        if entry['suppressed'] > 0:
+            self._pending.append({
+                'error_type': entry['error_type'],
+                'function_name': entry['function_name'],
+                'message': entry['last_message'],
+                'severity': entry['severity'],
+                'count': entry['suppressed'],
+                'window_seconds': round(now - entry['window_start'], 1)
+            })
+
+    def pop_summaries(self, force: bool = False) -> List[Dict[str, Any]]:
+        """Return summaries for windows that have closed (all windows if force)"""
+        now = self._clock()
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if force or now - entry['window_start'] >= self.window_seconds:
+                    self._close(key, entry, now)
+            summaries, self._pending = self._pending, []
+        return summaries
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'window_seconds': self.window_seconds,
+                'open_fingerprints': len(self._entries),
+                'suppressed_in_open_windows': sum(e['suppressed'] for e in self._entries.values()),
+                'total_suppressed': self.total_suppressed
+            }
+
+
+class ErrorRingBuffer:
+    """Fixed-capacity store of recent errors with per-type counters.
+
+    Oldest entries are overwritten once capacity is reached, so memory stays
+    flat regardless of uptime. Counters cover every error ever recorded.
+    """
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = max(1, int(capacity))
+        self._entries = deque(maxlen=self.capacity)
+        self._lock = threading.Lock()
+        self.total = 0
+        self.counts_by_type: Dict[str, int] = {}
+        self.last_seen_by_type: Dict[str, str] = {}
+
+    def append(self, message: str, error_type: str = "GENERAL") -> None:
+        """Record an error (list.append-compatible signature)"""
+        timestamp = datetime.now().isoformat()
+        with self._lock:
+            self.total += 1
+            self._entries.append({
+                'id': self.total,
+                'timestamp': timestamp,
+                'error_type': error_type,
+                'message': str(message)
+            })
+            self.counts_by_type[error_type] = self.counts_by_type.get(error_type, 0) + 1
+            self.last_seen_by_type[error_type] = timestamp
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def messages(self, limit: Optional[int] = None) -> List[str]:
+        """Most recent messages, oldest first (matches the old list layout)"""
+        with self._lock:
+            entries = list(self._entries)
+        if limit is not None:
+            entries = entries[-limit:]
+        return [e['message'] for e in entries]
+
+    def page(self, offset: int = 0, limit: int = 50, error_type: Optional[str] = None) -> Dict[str, Any]:
+        """Newest-first page of retained errors, optionally filtered by type"""
+        offset = max(0, int(offset))
+        limit = max(1, min(int(limit), self.capacity))
+        with self._lock:
+            entries = list(self._entries)
+            counts = dict(self.counts_by_type)
+            last_seen = dict(self.last_seen_by_type)
+            total = self.total
+        entries.reverse()
+        if error_type:
+            entries = [e for e in entries if e['error_type'] == error_type]
+        return {
+            'items': entries[offset:offset + limit],
+            'offset': offset,
+            'limit': limit,
+            'retained': len(entries),
+            'total_recorded': total,
+            'capacity': self.capacity,
+            'counts_by_type': counts,
+            'last_seen_by_type': last_seen
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,428 @@
+"""
+Fake Binance Exchange for CRYPTIX Trading Bot
+In-process stand-in for binance.client.Client covering the calls the bot makes
+(klines, tickers, account, exchange info, market orders). Prices follow
+deterministic per-symbol random walks, requests can be delayed and are
+charged Binance request weights, so the full trading loop can be exercised
+and load-tested offline, including rate-limit (-1003 / HTTP 429) handling.
+"""
+
+import math
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from candle_resampler import INTERVAL_SECONDS
+
+MINUTES_PER_CHUNK = 1440             # Minute candles are generated one UTC day at a time
+ORIGIN_DAY = 17167                   # 2017-01-01: price paths start here (offset 0)
+DAYS_PER_BLOCK = 4096                # Daily drift draws per generator block
+CHUNK_CACHE_SIZE = 1024              # Generated (symbol, day) chunks kept in memory
+
+# Starting prices for the pairs web_bot scans by default; other symbols get random price levels
+MAJOR_PRICES = {
+    'BTC': 60000.0, 'ETH': 3000.0, 'BNB': 550.0, 'XRP': 0.6, 'SOL': 150.0,
+    'MATIC': 0.7, 'DOT': 7.0, 'ADA': 0.45, 'AVAX': 35.0, 'LINK': 15.0, 'DOGE': 0.15
+}
+
+# Request weights as documented for the Spot REST API
+ENDPOINT_WEIGHTS = {
+    'get_server_time': 1,
+    'get_account': 20,
+    'get_exchange_info': 20,
+    'get_ticker': 2,            # 80 without a symbol
+    'order': 1
+}
+
+
+def kline_weight(limit: int) -> int:
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def default_symbols(count: int) -> List[str]:
+    """Major USDT pairs first, then TK001USDT-style synthetic pairs"""
+    majors = [f"{asset}USDT" for asset in MAJOR_PRICES]
+    return majors[:count] + [f"TK{i:03d}USDT" for i in range(1, count - len(majors) + 1)]
+
+
+class FakeAPIException(Exception):
+    """Same attributes as binance.exceptions.BinanceAPIException (code, message, status_code)"""
+
+    def __init__(self, code: int, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+        self.response = None
+        self.request = None
+
+    def __str__(self):
+        return "APIError(code=%s): %s" % (self.code, self.message)
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.8f}"
+
+
+class _SymbolPath:
+    """Deterministic minute candles for one symbol.
+
+    Each day's log-price offset comes from a seeded daily random walk; minutes
+    inside a day are a Brownian bridge between consecutive offsets, so any day
+    can be generated independently and always produces the same candles.
+    """
+
+    def __init__(self, symbol: str, seed: int):
+        self.symbol = symbol
+        self.key = zlib.crc32(symbol.encode())
+        self.seed = seed
+        rng = np.random.default_rng([seed, self.key])
+        asset = symbol[:-4] if symbol.endswith('USDT') else symbol
+        self.base_price = MAJOR_PRICES.get(asset) or float(10 ** rng.uniform(-2, 3))
+        self.minute_vol = 0.0008 * float(rng.uniform(0.5, 2.0))
+        self.base_volume_usdt = float(10 ** rng.uniform(5.5, 8.5)) / MINUTES_PER_CHUNK
+        self._offsets = np.zeros(1)  # Log-price offset at the start of ORIGIN_DAY + i
+
+    def offset(self, day: int) -> float:
+        index = day - ORIGIN_DAY
+        if index < 0:
+            raise ValueError(f"Fake price path starts at day {ORIGIN_DAY} (2017-01-01)")
+        while index >= len(self._offsets):
+            block = (len(self._offsets) - 1) // DAYS_PER_BLOCK
+            rng = np.random.default_rng([self.seed, self.key, 1, block])
+            draws = rng.normal(0.0, self.minute_vol * math.sqrt(MINUTES_PER_CHUNK), DAYS_PER_BLOCK)
+            self._offsets = np.concatenate([self._offsets, self._offsets[-1] + np.cumsum(draws)])
+        return float(self._offsets[index])
+
+    def day(self, day: int) -> Dict[str, np.ndarray]:
+        start, end = self.offset(day), self.offset(day + 1)
+        rng = np.random.default_rng([self.seed, self.key, 2, day])
+        walk = np.cumsum(rng.normal(0.0, self.minute_vol, MINUTES_PER_CHUNK))
+        fraction = np.arange(1, MINUTES_PER_CHUNK + 1) / MINUTES_PER_CHUNK
+        log_close = start + fraction * (end - start) + walk - fraction * walk[-1]
+        close = self.base_price * np.exp(log_close)
+        open_ = np.empty_like(close)
+        open_[0] = self.base_price * math.exp(start)
+        open_[1:] = close[:-1]
+        wick = np.abs(rng.normal(0.0, self.minute_vol * 0.5, (2, MINUTES_PER_CHUNK)))
+        activity = rng.lognormal(0.0, 0.5, MINUTES_PER_CHUNK) * (1 + 50 * np.abs(close / open_ - 1))
+        volume = self.base_volume_usdt * activity / close
+        return {
+            'open': open_,
+            'high': np.maximum(open_, close) * (1 + wick[0]),
+            'low': np.minimum(open_, close) * (1 - wick[1]),
+            'close': close,
+            'volume': volume,
+            'trades': np.maximum(1, (activity * 40).astype(np.int64)),
+            'taker_share': rng.uniform(0.35, 0.65, MINUTES_PER_CHUNK)
+        }
+
+
+class FakeBinanceClient:
+    """Offline exchange implementing the binance.client.Client methods used by web_bot"""
+
+    API_URL = 'fake://exchange/api'
+    APIException = FakeAPIException
+
+    def __init__(self, symbols: Union[int, Iterable[str]] = 20, seed: int = 0,
+                 balances: Optional[Dict[str, float]] = None, latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, weight_per_minute: int = 6000, error_rate: float = 0.0,
+                 fee_rate: float = 0.001, slippage: float = 0.0005,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        names = default_symbols(symbols) if isinstance(symbols, int) else list(symbols)
+        self.seed = seed
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.weight_per_minute = weight_per_minute
+        self.error_rate = error_rate
+        self.fee_rate = fee_rate
+        self.slippage = slippage
+        self.clock = clock
+        self.sleep = sleep
+        self._paths = {name: _SymbolPath(name, seed) for name in names}
+        self._balances = {asset: 0.0 for asset in [n[:-4] for n in names] + ['USDT']}
+        self._balances.update(balances if balances is not None else {'USDT': 10000.0})
+        self._chunks: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self._rng = np.random.default_rng([seed, 3])
+        self._weight_minute = None
+        self._weight_used = 0
+        self._order_id = 0
+        self.calls: Dict[str, int] = {}
+        self.rate_limited = 0
+        self.injected_errors = 0
+        self.orders: List[dict] = []
+
+    # ----- request accounting -----
+
+    def _request(self, endpoint: str, weight: int) -> None:
+        """Simulate latency, charge request weight and raise like the REST API would"""
+        delay = self.latency_ms
+        if self.jitter_ms:
+            with self._lock:
+                delay += self._rng.uniform(0, self.jitter_ms)
+        if delay > 0:
+            self.sleep(delay / 1000.0)
+        with self._lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+            minute = int(self.clock() // 60)
+            if minute != self._weight_minute:
+                self._weight_minute, self._weight_used = minute, 0
+            if self._weight_used + weight > self.weight_per_minute:
+                self.rate_limited += 1
+                raise FakeAPIException(
+                    -1003, f"Too much request weight used; current limit is {self.weight_per_minute} "
+                           f"request weight per 1 MINUTE. Please use WebSocket Streams for live updates "
+                           f"to avoid polling the API.", 429)
+            self._weight_used += weight
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.injected_errors += 1
+                raise FakeAPIException(-1001, "Internal error; unable to process your request. "
+                                              "Please try again.", 500)
+
+    def used_weight(self) -> int:
+        """Weight charged in the current minute (X-MBX-USED-WEIGHT-1M)"""
+        with self._lock:
+            return self._weight_used if self._weight_minute == int(self.clock() // 60) else 0
+
+    # ----- price path -----
+
+    def _path(self, symbol: str) -> _SymbolPath:
+        path = self._paths.get(symbol)
+        if path is None:
+            raise FakeAPIException(-1121, "Invalid symbol.")
+        return path
+
+    def _day(self, symbol: str, day: int) -> Dict[str, np.ndarray]:
+        key = (symbol, day)
+        with self._lock:
+            chunk = self._chunks.get(key)
+            if chunk is not None:
+                self._chunks.move_to_end(key)
+                return chunk
+            chunk = self._path(symbol).day(day)
+            self._chunks[key] = chunk
+            if len(self._chunks) > CHUNK_CACHE_SIZE:
+                self._chunks.popitem(last=False)
+            return chunk
+
+    def _minutes(self, symbol: str, first: int, last: int) -> Dict[str, np.ndarray]:
+        """Minute candles for epoch minutes first..last inclusive"""
+        days = [self._day(symbol, day) for day in range(first // MINUTES_PER_CHUNK, last // MINUTES_PER_CHUNK + 1)]
+        lo = first % MINUTES_PER_CHUNK
+        hi = lo + (last - first) + 1
+        return {k: np.concatenate([d[k] for d in days])[lo:hi] for k in days[0]}
+
+    def _now_minute(self) -> int:
+        return int(self.clock() // 60)
+
+    def price(self, symbol: str) -> float:
+        """Current simulated price (no request weight)"""
+        minute = self._now_minute()
+        return float(self._minutes(symbol, minute, minute)['close'][0])
+
+    # ----- REST API subset -----
+
+    def ping(self) -> dict:
+        self._request('ping', 1)
+        return {}
+
+    def get_server_time(self) -> dict:
+        self._request('get_server_time', ENDPOINT_WEIGHTS['get_server_time'])
+        return {'serverTime': int(self.clock() * 1000)}
+
+    def get_klines(self, symbol: str, interval: str, limit: int = 500, endTime: Optional[int] = None, **kwargs) -> list:
+        self._request('get_klines', kline_weight(limit))
+        step = INTERVAL_SECONDS.get(interval)
+        if step is None:
+            raise FakeAPIException(-1120, "Invalid interval.")
+        limit = max(1, min(int(limit), 1000))
+        now = self.clock() if endTime is None else min(self.clock(), endTime / 1000.0)
+        last_minute = int(now // 60)
+        current_start = int(now // step) * step
+        first_start = current_start - (limit - 1) * step
+        ratio = step // 60
+        m = self._minutes(symbol, first_start // 60, last_minute)
+
+        offsets = np.arange(0, len(m['close']), ratio)
+        ends = np.r_[offsets[1:], len(m['close'])] - 1
+        high = np.maximum.reduceat(m['high'], offsets)
+        low = np.minimum.reduceat(m['low'], offsets)
+        volume = np.add.reduceat(m['volume'], offsets)
+        quote = np.add.reduceat(m['volume'] * m['close'], offsets)
+        trades = np.add.reduceat(m['trades'], offsets)
+        taker = np.add.reduceat(m['volume'] * m['taker_share'], offsets)
+        taker_quote = np.add.reduceat(m['volume'] * m['taker_share'] * m['close'], offsets)
+        rows = []
+        for i, start in enumerate(offsets):
+            open_ms = (first_start + i * step) * 1000
+            rows.append([open_ms, _fmt(m['open'][start]), _fmt(high[i]), _fmt(low[i]), _fmt(m['close'][ends[i]]),
+                         _fmt(volume[i]), open_ms + step * 1000 - 1, _fmt(quote[i]), int(trades[i]),
+                         _fmt(taker[i]), _fmt(taker_quote[i]), '0'])
+        return rows
+
+    def _ticker(self, symbol: str) -> dict:
+        now_ms = int(self.clock() * 1000)
+        last = self._now_minute()
+        m = self._minutes(symbol, last - MINUTES_PER_CHUNK + 1, last)
+        open_price, last_price = float(m['open'][0]), float(m['close'][-1])
+        volume = float(m['volume'].sum())
+        quote_volume = float((m['volume'] * m['close']).sum())
+        spread = last_price * 0.0001
+        return {
+            'symbol': symbol,
+            'priceChange': _fmt(last_price - open_price),
+            'priceChangePercent': f"{(last_price / open_price - 1) * 100:.3f}",
+            'weightedAvgPrice': _fmt(quote_volume / volume if volume else last_price),
+            'prevClosePrice': _fmt(open_price),
+            'lastPrice': _fmt(last_price),
+            'lastQty': _fmt(float(m['volume'][-1]) / max(1, int(m['trades'][-1]))),
+            'bidPrice': _fmt(last_price - spread),
+            'askPrice': _fmt(last_price + spread),
+            'openPrice': _fmt(open_price),
+            'highPrice': _fmt(float(m['high'].max())),
+            'lowPrice': _fmt(float(m['low'].min())),
+            'volume': _fmt(volume),
+            'quoteVolume': _fmt(quote_volume),
+            'openTime': now_ms - 86_400_000,
+            'closeTime': now_ms,
+            'count': int(m['trades'].sum())
+        }
+
+    def get_ticker(self, symbol: Optional[str] = None, **kwargs):
+        self._request('get_ticker', ENDPOINT_WEIGHTS['get_ticker'] if symbol else 80)
+        if symbol:
+            return self._ticker(symbol)
+        return [self._ticker(name) for name in self._paths]
+
+    def get_account(self, **kwargs) -> dict:
+        self._request('get_account', ENDPOINT_WEIGHTS['get_account'])
+        with self._lock:
+            balances = [{'asset': asset, 'free': _fmt(free), 'locked': _fmt(0.0)}
+                        for asset, free in self._balances.items()]
+        return {
+            'makerCommission': 10, 'takerCommission': 10, 'buyerCommission': 0, 'sellerCommission': 0,
+            'canTrade': True, 'canWithdraw': False, 'canDeposit': False,
+            'updateTime': int(self.clock() * 1000),
+            'accountType': 'SPOT',
+            'balances': balances,
+            'permissions': ['SPOT']
+        }
+
+    def _filters(self, path: _SymbolPath) -> dict:
+        """LOT_SIZE step worth roughly $0.1-$1 and a 5-significant-digit tick, like listed pairs"""
+        magnitude = math.floor(math.log10(path.base_price))
+        return {'step': min(1.0, 10.0 ** -(magnitude + 1)), 'tick': 10.0 ** (magnitude - 4)}
+
+    def get_exchange_info(self) -> dict:
+        self._request('get_exchange_info', ENDPOINT_WEIGHTS['get_exchange_info'])
+        symbols = []
+        for name, path in self._paths.items():
+            f = self._filters(path)
+            symbols.append({
+                'symbol': name,
+                'status': 'TRADING',
+                'baseAsset': name[:-4],
+                'baseAssetPrecision': 8,
+                'quoteAsset': 'USDT',
+                'quotePrecision': 8,
+                'orderTypes': ['LIMIT', 'LIMIT_MAKER', 'MARKET', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT'],
+                'isSpotTradingAllowed': True,
+                'filters': [
+                    {'filterType': 'PRICE_FILTER', 'minPrice': _fmt(f['tick']), 'maxPrice': '1000000.00000000',
+                     'tickSize': _fmt(f['tick'])},
+                    {'filterType': 'LOT_SIZE', 'minQty': _fmt(f['step']), 'maxQty': '9000000.00000000',
+                     'stepSize': _fmt(f['step'])},
+                    {'filterType': 'NOTIONAL', 'minNotional': '5.00000000', 'applyMinToMarket': True,
+                     'maxNotional': '9000000.00000000', 'applyMaxToMarket': False, 'avgPriceMins': 5}
+                ],
+                'permissions': ['SPOT']
+            })
+        return {
+            'timezone': 'UTC',
+            'serverTime': int(self.clock() * 1000),
+            'rateLimits': [{'rateLimitType': 'REQUEST_WEIGHT', 'interval': 'MINUTE', 'intervalNum': 1,
+                            'limit': self.weight_per_minute}],
+            'symbols': symbols
+        }
+
+    def _market_order(self, side: str, symbol: str, quantity=None, quoteOrderQty=None) -> dict:
+        self._request('order', ENDPOINT_WEIGHTS['order'])
+        path = self._path(symbol)
+        step = self._filters(path)['step']
+        price = self.price(symbol) * (1 + self.slippage if side == 'BUY' else 1 - self.slippage)
+        if quantity is None:
+            if quoteOrderQty is None:
+                raise FakeAPIException(-1102, "Mandatory parameter 'quantity' was not sent, was empty/null, or malformed.")
+            quantity = math.floor(float(quoteOrderQty) / price / step) * step
+        qty = float(quantity)
+        if qty < step or abs(qty / step - round(qty / step)) > 1e-6:
+            raise FakeAPIException(-1013, "Filter failure: LOT_SIZE")
+        value = qty * price
+        if value < 5.0:
+            raise FakeAPIException(-1013, "Filter failure: NOTIONAL")
+
+        base = symbol[:-4]
+        with self._lock:
+            if side == 'BUY':
+                if self._balances.get('USDT', 0.0) + 1e-9 < value:
+                    raise FakeAPIException(-2010, "Account has insufficient balance for requested action.")
+                commission, commission_asset = qty * self.fee_rate, base
+                self._balances['USDT'] -= value
+                self._balances[base] = self._balances.get(base, 0.0) + qty - commission
+            else:
+                if self._balances.get(base, 0.0) + 1e-9 < qty:
+                    raise FakeAPIException(-2010, "Account has insufficient balance for requested action.")
+                commission, commission_asset = value * self.fee_rate, 'USDT'
+                self._balances[base] -= qty
+                self._balances['USDT'] = self._balances.get('USDT', 0.0) + value - commission
+            self._order_id += 1
+            order = {
+                'symbol': symbol,
+                'orderId': self._order_id,
+                'orderListId': -1,
+                'clientOrderId': f"fake{self._order_id:08d}",
+                'transactTime': int(self.clock() * 1000),
+                'price': _fmt(0.0),
+                'origQty': _fmt(qty),
+                'executedQty': _fmt(qty),
+                'cummulativeQuoteQty': _fmt(value),
+                'status': 'FILLED',
+                'timeInForce': 'GTC',
+                'type': 'MARKET',
+                'side': side,
+                'fills': [{'price': _fmt(price), 'qty': _fmt(qty), 'commission': _fmt(commission),
+                           'commissionAsset': commission_asset, 'tradeId': self._order_id}]
+            }
+            self.orders.append(order)
+        return order
+
+    def order_market_buy(self, symbol: str, quantity=None, quoteOrderQty=None, **kwargs) -> dict:
+        return self._market_order('BUY', symbol, quantity, quoteOrderQty)
+
+    def order_market_sell(self, symbol: str, quantity=None, quoteOrderQty=None, **kwargs) -> dict:
+        return self._market_order('SELL', symbol, quantity, quoteOrderQty)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'symbols': len(self._paths),
+                'calls': dict(self.calls),
+                'requests': sum(self.calls.values()),
+                'used_weight': self._weight_used if self._weight_minute == int(self.clock() // 60) else 0,
+                'weight_per_minute': self.weight_per_minute,
+                'rate_limited': self.rate_limited,
+                'injected_errors': self.injected_errors,
+                'orders': len(self.orders),
+                'cached_days': len(self._chunks)
+            }
@@ -0,0 +1,31 @@
+"""
+Kline Decoder for CRYPTIX Trading Bot
+Turns Binance kline rows ([open time, "open", "high", "low", "close",
+"volume", close time, ...]) into the OHLCV DataFrame the bot works on. Only
+the open time and the five price/volume fields are parsed, straight into one
+preallocated float64 block (each column contiguous) and an int64 time index,
+instead of building a 12-column object frame and converting it column by column.
+"""
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from candle_resampler import OHLCV_COLUMNS
+
+
+def decode_klines(rows: Sequence[Sequence]) -> pd.DataFrame:
+    """OHLCV frame indexed by candle open time (datetime64[ms]); unparseable values become NaN"""
+    n = len(rows)
+    block = np.empty((len(OHLCV_COLUMNS), n), dtype=np.float64)
+    for i in range(len(OHLCV_COLUMNS)):
+        values = [row[i + 1] for row in rows]
+        try:
+            block[i] = values  # NumPy parses the decimal strings in C
+        except (TypeError, ValueError):
+            block[i] = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+    open_ms = np.fromiter((row[0] for row in rows), dtype=np.int64, count=n)
+    index = pd.DatetimeIndex(open_ms.view('datetime64[ms]'), name='timestamp')
+    # block.T keeps the (columns x rows) layout pandas stores internally, so no copy is made
+    return pd.DataFrame(block.T, index=index, columns=OHLCV_COLUMNS, copy=False)
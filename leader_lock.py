@@ -0,0 +1,68 @@
+"""
+Trading Engine Leader Lock for CRYPTIX Trading Bot
+An exclusive, non-blocking file lock that stops a second process (an extra
+server worker, or another copy of the bot on the same logs/ directory) from
+trading alongside the first. The OS releases the lock when the holding
+process exits, so a crashed leader never leaves a stale lock behind.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, every process is its own leader
+    fcntl = None
+
+
+class LeaderLock:
+    """Process-wide leadership claim backed by flock() on a lock file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        """Try to become the leader; returns True if this process holds the lock"""
+        with self._lock:
+            if self._fd is not None:
+                return True
+            if fcntl is None:
+                self._fd = -1
+                return True
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                return False
+            os.ftruncate(fd, 0)
+            os.write(fd, str(os.getpid()).encode())
+            self._fd = fd
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            if self._fd is None:
+                return
+            if self._fd >= 0:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+                os.close(self._fd)
+            self._fd = None
+
+    def holder_pid(self) -> Optional[int]:
+        """PID recorded by the current (or last) leader"""
+        if self.is_leader:
+            return os.getpid()
+        try:
+            return int(self.path.read_text().strip() or 0) or None
+        except (OSError, ValueError):
+            return None
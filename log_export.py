@@ -0,0 +1,139 @@
+"""
+Streaming Log Export for CRYPTIX Trading Bot
+Builds ZIP archives of the CSV logs chunk by chunk while the client reads,
+so memory use stays flat regardless of log size. Rows can be filtered by
+date range and files can optionally be exported as gzip-compressed Parquet.
+"""
+
+import csv
+import io
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import pandas as pd
+
+CHUNK_SIZE = 64 * 1024
+PARQUET_BATCH_ROWS = 50000
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable write target; the generator drains it after each write"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(entries: Iterable[Tuple[str, Iterable[bytes], bool]]) -> Iterator[bytes]:
+    """Yield a ZIP archive for (name, chunk iterator, compress) entries"""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', allowZip64=True) as zf:
+        for name, chunks, compress in entries:
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            with zf.open(info, 'w', force_zip64=True) as dest:
+                for chunk in chunks:
+                    dest.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            data = sink.drain()
+            if data:
+                yield data
+    yield sink.drain()
+
+
+def _in_range(value: str, start: Optional[str], end: Optional[str]) -> bool:
+    """Compare the YYYY-MM-DD prefix of a timestamp against an inclusive date range"""
+    day = (value or '')[:10]
+    return (start is None or day >= start) and (end is None or day <= end)
+
+
+def iter_csv_chunks(path, time_column: str, start: Optional[str] = None,
+                    end: Optional[str] = None) -> Iterator[bytes]:
+    """CSV file contents in chunks, keeping the header and rows within [start, end]"""
+    path = Path(path)
+    if start is None and end is None:
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        writer.writerow(header)
+        time_index = header.index(time_column) if time_column in header else None
+        for row in reader:
+            if time_index is not None and (time_index >= len(row) or not _in_range(row[time_index], start, end)):
+                continue
+            writer.writerow(row)
+            if buffer.tell() >= CHUNK_SIZE:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401 - optional dependency
+        import pyarrow.parquet  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def iter_parquet_chunks(path, time_column: str, numeric_columns: Sequence[str] = (),
+                        start: Optional[str] = None, end: Optional[str] = None) -> Iterator[bytes]:
+    """gzip-compressed Parquet for a CSV log, converted in fixed-size row batches"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _ChunkSink()
+    writer = None
+    try:
+        for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=PARQUET_BATCH_ROWS):
+            if (start or end) and time_column in chunk.columns:
+                days = chunk[time_column].str.slice(0, 10)
+                mask = pd.Series(True, index=chunk.index)
+                if start:
+                    mask &= days >= start
+                if end:
+                    mask &= days <= end
+                chunk = chunk[mask]
+            for col in numeric_columns:
+                if col in chunk.columns:
+                    chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema, compression='gzip')
+            writer.write_table(table.cast(writer.schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        if writer is not None:
+            writer.close()
+    yield sink.drain()
@@ -0,0 +1,310 @@
+"""
+Indexed CSV Journals for CRYPTIX Trading Bot
+Each CSV log gets a binary sidecar index (<name>.idx) of fixed-width
+(time key, byte offset, length) records kept sorted by time. Appends update
+the index incrementally; reads binary-search the index and seek straight to
+the requested rows, so a page costs the same however large the log grows.
+Legacy logs written newest-first are rewritten oldest-first once, when first
+indexed, so the raw CSV (and exports of it) stay in time order.
+"""
+
+import csv
+import io
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+MAGIC = b'CRXIDX01'
+HEADER = struct.Struct('<8sQQI')   # magic, covered bytes, file inode, crc of bytes before covered end
+RECORD = struct.Struct('<dQI')     # time key (epoch seconds), byte offset, row length
+_CRC_SPAN = 64
+
+
+def parse_time_key(value: str) -> Optional[float]:
+    """Parse 'YYYY-MM-DD[ T]HH:MM:SS[...]' or 'YYYY-MM-DD' into a sortable epoch key.
+    Wall-clock time is treated as UTC; only ordering matters for the index.
+    """
+    value = (value or '').strip()
+    if len(value) < 10:
+        return None
+    try:
+        if len(value) >= 19:
+            dt = datetime.strptime(value[:19].replace('T', ' '), '%Y-%m-%d %H:%M:%S')
+        else:
+            dt = datetime.strptime(value[:10], '%Y-%m-%d')
+    except ValueError:
+        return None
+    return (dt - datetime(1970, 1, 1)).total_seconds()
+
+
+def _encode_row(row: Sequence[Any]) -> bytes:
+    buf = io.StringIO()
+    csv.writer(buf).writerow(row)
+    return buf.getvalue().encode('utf-8')
+
+
+def _parse_row(data: bytes) -> List[str]:
+    return next(csv.reader([data.decode('utf-8', errors='replace')]), [])
+
+
+class LogJournal:
+    """Append-only CSV log with an on-disk time index and cursor pagination"""
+
+    def __init__(self, path, time_column: str, numeric_columns: Iterable[str] = ()):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(self.path.suffix + '.idx')
+        self.time_column = time_column
+        self.numeric_columns = frozenset(numeric_columns)
+        self._lock = threading.RLock()
+        self._stat_key: Optional[Tuple[int, int, int]] = None
+        self._header: List[str] = []
+        self._count = 0
+        self._last_key = float('-inf')
+
+    # ----- index maintenance -----
+
+    def _tail_crc(self, f, end: int) -> int:
+        start = max(0, end - _CRC_SPAN)
+        f.seek(start)
+        return zlib.crc32(f.read(end - start))
+
+    def _read_header_row(self, f) -> Tuple[List[str], int]:
+        f.seek(0)
+        line = f.readline()
+        if not line.endswith(b'\n'):
+            return [], 0
+        return _parse_row(line), len(line)
+
+    def _row_key(self, fields: Sequence[str], fallback: float) -> float:
+        try:
+            key = parse_time_key(fields[self._header.index(self.time_column)])
+        except (ValueError, IndexError):
+            key = None
+        return fallback if key is None else key
+
+    def _scan(self, f, start: int, end: int) -> Tuple[List[Tuple[float, int, int]], int]:
+        """Index complete rows in [start, end); returns records and the covered end"""
+        records = []
+        f.seek(start)
+        offset = start
+        pending = b''
+        pending_start = start
+        last_key = self._last_key if self._last_key != float('-inf') else 0.0
+        while offset < end:
+            line = f.readline()
+            if not line:
+                break
+            offset += len(line)
+            if not pending:
+                pending_start = offset - len(line)
+            pending += line
+            # A quoted field may contain newlines: the row is complete once quotes balance
+            if not line.endswith(b'\n') or pending.count(b'"') % 2:
+                continue
+            if pending.strip():
+                last_key = self._row_key(_parse_row(pending), last_key)
+                records.append((last_key, pending_start, len(pending)))
+            pending = b''
+        covered = pending_start if pending else offset
+        return records, min(covered, end)
+
+    def _write_index(self, records: List[Tuple[float, int, int]], covered: int, inode: int, crc: int) -> None:
+        records.sort(key=lambda r: (r[0], r[1]))
+        tmp = self.index_path.with_suffix('.idx.tmp')
+        with open(tmp, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, covered, inode, crc))
+            out.write(b''.join(RECORD.pack(*r) for r in records))
+        tmp.replace(self.index_path)
+        self._count = len(records)
+        self._last_key = records[-1][0] if records else float('-inf')
+
+    def _load_index_header(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            with open(self.index_path, 'rb') as idx:
+                raw = idx.read(HEADER.size)
+                size = os.fstat(idx.fileno()).st_size
+                if len(raw) != HEADER.size or (size - HEADER.size) % RECORD.size:
+                    return None
+                magic, covered, inode, crc = HEADER.unpack(raw)
+                if magic != MAGIC:
+                    return None
+                self._count = (size - HEADER.size) // RECORD.size
+                if self._count:
+                    idx.seek(size - RECORD.size)
+                    self._last_key = RECORD.unpack(idx.read(RECORD.size))[0]
+                else:
+                    self._last_key = float('-inf')
+                return covered, inode, crc
+        except OSError:
+            return None
+
+    def _sync_locked(self) -> None:
+        """Bring the index up to date with the CSV (cheap when nothing changed)"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._stat_key, self._header, self._count = None, [], 0
+            return
+        stat_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if stat_key == self._stat_key:
+            return
+        with open(self.path, 'rb') as f:
+            self._header, header_len = self._read_header_row(f)
+            state = self._load_index_header()
+            valid = (state is not None and state[1] == st.st_ino and header_len <= state[0] <= st.st_size
+                     and self._tail_crc(f, state[0]) == state[2])
+            if valid and self._stat_key is None and not self._rows_in_order():
+                valid = False  # Indexed before rows were kept in time order: rescan and rewrite once
+            if not valid:
+                self._last_key = float('-inf')
+                records, covered = self._scan(f, header_len, st.st_size)
+                if any(a[0] > b[0] for a, b in zip(records, records[1:])):
+                    self._rewrite_in_order(f, header_len, records, covered, st.st_size)
+                    self._sync_locked()  # Index the rewritten file
+                    return
+                self._write_index(records, covered, st.st_ino, self._tail_crc(f, covered))
+            elif state[0] < st.st_size:
+                records, covered = self._scan(f, state[0], st.st_size)
+                self._add_records(records, covered, st.st_ino, self._tail_crc(f, covered))
+        self._stat_key = stat_key
+
+    def _rows_in_order(self, batch_size: int = 65536) -> bool:
+        """True if index order (time) matches file order (offset)"""
+        last_offset = -1
+        for lo in range(0, self._count, batch_size):
+            for _, offset, _ in self._read_records(lo, min(lo + batch_size, self._count)):
+                if offset < last_offset:
+                    return False
+                last_offset = offset
+        return True
+
+    def _rewrite_in_order(self, f, header_len: int, records: List[Tuple[float, int, int]],
+                          covered: int, size: int) -> None:
+        """Replace the CSV with its rows sorted by time (stable), keeping any partial last row at the end"""
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp, 'wb') as out:
+            f.seek(0)
+            out.write(f.read(header_len))
+            for _, offset, length in sorted(records, key=lambda r: (r[0], r[1])):
+                f.seek(offset)
+                out.write(f.read(length))
+            f.seek(covered)
+            out.write(f.read(size - covered))
+        tmp.replace(self.path)
+
+    def _add_records(self, records: List[Tuple[float, int, int]], covered: int, inode: int, crc: int) -> None:
+        if records and records[0][0] < self._last_key or any(
+                a[0] > b[0] for a, b in zip(records, records[1:])):
+            # Out-of-order timestamps: merge and rewrite (rare)
+            self._write_index(self._read_records(0, self._count) + records, covered, inode, crc)
+            return
+        with open(self.index_path, 'r+b') as idx:
+            idx.seek(0, os.SEEK_END)
+            idx.write(b''.join(RECORD.pack(*r) for r in records))
+            idx.seek(0)
+            idx.write(HEADER.pack(MAGIC, covered, inode, crc))
+        self._count += len(records)
+        if records:
+            self._last_key = records[-1][0]
+
+    def _read_records(self, lo: int, hi: int) -> List[Tuple[float, int, int]]:
+        if hi <= lo:
+            return []
+        with open(self.index_path, 'rb') as idx:
+            idx.seek(HEADER.size + lo * RECORD.size)
+            data = idx.read((hi - lo) * RECORD.size)
+        return [RECORD.unpack_from(data, i * RECORD.size) for i in range(len(data) // RECORD.size)]
+
+    def _bisect(self, key: float, right: bool = False) -> int:
+        """Binary search the on-disk keys with O(log n) seeks"""
+        lo, hi = 0, self._count
+        with open(self.index_path, 'rb') as idx:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                idx.seek(HEADER.size + mid * RECORD.size)
+                mid_key = struct.unpack('<d', idx.read(8))[0]
+                if mid_key < key or (right and mid_key == key):
+                    lo = mid + 1
+                else:
+                    hi = mid
+        return lo
+
+    # ----- public API -----
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Append one row to the CSV and its index entry"""
+        data = _encode_row(row)
+        with self._lock:
+            self._sync_locked()
+            with open(self.path, 'ab') as f:
+                offset = f.tell()
+                f.write(data)
+            if self._stat_key is None:
+                return  # File was just created without a header; indexed on next read
+            with open(self.path, 'rb') as f:
+                crc = self._tail_crc(f, offset + len(data))
+            key = self._row_key([str(v) for v in row], self._last_key if self._count else 0.0)
+            self._add_records([(key, offset, len(data))], offset + len(data), self._stat_key[0], crc)
+            st = os.stat(self.path)
+            self._stat_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def count(self) -> int:
+        with self._lock:
+            self._sync_locked()
+            return self._count
+
+    def _to_dict(self, fields: List[str]) -> Dict[str, Any]:
+        row = dict(zip(self._header, fields))
+        for col in self.numeric_columns:
+            if col in row:
+                try:
+                    row[col] = float(row[col])
+                except (TypeError, ValueError):
+                    row[col] = 0.0
+        return row
+
+    def page(self, limit: int = 100, cursor: Optional[str] = None,
+             since: Optional[datetime] = None, until: Optional[datetime] = None) -> Dict[str, Any]:
+        """Newest-first page of rows. Pass the returned next_cursor to get older rows."""
+        limit = max(1, int(limit))
+        with self._lock:
+            self._sync_locked()
+            if not self._count:
+                return {'rows': [], 'next_cursor': None, 'total': 0}
+            hi = self._count
+            if cursor not in (None, ''):
+                hi = max(0, min(int(cursor), hi))
+            if until is not None:
+                hi = min(hi, self._bisect(parse_time_key(until.strftime('%Y-%m-%d %H:%M:%S')), right=True))
+            floor = 0 if since is None else self._bisect(parse_time_key(since.strftime('%Y-%m-%d %H:%M:%S')))
+            lo = max(floor, hi - limit)
+            records = self._read_records(lo, hi)
+            rows = []
+            with open(self.path, 'rb') as f:
+                for _, offset, length in reversed(records):
+                    f.seek(offset)
+                    rows.append(self._to_dict(_parse_row(f.read(length))))
+            return {
+                'rows': rows,
+                'next_cursor': str(lo) if lo > floor else None,
+                'total': self._count
+            }
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """All rows oldest first, read in index order one batch at a time"""
+        with self._lock:
+            self._sync_locked()
+            count = self._count
+        for lo in range(0, count, batch_size):
+            with self._lock:
+                records = self._read_records(lo, min(lo + batch_size, count))
+                with open(self.path, 'rb') as f:
+                    rows = []
+                    for _, offset, length in records:
+                        f.seek(offset)
+                        rows.append(self._to_dict(_parse_row(f.read(length))))
+            yield from rows
@@ -0,0 +1,191 @@
+"""
+Metrics for CRYPTIX Trading Bot
+Low-overhead latency histograms and counters for the trading hot path,
+rendered in the Prometheus text exposition format for /metrics.
+"""
+
+import bisect
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Seconds; spans CSV appends (sub-ms) to slow exchange calls and full cycles
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Optional[Dict[str, str]]) -> Labels:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set"""
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, list] = {}  # labels -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        key = _labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def snapshot(self) -> Dict[Labels, Dict[str, float]]:
+        """{labels: {'count', 'sum'}} for quick summaries"""
+        with self._lock:
+            return {k: {'count': sum(v[:-1]), 'sum': v[-1]} for k, v in self._series.items()}
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = {k: list(v) for k, v in self._series.items()}
+        for labels, values in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), values[:-1]):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(labels, [('le', _format_value(bound))])} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(labels)} {values[-1]!r}"
+            yield f"{self.name}_count{_format_labels(labels)} {cumulative}"
+
+
+class Counter:
+    """Monotonic counter per label set"""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, labels: Optional[Dict[str, str]] = None) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Point-in-time value per label set (callback gauges are read at render time)"""
+
+    def __init__(self, name: str, help_text: str, callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, help_text)
+        self.callback = callback
+
+    def set(self, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        with self._lock:
+            self._values[_labels(labels)] = value
+
+    def render(self) -> Iterable[str]:
+        if self.callback is not None:
+            try:
+                self.set(self.callback())
+            except Exception:
+                pass
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} gauge"
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """Named metrics plus stage timing helpers for the trading cycle"""
+
+    def __init__(self, prefix: str = 'cryptix'):
+        self.prefix = prefix
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self.stage_seconds = self.histogram('stage_duration_seconds', 'Time spent in each trading-cycle stage')
+        self.stage_errors = self.counter('stage_errors_total', 'Exceptions raised out of each stage')
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def histogram(self, name: str, help_text: str, buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(f"{self.prefix}_{name}", help_text, buckets))
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter(f"{self.prefix}_{name}", help_text))
+
+    def gauge(self, name: str, help_text: str, callback: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge(f"{self.prefix}_{name}", help_text, callback))
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self.stage_seconds.observe(seconds, {'stage': stage})
+
+    def timed(self, stage: str):
+        """Decorator recording the wrapped call's duration (and exceptions) under stage"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                except BaseException:
+                    self.stage_errors.inc(labels={'stage': stage})
+                    raise
+                finally:
+                    self.stage_seconds.observe(time.perf_counter() - started, {'stage': stage})
+            return wrapper
+        return decorator
+
+    def stage_summary(self) -> Dict[str, Dict[str, float]]:
+        """{stage: {'count', 'total_seconds', 'avg_ms'}} for /health"""
+        summary = {}
+        for labels, data in self.stage_seconds.snapshot().items():
+            stage = dict(labels).get('stage', '')
+            summary[stage] = {
+                'count': data['count'],
+                'total_seconds': round(data['sum'], 4),
+                'avg_ms': round(data['sum'] / data['count'] * 1000, 3) if data['count'] else 0.0
+            }
+        return summary
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
@@ -1,18 +1,10 @@
+import importlib.util
+
 import numpy as np
 import pandas as pd
 
-# Minimal import guard to avoid crashing if sklearn is missing
-try:
-    from sklearn.ensemble import RandomForestClassifier
-    from sklearn.model_selection import train_test_split
-    from sklearn.preprocessing import StandardScaler
-    import joblib
-    SKLEARN_AVAILABLE = True
-except Exception:
-    SKLEARN_AVAILABLE = False
-    RandomForestClassifier = None
-    StandardScaler = None
-    joblib = None
+# sklearn/joblib are slow to import; check availability now and import on first use
+SKLEARN_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('sklearn', 'joblib'))
 
 class PriceTrendPredictor:
     def __init__(self, model_path=None):
@@ -20,14 +12,16 @@ class PriceTrendPredictor:
         self.scaler = None
         self.model_path = model_path or 'rf_price_trend_model.pkl'
         self.scaler_path = 'rf_scaler.pkl'
-        self._load_model()
+        self._loaded = False
 
     def _load_model(self):
+        self._loaded = True
         if not SKLEARN_AVAILABLE:
             self.model = None
             self.scaler = None
             return
         try:
+            import joblib
             self.model = joblib.load(self.model_path)
             self.scaler = joblib.load(self.scaler_path)
         except Exception:
@@ -37,6 +31,11 @@ class PriceTrendPredictor:
     def train(self, df, feature_cols, target_col):
         if not SKLEARN_AVAILABLE:
             return 0.0
+        import joblib
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        self._loaded = True
         X = df[feature_cols].values
         y = df[target_col].values
         self.scaler = StandardScaler()
@@ -49,6 +48,8 @@ class PriceTrendPredictor:
         return self.model.score(X_test, y_test)
 
     def predict(self, df, feature_cols):
+        if not self._loaded:
+            self._load_model()
         if not SKLEARN_AVAILABLE or self.model is None or self.scaler is None:
             return None
         X = df[feature_cols].values
@@ -56,6 +57,8 @@ class PriceTrendPredictor:
         return self.model.predict(X_scaled)
 
     def predict_proba(self, df, feature_cols):
+        if not self._loaded:
+            self._load_model()
         if not SKLEARN_AVAILABLE or self.model is None or self.scaler is None:
             return None
         X = df[feature_cols].values
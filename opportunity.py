@@ -0,0 +1,53 @@
+"""
+Scan Opportunity Records for CRYPTIX Trading Bot
+Compact per-symbol scan result holding only score inputs and the latest
+indicator values, plus a handle into the candle store for the full series.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+from candle_store import CandleHandle
+
+
+@dataclass(slots=True)
+class ScanOpportunity:
+    symbol: str
+    score: float
+    price: float
+    volume_usdt: float
+    price_change_pct: float
+    rsi: float
+    macd_trend: str
+    sma_fast: float
+    sma_slow: float
+    has_balance: bool = False
+    available_balance: float = 0.0
+    balance_msg: str = ""
+    signals: List[str] = field(default_factory=list)
+    candles: Optional[CandleHandle] = None
+
+    # Mapping-style access so callers written for the old dict records keep working
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    @property
+    def balance_info(self) -> Dict[str, Any]:
+        return {
+            'has_balance': self.has_balance,
+            'available_balance': self.available_balance,
+            'balance_msg': self.balance_msg
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation (without the candle handle)"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'candles'}
@@ -0,0 +1,172 @@
+"""
+Performance Tracker for CRYPTIX Trading Bot
+Running per-day counters and a realized-P&L equity curve updated as each
+trade is logged, so drawdown, profit factor and streak stats are O(1) reads.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, Optional
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _new_day() -> Dict[str, float]:
+    return {
+        'total_trades': 0,
+        'successful_trades': 0,
+        'failed_trades': 0,
+        'wins': 0,
+        'losses': 0,
+        'gross_profit': 0.0,
+        'gross_loss': 0.0,
+        'daily_pnl': 0.0,
+        'total_volume': 0.0,
+        'peak_equity': 0.0,
+        'max_drawdown': 0.0
+    }
+
+
+class PerformanceTracker:
+    """Incremental trade statistics.
+
+    record_trade() is O(1). The equity curve is cumulative realized P&L; drawdown
+    is measured from its running peak, overall and within each day.
+    """
+
+    def __init__(self, equity_points: int = 1000):
+        self._lock = threading.Lock()
+        self.days: Dict[str, Dict[str, float]] = {}
+        self.reported_days = set()
+        self.equity = 0.0
+        self.peak_equity = 0.0
+        self.max_drawdown = 0.0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.total_trades = 0
+        self.successful_trades = 0
+        self.wins = 0
+        self.losses = 0
+        self.consecutive_wins = 0
+        self.consecutive_losses = 0
+        self.max_consecutive_losses = 0
+        self.equity_curve = deque(maxlen=equity_points)  # (cairo_time, equity)
+
+    def record_trade(self, cairo_time: str, status: str, value: Any = 0, profit_loss: Any = 0) -> None:
+        """Update counters for one logged trade (cairo_time 'YYYY-MM-DD HH:MM:SS ...')"""
+        day_str = str(cairo_time)[:10]
+        pnl = _to_float(profit_loss)
+        with self._lock:
+            day = self.days.get(day_str)
+            if day is None:
+                day = self.days[day_str] = _new_day()
+                day['peak_equity'] = self.equity
+
+            self.total_trades += 1
+            day['total_trades'] += 1
+            if status == 'success':
+                self.successful_trades += 1
+                day['successful_trades'] += 1
+            else:
+                day['failed_trades'] += 1
+            day['total_volume'] += _to_float(value)
+
+            if pnl == 0:
+                return  # Opening trades and failures do not move realized equity
+
+            if pnl > 0:
+                self.wins += 1
+                day['wins'] += 1
+                self.gross_profit += pnl
+                day['gross_profit'] += pnl
+                self.consecutive_wins += 1
+                self.consecutive_losses = 0
+            else:
+                self.losses += 1
+                day['losses'] += 1
+                self.gross_loss += -pnl
+                day['gross_loss'] += -pnl
+                self.consecutive_losses += 1
+                self.consecutive_wins = 0
+                self.max_consecutive_losses = max(self.max_consecutive_losses, self.consecutive_losses)
+
+            day['daily_pnl'] += pnl
+            self.equity += pnl
+            self.peak_equity = max(self.peak_equity, self.equity)
+            self.max_drawdown = max(self.max_drawdown, self.peak_equity - self.equity)
+            day['peak_equity'] = max(day['peak_equity'], self.equity)
+            day['max_drawdown'] = max(day['max_drawdown'], day['peak_equity'] - self.equity)
+            self.equity_curve.append((str(cairo_time), self.equity))
+
+    def bootstrap(self, trades: Iterable[Dict[str, Any]], performance_days: Iterable[str] = ()) -> None:
+        """Replay historical trade rows (oldest first) once at startup"""
+        for row in trades:
+            self.record_trade(row.get('cairo_time', ''), row.get('status', ''),
+                              row.get('value', 0), row.get('profit_loss', 0))
+        with self._lock:
+            self.reported_days.update(str(d)[:10] for d in performance_days)
+
+    @staticmethod
+    def _profit_factor(gross_profit: float, gross_loss: float) -> Optional[float]:
+        """Gross profit / gross loss; None until there is at least one loss"""
+        return gross_profit / gross_loss if gross_loss > 0 else None
+
+    def day_summary(self, day_str: str) -> Dict[str, Any]:
+        """Performance row for one Cairo date (matches daily_performance.csv columns)"""
+        with self._lock:
+            day = dict(self.days.get(day_str) or _new_day())
+        total = day['total_trades']
+        return {
+            'date': day_str,
+            'total_trades': total,
+            'successful_trades': day['successful_trades'],
+            'failed_trades': day['failed_trades'],
+            'win_rate': (day['successful_trades'] / total * 100.0) if total else 0.0,
+            'total_revenue': day['daily_pnl'],
+            'daily_pnl': day['daily_pnl'],
+            'total_volume': day['total_volume'],
+            'max_drawdown': day['max_drawdown'],
+            'profit_factor': self._profit_factor(day['gross_profit'], day['gross_loss'])
+        }
+
+    def is_reported(self, day_str: str) -> bool:
+        """True if day_str already has a performance row"""
+        with self._lock:
+            return day_str in self.reported_days
+
+    def mark_reported(self, day_str: str) -> bool:
+        """Record that day_str has a performance row; False if it already had one"""
+        with self._lock:
+            if day_str in self.reported_days:
+                return False
+            self.reported_days.add(day_str)
+            return True
+
+    def snapshot(self, curve_points: int = 200) -> Dict[str, Any]:
+        """Overall running statistics"""
+        with self._lock:
+            closed = self.wins + self.losses
+            return {
+                'total_trades': self.total_trades,
+                'successful_trades': self.successful_trades,
+                'closed_trades': closed,
+                'wins': self.wins,
+                'losses': self.losses,
+                'win_rate': (self.wins / closed * 100.0) if closed else 0.0,
+                'realized_pnl': self.equity,
+                'gross_profit': self.gross_profit,
+                'gross_loss': self.gross_loss,
+                'profit_factor': self._profit_factor(self.gross_profit, self.gross_loss),
+                'peak_equity': self.peak_equity,
+                'current_drawdown': self.peak_equity - self.equity,
+                'max_drawdown': self.max_drawdown,
+                'consecutive_wins': self.consecutive_wins,
+                'consecutive_losses': self.consecutive_losses,
+                'max_consecutive_losses': self.max_consecutive_losses,
+                'equity_curve': list(self.equity_curve)[-curve_points:]
+            }
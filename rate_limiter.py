@@ -0,0 +1,77 @@
+"""
+Rate Limiting Utilities for CRYPTIX Trading Bot
+Thread-safe sliding-window limiter on the monotonic clock.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class SlidingWindowRateLimiter:
+    """Allow at most max_events per window_seconds.
+
+    Event times are kept in a deque in arrival order, so expiring old events is
+    a popleft from the front instead of rebuilding a list. All methods are safe
+    to call from multiple threads.
+    """
+
+    def __init__(self, max_events: int, window_seconds: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_events = max(1, int(max_events))
+        self.window_seconds = float(window_seconds)
+        self._clock = clock
+        self._events = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        events = self._events
+        while events and events[0] <= cutoff:
+            events.popleft()
+
+    def _wait_locked(self, now: float) -> float:
+        self._expire(now)
+        if len(self._events) < self.max_events:
+            return 0.0
+        return max(0.0, self._events[0] + self.window_seconds - now)
+
+    def time_until_next_slot(self) -> float:
+        """Seconds until an event would be allowed (0.0 if allowed now)"""
+        with self._lock:
+            return self._wait_locked(self._clock())
+
+    def try_acquire(self) -> bool:
+        """Record an event if a slot is free; never blocks"""
+        with self._lock:
+            now = self._clock()
+            if self._wait_locked(now) > 0:
+                return False
+            self._events.append(now)
+            return True
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is free (sleeping exactly until it opens) and record the event.
+        Returns False if timeout elapses first.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait_s = self._wait_locked(now)
+                if wait_s <= 0:
+                    self._events.append(now)
+                    return True
+            if deadline is not None:
+                remaining = deadline - now
+                if remaining <= 0:
+                    return False
+                wait_s = min(wait_s, remaining)
+            time.sleep(wait_s)
+
+    def count(self) -> int:
+        """Events recorded within the current window"""
+        with self._lock:
+            self._expire(self._clock())
+            return len(self._events)
@@ -0,0 +1,190 @@
+"""
+Market Regime Engine for CRYPTIX Trading Bot
+Classifies every monitored pair in one vectorized pass (volatility, volume
+surge, returns) and derives market-breadth metrics from the result. The
+outcome is cached until the next candle close, so repeated regime checks
+inside one candle cost nothing. Input candles are kept per pair: the anchor's
+are refreshed after every close, the breadth pairs' every breadth_refresh
+seconds, so a regime check does not cost one kline request per pair.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+REGIMES = ('QUIET', 'NORMAL', 'VOLATILE', 'EXTREME')  # Ordered by severity
+
+HOURS_1H = 48       # 1h candles per pair
+CANDLES_5M = 288    # 5m candles per pair (24 hours)
+VOL_WINDOW_1H = 24
+VOL_WINDOW_5M = 144
+
+
+def classify(hourly_vol: np.ndarray, five_min_vol: np.ndarray, volume_surge: np.ndarray,
+             price_change_1h: np.ndarray) -> np.ndarray:
+    """Per-pair regime using the single-pair thresholds the bot has always used"""
+    extreme = (hourly_vol > 1.5) | (five_min_vol > 2.0) | (volume_surge > 3.0) | (price_change_1h > 0.05)
+    volatile = (hourly_vol > 0.8) | (five_min_vol > 1.2) | (volume_surge > 2.0) | (price_change_1h > 0.03)
+    quiet = (hourly_vol < 0.3) & (five_min_vol < 0.5) & (volume_surge < 1.2) & (price_change_1h < 0.01)
+    return np.select([extreme, volatile, quiet], ['EXTREME', 'VOLATILE', 'QUIET'], default='NORMAL')
+
+
+def pair_metrics(close_1h: np.ndarray, volume_1h: np.ndarray, close_5m: np.ndarray) -> Dict[str, np.ndarray]:
+    """Regime inputs for a (pairs x candles) block of aligned series"""
+    returns_1h = close_1h[:, 1:] / close_1h[:, :-1] - 1.0
+    returns_5m = close_5m[:, 1:] / close_5m[:, :-1] - 1.0
+    hourly_vol = np.std(returns_1h[:, -VOL_WINDOW_1H:], axis=1, ddof=1) * np.sqrt(24 * 365)
+    five_min_vol = np.std(returns_5m[:, -VOL_WINDOW_5M:], axis=1, ddof=1) * np.sqrt(288 * 365)
+    avg_volume = volume_1h[:, -VOL_WINDOW_1H:].mean(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        volume_surge = np.where(avg_volume > 0, volume_1h[:, -1] / avg_volume, 1.0)
+    return {
+        'hourly_vol': np.nan_to_num(hourly_vol, nan=0.5),
+        'five_min_vol': np.nan_to_num(five_min_vol, nan=0.5),
+        'volume_surge': np.nan_to_num(volume_surge, nan=1.0),
+        'return_1h': np.nan_to_num(returns_1h[:, -1]),
+        'return_24h': np.nan_to_num(close_1h[:, -1] / close_1h[:, -VOL_WINDOW_1H] - 1.0)
+    }
+
+
+def _more_severe(a: str, b: str) -> str:
+    return a if REGIMES.index(a) >= REGIMES.index(b) else b
+
+
+class RegimeEngine:
+    """Watchlist-wide regime with breadth metrics, cached per candle"""
+
+    def __init__(self, anchor: str = 'BTCUSDT', candle_seconds: int = 300, breadth_extreme: float = 0.3,
+                 breadth_volatile: float = 0.4, breadth_quiet: float = 0.6,
+                 breadth_refresh: float = 3600, clock: Callable[[], float] = time.time):
+        self.anchor = anchor
+        self.breadth_refresh = breadth_refresh
+        self.candle_seconds = candle_seconds
+        self.breadth_extreme = breadth_extreme
+        self.breadth_volatile = breadth_volatile
+        self.breadth_quiet = breadth_quiet
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._result: Optional[Dict[str, Any]] = None
+        self._frames: Dict[str, Tuple[float, pd.DataFrame, pd.DataFrame]] = {}  # symbol -> (stored_at, 1h, 5m)
+        self.evaluations = 0
+        self.cache_hits = 0
+
+    def seconds_since_close(self) -> float:
+        return self.clock() % self.candle_seconds
+
+    def cached(self) -> Optional[Dict[str, Any]]:
+        """Last result if no candle has closed since it was computed"""
+        with self._lock:
+            if self._result is not None and self.clock() < self._result['valid_until']:
+                self.cache_hits += 1
+                return self._result
+        return None
+
+    def frames_max_age(self, symbol: str) -> float:
+        """How old symbol's input candles may be: the current candle for the anchor, breadth_refresh otherwise"""
+        return self.seconds_since_close() if symbol == self.anchor else self.breadth_refresh
+
+    def stored_frames(self, symbol: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """(1h, 5m) frames kept for symbol, or None if missing or older than frames_max_age"""
+        with self._lock:
+            entry = self._frames.get(symbol)
+        if entry is None or self.clock() - entry[0] > self.frames_max_age(symbol):
+            return None
+        return entry[1], entry[2]
+
+    def store_frames(self, symbol: str, frame_1h: pd.DataFrame, frame_5m: pd.DataFrame) -> None:
+        with self._lock:
+            self._frames[symbol] = (self.clock(), frame_1h, frame_5m)
+
+    def due_symbols(self, symbols) -> List[str]:
+        """Symbols whose input candles need fetching"""
+        return [symbol for symbol in symbols if self.stored_frames(symbol) is None]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._result = None
+
+    def _breadth_regime(self, extreme_share: float, volatile_share: float, quiet_share: float) -> str:
+        if extreme_share >= self.breadth_extreme:
+            return 'EXTREME'
+        if volatile_share >= self.breadth_volatile:
+            return 'VOLATILE'
+        if quiet_share >= self.breadth_quiet:
+            return 'QUIET'
+        return 'NORMAL'
+
+    def evaluate(self, frames: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]) -> Optional[Dict[str, Any]]:
+        """Classify pairs from {symbol: (1h frame, 5m frame)} and cache until the next candle close.
+        Returns None if no pair has enough candles."""
+        symbols = [s for s, (h1, m5) in frames.items()
+                   if h1 is not None and m5 is not None
+                   and len(h1) >= VOL_WINDOW_1H + 1 and len(m5) >= VOL_WINDOW_5M + 1]
+        if not symbols:
+            return None
+        n_1h = min(len(frames[s][0]) for s in symbols)
+        n_5m = min(len(frames[s][1]) for s in symbols)
+        close_1h = np.vstack([frames[s][0]['close'].to_numpy(dtype=np.float64)[-n_1h:] for s in symbols])
+        volume_1h = np.vstack([frames[s][0]['volume'].to_numpy(dtype=np.float64)[-n_1h:] for s in symbols])
+        close_5m = np.vstack([frames[s][1]['close'].to_numpy(dtype=np.float64)[-n_5m:] for s in symbols])
+
+        metrics = pair_metrics(close_1h, volume_1h, close_5m)
+        regimes = classify(metrics['hourly_vol'], metrics['five_min_vol'], metrics['volume_surge'],
+                           np.abs(metrics['return_1h']))
+
+        count = len(symbols)
+        extreme_share = float(np.count_nonzero(regimes == 'EXTREME')) / count
+        volatile_share = float(np.count_nonzero((regimes == 'EXTREME') | (regimes == 'VOLATILE'))) / count
+        quiet_share = float(np.count_nonzero(regimes == 'QUIET')) / count
+        breadth_regime = self._breadth_regime(extreme_share, volatile_share, quiet_share)
+
+        pairs = {
+            symbol: {
+                'regime': str(regimes[i]),
+                'hourly_vol': float(metrics['hourly_vol'][i]),
+                'five_min_vol': float(metrics['five_min_vol'][i]),
+                'volume_surge': float(metrics['volume_surge'][i]),
+                'price_change_1h': float(abs(metrics['return_1h'][i])),
+                'price_change_24h': float(abs(metrics['return_24h'][i])),
+                'return_24h': float(metrics['return_24h'][i])
+            }
+            for i, symbol in enumerate(symbols)
+        }
+        anchor_regime = pairs[self.anchor]['regime'] if self.anchor in pairs else breadth_regime
+        now = self.clock()
+        result = {
+            'regime': _more_severe(anchor_regime, breadth_regime),
+            'anchor': self.anchor,
+            'anchor_regime': anchor_regime,
+            'breadth_regime': breadth_regime,
+            'breadth': {
+                'pairs': count,
+                'extreme_share': extreme_share,
+                'volatile_share': volatile_share,
+                'quiet_share': quiet_share,
+                'advancing_share': float(np.count_nonzero(metrics['return_24h'] > 0)) / count,
+                'median_hourly_vol': float(np.median(metrics['hourly_vol'])),
+                'median_volume_surge': float(np.median(metrics['volume_surge']))
+            },
+            'pairs': pairs,
+            'computed_at': now,
+            'valid_until': now - now % self.candle_seconds + self.candle_seconds
+        }
+        with self._lock:
+            self._result = result
+            self.evaluations += 1
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            result = self._result
+            return {
+                'evaluations': self.evaluations,
+                'cache_hits': self.cache_hits,
+                'stored_pairs': len(self._frames),
+                'regime': result['regime'] if result else None,
+                'valid_until': result['valid_until'] if result else None
+            }
@@ -0,0 +1,156 @@
+"""
+Replay for CRYPTIX Trading Bot
+Runs the real trading_loop on a VirtualClock against an offline exchange, so
+hours of trading take seconds and a run with the same inputs makes the same
+decisions. Logs go to a separate working directory; the summary reports
+cycles, per-cycle decision latency (real time), signals and trades.
+
+    python replay.py --start 2026-10-01T00:00 --hours 24
+    python replay.py --start 2026-10-01T00:00 --hours 6 --speed 500 --symbols 200 --latency-ms 80
+    python replay.py --tape logs/tapes/api-20261001-000000-4242.tape --hours 6
+    python replay.py --start 2026-10-01T00:00 --hours 6 --engine asyncio --symbols 300 --universe top_volume
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import clock
+
+
+def parse_start(text: str) -> float:
+    """ISO date/time (UTC unless an offset is given) -> epoch seconds"""
+    start = datetime.fromisoformat(text)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start.timestamp()
+
+
+def _csv_rows(path: Path) -> int:
+    if not path.exists():
+        return 0
+    with open(path, newline='', encoding='utf-8') as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+
+def run_replay(start: float, hours: float, speed=None, exchange=None, exchange_options=None,
+               workdir=None, quiet: bool = True, engine: str = 'threaded', engine_options=None) -> dict:
+    """Drive web_bot.trading_loop from start for `hours` of virtual time and return a summary.
+
+    exchange: a ready client (e.g. a tape-backed exchange); by default a
+    FakeBinanceClient on the virtual clock built from config.EXCHANGE['fake']
+    plus exchange_options.
+    engine: 'threaded' (trading_loop) or 'asyncio' (async_engine, with
+    engine_options overriding config.ENGINE).
+    """
+    workdir = Path(workdir or tempfile.mkdtemp(prefix='cryptix_replay_')).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+    os.chdir(workdir)  # logs/ and the engine lock are relative to the working directory
+
+    virtual = clock.VirtualClock(start, speed=speed, until=start + hours * 3600)
+    previous = clock.set_clock(virtual)
+    output = open(os.devnull, 'w') if quiet else sys.stdout
+    try:
+        with contextlib.redirect_stdout(output):
+            import web_bot
+        virtual.on_expire = lambda: web_bot.bot_status.__setitem__('running', False)
+        web_bot.TELEGRAM_AVAILABLE = False
+        if exchange is None:
+            exchange = web_bot.create_fake_client(clock=clock.time, sleep=clock.sleep, **(exchange_options or {}))
+        # A tape's Coinbase payloads drive sentiment on virtual time; otherwise it reads neutral
+        web_bot.sentiment_service.refresh_on_read = hasattr(exchange, 'coinbase')
+
+        real_started = time.perf_counter()
+        with contextlib.redirect_stdout(output):
+            if not web_bot.initialize_client(exchange):
+                raise RuntimeError("Replay exchange failed to initialize")
+            if engine == 'asyncio':
+                from async_engine import get_settings
+                settings = {**get_settings(), **(engine_options or {})}
+                web_bot.run_async_engine(sentiment=False, notifications=False, settings=settings)
+            else:
+                web_bot.trading_loop()
+        real_seconds = time.perf_counter() - real_started
+    finally:
+        clock.set_clock(previous)
+        if quiet:
+            output.close()
+
+    virtual_seconds = virtual.time() - start
+    cycles = web_bot.metrics.stage_summary().get('trading_cycle', {})
+    summary = web_bot.bot_status.get('trading_summary', {})
+    log_dir = workdir / 'logs'
+    return {
+        'start': datetime.fromtimestamp(start, timezone.utc).isoformat(),
+        'virtual_hours': round(virtual_seconds / 3600, 3),
+        'real_seconds': round(real_seconds, 3),
+        'speedup': round(virtual_seconds / real_seconds, 1) if real_seconds > 0 else None,
+        'cycles': cycles.get('count', 0),
+        'cycle_latency_ms': cycles.get('avg_ms', 0.0),
+        'stages': web_bot.metrics.stage_summary(),
+        'signals_logged': _csv_rows(log_dir / 'signal_history.csv'),
+        'trades': summary.get('successful_trades', 0) + summary.get('failed_trades', 0),
+        'successful_trades': summary.get('successful_trades', 0),
+        'engine': engine,
+        'exchange': exchange.get_stats() if hasattr(exchange, 'get_stats') else {},
+        'clock': virtual.get_stats(),
+        'workdir': str(workdir)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay the CRYPTIX trading loop on virtual time")
+    parser.add_argument('--start', help="Virtual start time, ISO format (UTC if no offset); default: start of --tape")
+    parser.add_argument('--tape', help="Replay recorded API responses (api_tape.py) instead of the fake exchange")
+    parser.add_argument('--hours', type=float, default=24.0, help="Virtual hours to replay")
+    parser.add_argument('--speed', type=float, default=0,
+                        help="Virtual seconds per real second (e.g. 100-1000); 0 = as fast as possible, deterministic")
+    parser.add_argument('--symbols', type=int, help="Simulated pairs (default from config.EXCHANGE)")
+    parser.add_argument('--seed', type=int, help="Price path seed")
+    parser.add_argument('--latency-ms', type=float, help="Simulated request latency (virtual time)")
+    parser.add_argument('--engine', choices=('threaded', 'asyncio'), default='threaded', help="Trading engine to replay")
+    parser.add_argument('--universe', choices=('default', 'top_volume'), help="Pairs the asyncio engine scans")
+    parser.add_argument('--max-symbols', type=int, help="Pairs per scan with --universe top_volume")
+    parser.add_argument('--workdir', help="Directory for the replay's logs (default: new temp dir)")
+    parser.add_argument('--verbose', action='store_true', help="Show the bot's console output")
+    parser.add_argument('--output', help="Write the JSON summary here")
+    args = parser.parse_args(argv)
+
+    exchange = None
+    if args.tape:
+        from api_tape import TapeExchange
+        exchange = TapeExchange(args.tape)
+        if exchange.first_time is None:
+            parser.error(f"{args.tape} has no records")
+    if not args.start and exchange is None:
+        parser.error("--start is required without --tape")
+    start = parse_start(args.start) if args.start else exchange.first_time
+
+    options = {key: value for key, value in
+               (('symbols', args.symbols), ('seed', args.seed), ('latency_ms', args.latency_ms)) if value is not None}
+    engine_options = {key: value for key, value in
+                      (('universe', args.universe), ('max_symbols', args.max_symbols)) if value is not None}
+    output = Path(args.output).resolve() if args.output else None
+    print(f"⏩ Replaying {args.hours}h from {datetime.fromtimestamp(start, timezone.utc).isoformat()} "
+          f"({'max speed' if not args.speed else f'{args.speed:g}x'}, {args.tape or 'fake exchange'}, {args.engine} engine)")
+    result = run_replay(start, args.hours, speed=args.speed or None, exchange=exchange, exchange_options=options,
+                        workdir=args.workdir, quiet=not args.verbose, engine=args.engine,
+                        engine_options=engine_options)
+    print(f"✅ {result['virtual_hours']}h in {result['real_seconds']}s ({result['speedup']}x): "
+          f"{result['cycles']} cycles, {result['cycle_latency_ms']}ms per cycle, "
+          f"{result['signals_logged']} signals, {result['trades']} trades")
+    print(f"📁 Logs: {result['workdir']}/logs")
+    if output:
+        output.write_text(json.dumps(result, indent=2, default=str))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
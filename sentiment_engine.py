@@ -0,0 +1,291 @@
+"""
+Market Sentiment Engine for CRYPTIX Trading Bot
+Parses Coinbase order book and trade data into NumPy arrays once per fetch,
+computes order book / trade flow sentiment vectorially, and keeps per-product
+sentiment fresh from a background refresh thread.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+import numpy as np
+from typing import Callable, Dict, Any, Iterable, List, Optional
+import config
+
+# Default settings (overridable through config.SENTIMENT)
+DEFAULT_SETTINGS = {
+    'depth_levels': 10,          # Order book levels per side used for imbalance
+    'weights': {
+        'order_book': 0.5,       # Depth-weighted bid/ask imbalance
+        'trade_flow': 0.3,       # Buy vs sell traded volume
+        'vwap_skew': 0.2         # Trade VWAP relative to mid price
+    },
+    'vwap_skew_scale_bps': 10.0, # Skew (in bps) that maps to ~0.76 via tanh
+    'neutral_band': 0.1,         # |score| below this is always neutral
+    'min_confidence': 0.5,       # Confidence needed for bullish/bearish
+    'products': ['BTC-USD', 'ETH-USD'],  # Products refreshed in the background
+    'refresh_interval_seconds': 30,      # Background refresh schedule
+    'max_age_seconds': 180,              # Older results are treated as neutral
+    'max_workers': 4                     # Concurrent product refreshes
+}
+
+_EMPTY_LEVELS = np.empty((0, 2), dtype=np.float64)
+
+
+def get_settings() -> Dict[str, Any]:
+    """Merge config.SENTIMENT over the defaults"""
+    settings = dict(DEFAULT_SETTINGS)
+    user = getattr(config, 'SENTIMENT', {}) or {}
+    settings.update({k: v for k, v in user.items() if k != 'weights'})
+    settings['weights'] = {**DEFAULT_SETTINGS['weights'], **(user.get('weights') or {})}
+    return settings
+
+
+def parse_levels(levels, depth: int) -> np.ndarray:
+    """Convert Coinbase [price, size, num_orders] levels to a (n, 2) float64 array"""
+    if not levels:
+        return _EMPTY_LEVELS
+    try:
+        arr = np.array([lvl[:2] for lvl in levels[:depth]], dtype=np.float64)
+    except (ValueError, TypeError):
+        return _EMPTY_LEVELS
+    return arr.reshape(-1, 2)
+
+
+def parse_trades(trades) -> Dict[str, np.ndarray]:
+    """Convert Coinbase trade dicts to price/size/is_buy arrays"""
+    n = len(trades) if trades else 0
+    prices = np.empty(n, dtype=np.float64)
+    sizes = np.empty(n, dtype=np.float64)
+    is_buy = np.empty(n, dtype=bool)
+    valid = 0
+    for trade in trades or ():
+        try:
+            prices[valid] = float(trade['price'])
+            sizes[valid] = float(trade['size'])
+            is_buy[valid] = trade['side'] == 'buy'
+        except (KeyError, ValueError, TypeError):
+            continue
+        valid += 1
+    return {'price': prices[:valid], 'size': sizes[:valid], 'is_buy': is_buy[:valid]}
+
+
+def parse_market_data(order_book: Dict[str, Any], trades, depth: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Parse a raw Coinbase fetch into the arrays used by compute_sentiment"""
+    depth = depth or get_settings()['depth_levels']
+    parsed = {
+        'bids': parse_levels((order_book or {}).get('bids'), depth),
+        'asks': parse_levels((order_book or {}).get('asks'), depth),
+    }
+    parsed.update({f'trade_{k}': v for k, v in parse_trades(trades).items()})
+    return parsed
+
+
+def _depth_weighted_imbalance(bids: np.ndarray, asks: np.ndarray, mid: float) -> float:
+    """Bid/ask size imbalance with levels weighted by proximity to the mid price"""
+    if not len(bids) or not len(asks) or mid <= 0:
+        return 0.0
+    # Weight decays with distance from mid in basis points
+    bid_w = 1.0 / (1.0 + np.abs(mid - bids[:, 0]) / mid * 1e4)
+    ask_w = 1.0 / (1.0 + np.abs(asks[:, 0] - mid) / mid * 1e4)
+    bid_depth = float(np.dot(bids[:, 1], bid_w))
+    ask_depth = float(np.dot(asks[:, 1], ask_w))
+    total = bid_depth + ask_depth
+    return (bid_depth - ask_depth) / total if total > 0 else 0.0
+
+
+def compute_sentiment(parsed: Dict[str, np.ndarray], settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Compute combined market sentiment from parsed arrays.
+    Returns dict with label, value, confidence and per-component scores.
+    """
+    settings = settings or get_settings()
+    weights = settings['weights']
+    bids, asks = parsed['bids'], parsed['asks']
+
+    mid = 0.0
+    if len(bids) and len(asks):
+        mid = float(bids[0, 0] + asks[0, 0]) / 2.0
+
+    order_book_sentiment = _depth_weighted_imbalance(bids, asks, mid)
+
+    # Trade flow: buy vs sell volume
+    sizes = parsed['trade_size']
+    is_buy = parsed['trade_is_buy']
+    total_trade_volume = float(sizes.sum())
+    trade_flow_sentiment = 0.0
+    vwap_skew = 0.0
+    vwap = None
+    if total_trade_volume > 0:
+        buy_volume = float(sizes[is_buy].sum())
+        trade_flow_sentiment = (2.0 * buy_volume - total_trade_volume) / total_trade_volume
+        vwap = float(np.dot(parsed['trade_price'], sizes) / total_trade_volume)
+        if mid > 0:
+            skew_bps = (vwap - mid) / mid * 1e4
+            vwap_skew = float(np.tanh(skew_bps / settings['vwap_skew_scale_bps']))
+
+    combined = (
+        weights.get('order_book', 0) * order_book_sentiment +
+        weights.get('trade_flow', 0) * trade_flow_sentiment +
+        weights.get('vwap_skew', 0) * vwap_skew
+    )
+    confidence = min(1.0, abs(combined) * 2)
+
+    # Determine sentiment with confidence threshold
+    if abs(combined) < settings['neutral_band']:
+        label = 'neutral'
+    elif combined > 0:
+        label = 'bullish' if confidence > settings['min_confidence'] else 'neutral'
+    else:
+        label = 'bearish' if confidence > settings['min_confidence'] else 'neutral'
+
+    return {
+        'label': label,
+        'value': combined,
+        'confidence': confidence,
+        'components': {
+            'order_book_sentiment': order_book_sentiment,
+            'trade_flow_sentiment': trade_flow_sentiment,
+            'vwap_skew': vwap_skew
+        },
+        'mid_price': mid,
+        'trade_vwap': vwap
+    }
+
+
+NEUTRAL_SENTIMENT = {
+    'label': 'neutral',
+    'value': 0.0,
+    'confidence': 0.0,
+    'components': {'order_book_sentiment': 0.0, 'trade_flow_sentiment': 0.0, 'vwap_skew': 0.0},
+    'mid_price': 0.0,
+    'trade_vwap': None
+}
+
+
+class SentimentService:
+    """Refreshes sentiment for a set of products on its own schedule.
+    Callers read the latest result from memory and never wait on HTTP.
+    """
+
+    def __init__(self, fetch_fn: Callable[[str], Optional[Dict[str, Any]]],
+                 products: Optional[Iterable[str]] = None,
+                 refresh_interval: Optional[float] = None,
+                 max_workers: Optional[int] = None,
+                 clock: Callable[[], float] = time.time):
+        settings = get_settings()
+        self.fetch_fn = fetch_fn
+        self.clock = clock
+        self.products: List[str] = list(products or settings['products'])
+        self.refresh_interval = float(refresh_interval or settings['refresh_interval_seconds'])
+        self.max_workers = int(max_workers or settings['max_workers'])
+        # product -> {'updated_at': epoch seconds, 'data': sentiment dict}
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.last_errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.external = False
+        self.refresh_on_read = False  # Replay: no thread; stale products are refreshed when read
+
+    def is_running(self) -> bool:
+        return self.external or (self._thread is not None and self._thread.is_alive())
+
+    def set_external(self, external: bool) -> None:
+        """Hand refreshing to another scheduler (the asyncio engine calls update());
+        stops the refresh thread, which start() leaves off until this is reset"""
+        if external:
+            self.stop()
+        self.external = external
+
+    def start(self) -> None:
+        """Start the background refresh thread (no-op if already running)"""
+        with self._lock:
+            if self.is_running():
+                return
+            self._stop_event.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sentiment_fetch')
+            self._thread = threading.Thread(target=self._run, daemon=True, name='sentiment_service_thread')
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop refreshing; cached results stay readable"""
+        self._stop_event.set()
+        self._wake_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def track(self, product: str) -> None:
+        """Add a product to the refresh set and refresh soon"""
+        with self._lock:
+            if product in self.products:
+                return
+            self.products.append(product)
+        self._wake_event.set()
+
+    def get(self, product: str) -> Optional[Dict[str, Any]]:
+        """Latest sentiment entry for product, or None if never refreshed"""
+        return self.results.get(product)
+
+    def get_sentiment(self, product: str, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Latest sentiment dict for product; neutral when missing or stale"""
+        entry = self.results.get(product)
+        if self.refresh_on_read and (not entry or self.clock() - entry['updated_at'] >= self.refresh_interval):
+            self.refresh_product(product)
+            entry = self.results.get(product)
+        max_age = max_age if max_age is not None else get_settings()['max_age_seconds']
+        if not entry or self.clock() - entry['updated_at'] > max_age:
+            return NEUTRAL_SENTIMENT
+        return entry['data']
+
+    def refresh_product(self, product: str) -> None:
+        """Fetch and recompute one product (runs on executor threads)"""
+        try:
+            self.update(product, self.fetch_fn(product))
+        except Exception as e:
+            self.last_errors[product] = str(e)
+
+    def update(self, product: str, cb_data: Optional[Dict[str, Any]]) -> None:
+        """Recompute product's sentiment from freshly fetched Coinbase data"""
+        if not cb_data:
+            self.last_errors[product] = 'no data'
+            return
+        parsed = cb_data.get('parsed')
+        if parsed is None:
+            parsed = parse_market_data(cb_data.get('order_book'), cb_data.get('recent_trades'))
+        self.results[product] = {'updated_at': self.clock(), 'data': compute_sentiment(parsed)}
+        self.last_errors.pop(product, None)
+
+    def refresh_all(self) -> None:
+        """Refresh every tracked product concurrently"""
+        with self._lock:
+            products = list(self.products)
+        executor = self._executor
+        if executor is None:
+            for product in products:
+                self.refresh_product(product)
+            return
+        futures = [executor.submit(self.refresh_product, product) for product in products]
+        wait(futures, timeout=max(self.refresh_interval, 15))
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            self.refresh_all()
+            self._wake_event.wait(self.refresh_interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = self.clock()
+        return {
+            'running': self.is_running(),
+            'external': self.external,
+            'products': list(self.products),
+            'refresh_interval': self.refresh_interval,
+            'age_seconds': {p: round(now - e['updated_at'], 1) for p, e in self.results.items()},
+            'errors': dict(self.last_errors)
+        }
@@ -0,0 +1,68 @@
+"""
+Startup Profiler for CRYPTIX Trading Bot
+Sequential checkpoints timing each import and initialization phase of a cold
+start, so a slow boot can be traced to the step responsible.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    # Interpreter start on Linux, so time spent before our first import is counted too
+    with open('/proc/self/stat') as _stat:
+        _ticks = int(_stat.read().rsplit(')', 1)[1].split()[19])
+    with open('/proc/uptime') as _uptime:
+        _PROCESS_AGE = float(_uptime.read().split()[0]) - _ticks / os.sysconf('SC_CLK_TCK')
+except (OSError, ValueError, IndexError, AttributeError):
+    _PROCESS_AGE = 0.0
+
+
+class StartupProfiler:
+    """Wall-clock phases measured from process start"""
+
+    def __init__(self, process_age: float = 0.0):
+        self._lock = threading.Lock()
+        self.origin = time.perf_counter() - max(0.0, process_age)
+        self._last = time.perf_counter()
+        self.phases: List[Tuple[str, float, float]] = []  # (name, start offset, duration)
+        self.ready_at: Optional[float] = None
+
+    def checkpoint(self, name: str) -> float:
+        """Close a phase that started at the previous checkpoint; returns its duration"""
+        now = time.perf_counter()
+        with self._lock:
+            duration = now - self._last
+            self.phases.append((name, self._last - self.origin, duration))
+            self._last = now
+        return duration
+
+    def record(self, name: str, started: float, duration: float) -> None:
+        """Add a phase timed elsewhere (e.g. a background init thread)"""
+        with self._lock:
+            self.phases.append((name, started - self.origin, duration))
+
+    def mark_ready(self) -> None:
+        """Note when the app starts serving requests"""
+        with self._lock:
+            if self.ready_at is None:
+                self.ready_at = time.perf_counter() - self.origin
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'phases': [{'name': name, 'start_ms': round(start * 1000, 1), 'duration_ms': round(duration * 1000, 1)}
+                           for name, start, duration in self.phases],
+                'ready_ms': round(self.ready_at * 1000, 1) if self.ready_at is not None else None,
+                'uptime_ms': round((time.perf_counter() - self.origin) * 1000, 1)
+            }
+
+    def summary(self) -> str:
+        with self._lock:
+            parts = [f"{name} {duration * 1000:.0f}ms" for name, _, duration in self.phases]
+            elapsed = self._last - self.origin
+        return f"{', '.join(parts)} (t+{elapsed * 1000:.0f}ms)"
+
+
+startup_profiler = StartupProfiler(_PROCESS_AGE)
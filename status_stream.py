@@ -0,0 +1,126 @@
+"""
+Live Status Feed for CRYPTIX Trading Bot
+Fan-out broadcaster that pushes small diffs of public status fields to
+Server-Sent Events subscribers only when the trading loop changes them.
+"""
+
+import json
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Public status fields pushed to live subscribers
+STREAM_FIELDS = (
+    'running', 'last_signal', 'current_symbol', 'last_price', 'market_regime',
+    'hunting_mode', 'signal_interval', 'next_signal_time', 'last_scan_time'
+)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def format_sse(version: int, event: str, data: Any) -> str:
+    """Encode one Server-Sent Events message"""
+    payload = json.dumps(data, default=str, separators=(',', ':'))
+    return f"id: {version}\nevent: {event}\ndata: {payload}\n\n"
+
+
+class StatusBroadcaster:
+    """Publishes events to every subscriber queue.
+
+    Slow subscribers never block the publisher: when a queue is full its oldest
+    event is dropped to make room.
+    """
+
+    def __init__(self, queue_size: int = 100, recent_trades: int = 10, max_subscribers: Optional[int] = None):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.rejected_subscribers = 0
+        self._subscribers: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._last: Dict[str, Any] = {}
+        self.recent_trades = deque(maxlen=recent_trades)
+        self.version = 0
+        self.events_published = 0
+
+    def subscribe(self) -> Optional[queue.Queue]:
+        """New subscriber queue, or None when max_subscribers are already connected"""
+        q = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            if self.max_subscribers is not None and len(self._subscribers) >= self.max_subscribers:
+                self.rejected_subscribers += 1
+                return None
+            self._subscribers.append(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue) -> None:
+        with self._lock:
+            if q in self._subscribers:
+                self._subscribers.remove(q)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: str, data: Any) -> int:
+        """Send an event to all subscribers; returns its version id"""
+        with self._lock:
+            self.version += 1
+            message: Tuple[int, str, Any] = (self.version, event, data)
+            subscribers = list(self._subscribers)
+            self.events_published += 1
+        for q in subscribers:
+            try:
+                q.put_nowait(message)
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                    q.put_nowait(message)
+                except (queue.Empty, queue.Full):
+                    pass
+        return message[0]
+
+    def publish_changes(self, fields: Dict[str, Any]) -> Optional[int]:
+        """Publish only the fields whose value differs from the last push"""
+        diff = {}
+        with self._lock:
+            for key, value in fields.items():
+                value = _jsonable(value)
+                if self._last.get(key, object()) != value:
+                    self._last[key] = value
+                    diff[key] = value
+        if not diff:
+            return None
+        return self.publish('status', diff)
+
+    def publish_trade(self, trade: Dict[str, Any]) -> int:
+        trade = {k: _jsonable(v) for k, v in trade.items()}
+        with self._lock:
+            self.recent_trades.appendleft(trade)
+        return self.publish('trade', trade)
+
+    def initial_state(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Snapshot event for a new subscriber"""
+        with self._lock:
+            trades = list(self.recent_trades)
+        return {
+            'status': {k: _jsonable(v) for k, v in fields.items()},
+            'recent_trades': trades
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'subscribers': self.subscriber_count(),
+            'max_subscribers': self.max_subscribers,
+            'rejected_subscribers': self.rejected_subscribers,
+            'events_published': self.events_published,
+            'version': self.version
+        }
@@ -0,0 +1,310 @@
+"""
+SQLite Storage Backend for CRYPTIX Trading Bot
+Optional store for trades, signals, daily performance and errors. Runs in WAL
+mode so dashboard reads never block the writer, batches inserts on a
+background thread, and indexes rows by time and symbol.
+
+Opened with logs_dir, empty tables are filled from the existing CSV logs.
+Re-import them explicitly with:
+    python storage.py migrate [--db logs/cryptix.db] [--logs logs] [--replace]
+"""
+
+import argparse
+import csv
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from log_index import parse_time_key
+
+# log type -> (table, [(column, sqlite type)]) in CSV column order
+SCHEMA = {
+    'trades': ('trades', [
+        ('timestamp', 'TEXT'), ('cairo_time', 'TEXT'), ('signal', 'TEXT'), ('symbol', 'TEXT'),
+        ('quantity', 'REAL'), ('price', 'REAL'), ('value', 'REAL'), ('fee', 'REAL'), ('status', 'TEXT'),
+        ('order_id', 'TEXT'), ('rsi', 'REAL'), ('macd_trend', 'TEXT'), ('sentiment', 'TEXT'),
+        ('balance_before', 'REAL'), ('balance_after', 'REAL'), ('profit_loss', 'REAL')
+    ]),
+    'signals': ('signals', [
+        ('timestamp', 'TEXT'), ('cairo_time', 'TEXT'), ('signal', 'TEXT'), ('symbol', 'TEXT'),
+        ('price', 'REAL'), ('rsi', 'REAL'), ('macd', 'REAL'), ('macd_trend', 'TEXT'),
+        ('sentiment', 'TEXT'), ('sma5', 'REAL'), ('sma20', 'REAL'), ('reason', 'TEXT')
+    ]),
+    'performance': ('daily_performance', [
+        ('date', 'TEXT'), ('total_trades', 'INTEGER'), ('successful_trades', 'INTEGER'),
+        ('failed_trades', 'INTEGER'), ('win_rate', 'REAL'), ('total_revenue', 'REAL'),
+        ('daily_pnl', 'REAL'), ('total_volume', 'REAL'), ('max_drawdown', 'REAL')
+    ]),
+    'errors': ('errors', [
+        ('timestamp', 'TEXT'), ('cairo_time', 'TEXT'), ('error_type', 'TEXT'), ('error_message', 'TEXT'),
+        ('function_name', 'TEXT'), ('severity', 'TEXT'), ('bot_status', 'TEXT')
+    ])
+}
+
+# Column whose value gives the row's sortable time key
+TIME_COLUMNS = {'trades': 'cairo_time', 'signals': 'cairo_time', 'performance': 'date', 'errors': 'cairo_time'}
+
+_STOP = object()
+
+
+def _coerce(value: Any, sql_type: str) -> Any:
+    if sql_type in ('REAL', 'INTEGER'):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        return int(number) if sql_type == 'INTEGER' else number
+    return None if value is None else str(value)
+
+
+class SQLiteStore:
+    """Batched, WAL-mode SQLite store for the bot's logs"""
+
+    def __init__(self, path='logs/cryptix.db', batch_size: int = 100, flush_interval: float = 1.0,
+                 logs_dir=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._local = threading.local()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self.rows_written = 0
+        self.last_error: Optional[str] = None
+        self.imported: Dict[str, int] = {}
+        self._init_schema()
+        if logs_dir is not None:
+            self.import_empty_tables(logs_dir)
+
+    # ----- connections -----
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Per-thread read connection (WAL readers never block the writer)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _init_schema(self) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                for log_type, (table, columns) in SCHEMA.items():
+                    cols = ', '.join(f'{name} {sql_type}' for name, sql_type in columns)
+                    conn.execute(f'CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, ts REAL, {cols})')
+                    conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_ts ON {table} (ts)')
+                    if any(name == 'symbol' for name, _ in columns):
+                        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_symbol_ts ON {table} (symbol, ts)')
+                conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_performance_date ON daily_performance (date)')
+        finally:
+            conn.close()
+
+    # ----- writes -----
+
+    def _prepare(self, log_type: str, row: Sequence[Any]) -> Tuple[Any, ...]:
+        _, columns = SCHEMA[log_type]
+        values = [_coerce(v, t) for v, (_, t) in zip(row, columns)]
+        values += [None] * (len(columns) - len(values))
+        time_index = [name for name, _ in columns].index(TIME_COLUMNS[log_type])
+        ts = parse_time_key(str(row[time_index])) if time_index < len(row) else None
+        return (ts if ts is not None else 0.0, *values)
+
+    def _insert_sql(self, log_type: str) -> str:
+        table, columns = SCHEMA[log_type]
+        names = ', '.join(name for name, _ in columns)
+        marks = ', '.join('?' * (len(columns) + 1))
+        verb = 'INSERT OR REPLACE' if log_type == 'performance' else 'INSERT'
+        return f'{verb} INTO {table} (ts, {names}) VALUES ({marks})'
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple[str, Sequence[Any]]]) -> None:
+        grouped: Dict[str, List[Tuple[Any, ...]]] = {}
+        for log_type, row in batch:
+            grouped.setdefault(log_type, []).append(self._prepare(log_type, row))
+        with conn:
+            for log_type, rows in grouped.items():
+                conn.executemany(self._insert_sql(log_type), rows)
+        self.rows_written += len(batch)
+
+    def _writer_loop(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                batch, done_events = [], []
+                deadline = time.monotonic() + self.flush_interval
+                while item is not None and item is not _STOP:
+                    if isinstance(item, threading.Event):
+                        done_events.append(item)
+                    else:
+                        batch.append(item)
+                    if len(batch) >= self.batch_size or done_events:
+                        break
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        item = None
+                if batch:
+                    try:
+                        self._write_batch(conn, batch)
+                    except Exception as e:
+                        self.last_error = str(e)
+                        print(f"SQLite batch write failed: {e}")
+                for event in done_events:
+                    event.set()
+                if item is _STOP:
+                    break
+        finally:
+            conn.close()
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop, daemon=True, name='sqlite_writer')
+                self._writer.start()
+
+    def enqueue(self, log_type: str, row: Sequence[Any]) -> None:
+        """Queue one row (CSV column order) for the next batched insert"""
+        self._ensure_writer()
+        self._queue.put((log_type, list(row)))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far is committed"""
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(timeout=5)
+
+    # ----- reads -----
+
+    def count(self, log_type: str) -> int:
+        table, _ = SCHEMA[log_type]
+        return self._reader().execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def page(self, log_type: str, limit: int = 100, cursor: Optional[str] = None,
+             since: Optional[float] = None, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Newest-first keyset page: {'rows', 'next_cursor', 'total'}"""
+        table, columns = SCHEMA[log_type]
+        names = ', '.join(name for name, _ in columns)
+        where, params = [], []
+        if cursor:
+            cursor_ts, cursor_id = cursor.split(':')
+            where.append('(ts < ? OR (ts = ? AND id < ?))')
+            params += [float(cursor_ts), float(cursor_ts), int(cursor_id)]
+        if since is not None:
+            where.append('ts >= ?')
+            params.append(since)
+        if symbol:
+            where.append('symbol = ?')
+            params.append(symbol)
+        sql = f'SELECT id, ts, {names} FROM {table}'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY ts DESC, id DESC LIMIT ?'
+        fetched = self._reader().execute(sql, params + [int(limit) + 1]).fetchall()
+        has_more = len(fetched) > limit
+        fetched = fetched[:limit]
+        rows = [{name: (r[name] if r[name] is not None else (0.0 if sql_type == 'REAL' else ''))
+                 for name, sql_type in columns} for r in fetched]
+        next_cursor = f"{fetched[-1]['ts']!r}:{fetched[-1]['id']}" if has_more and fetched else None
+        return {'rows': rows, 'next_cursor': next_cursor, 'total': self.count(log_type)}
+
+    # ----- migration -----
+
+    def import_csv(self, log_type: str, csv_path, replace: bool = False) -> int:
+        """Import an existing CSV log; skipped if the table already has rows (unless replace)"""
+        csv_path = Path(csv_path)
+        if not csv_path.exists():
+            return 0
+        table, _ = SCHEMA[log_type]
+        conn = self._connect()
+        try:
+            existing = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            if existing and not replace:
+                print(f"⏭️ {table}: {existing} rows already present, skipping (use --replace)")
+                return 0
+            with conn:
+                if replace:
+                    conn.execute(f'DELETE FROM {table}')
+                imported = 0
+                with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    next(reader, None)  # header
+                    batch = []
+                    for row in reader:
+                        if not row:
+                            continue
+                        batch.append(self._prepare(log_type, row))
+                        if len(batch) >= 1000:
+                            conn.executemany(self._insert_sql(log_type), batch)
+                            imported += len(batch)
+                            batch = []
+                    if batch:
+                        conn.executemany(self._insert_sql(log_type), batch)
+                        imported += len(batch)
+            return imported
+        finally:
+            conn.close()
+
+
+    def import_empty_tables(self, logs_dir='logs') -> Dict[str, int]:
+        """Import the CSV log of every table that has no rows yet, so CSV history stays visible"""
+        for log_type, filename in CSV_FILES.items():
+            if self.count(log_type) == 0:
+                imported = self.import_csv(log_type, Path(logs_dir) / filename)
+                if imported:
+                    self.imported[log_type] = imported
+                    print(f"✅ {log_type}: imported {imported} rows from {filename}")
+        return self.imported
+
+
+CSV_FILES = {
+    'trades': 'trade_history.csv',
+    'signals': 'signal_history.csv',
+    'performance': 'daily_performance.csv',
+    'errors': 'error_log.csv'
+}
+
+
+def migrate_csvs(db_path='logs/cryptix.db', logs_dir='logs', replace: bool = False) -> Dict[str, int]:
+    """Import every CSV log under logs_dir into the SQLite store"""
+    store = SQLiteStore(db_path)
+    results = {}
+    for log_type, filename in CSV_FILES.items():
+        results[log_type] = store.import_csv(log_type, Path(logs_dir) / filename, replace=replace)
+        print(f"✅ {log_type}: imported {results[log_type]} rows")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='CRYPTIX SQLite storage tools')
+    sub = parser.add_subparsers(dest='command', required=True)
+    migrate = sub.add_parser('migrate', help='Import existing CSV logs into SQLite')
+    migrate.add_argument('--db', default='logs/cryptix.db')
+    migrate.add_argument('--logs', default='logs')
+    migrate.add_argument('--replace', action='store_true', help='Clear tables before importing')
+    args = parser.parse_args(argv)
+    if args.command == 'migrate':
+        migrate_csvs(args.db, args.logs, args.replace)
+
+
+if __name__ == '__main__':
+    main()
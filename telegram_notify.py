@@ -3,14 +3,24 @@ Telegram Notification Module for CRYPTIX Trading Bot
 Handles all Telegram messaging functionality including signals, trades, and status updates
 """
 
+import asyncio
 import requests
 import json
 import time
+import threading
+import atexit
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import config
 import os
 from functools import wraps
+from metrics import metrics
+from rate_limiter import SlidingWindowRateLimiter
+
+# Telegram rejects messages longer than this
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+BATCH_SEPARATOR = "\n\n➖➖➖➖➖➖\n\n"
 
 class TelegramNotifier:
     def __init__(self):
@@ -28,16 +38,27 @@ class TelegramNotifier:
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
         
         # Rate limiting
-        self.message_timestamps = []
-        self.max_messages_per_minute = config.TELEGRAM.get('rate_limiting', {}).get('max_messages_per_minute', 20)
+        rate_limiting = config.TELEGRAM.get('rate_limiting', {})
+        self.max_messages_per_minute = rate_limiting.get('max_messages_per_minute', 20)
+        self.rate_limiter = SlidingWindowRateLimiter(self.max_messages_per_minute, 60.0)
         
         # Notification settings
         self.notifications = config.TELEGRAM.get('notifications', {})
         self.message_format = config.TELEGRAM.get('message_format', {})
         
-        # Message queuing for batch processing
-        self.message_queue = []
-        self.last_batch_time = datetime.now()
+        # Bounded delivery queue drained by a background worker thread
+        self.batch_notifications = rate_limiting.get('batch_notifications', False)
+        self.batch_window_seconds = rate_limiting.get('batch_window_seconds', 1.0)
+        self.max_retries = rate_limiting.get('max_retries', 3)
+        self.retry_backoff_seconds = rate_limiting.get('retry_backoff_seconds', 2.0)
+        self.message_queue = deque(maxlen=rate_limiting.get('queue_size', 200))
+        self.dropped_messages = 0
+        self.delivered_messages = 0
+        self.batched_messages = 0
+        self._queue_condition = threading.Condition()
+        self._worker_thread = None
+        self._in_flight = 0
+        self.async_delivery = False  # True while an asyncio event loop drains the queue instead
         
         # Error tracking
         self.consecutive_errors = 0
@@ -167,20 +188,38 @@ class TelegramNotifier:
 
     def _rate_limit_check(self) -> bool:
         """Check if we're within rate limits"""
-        now = datetime.now()
-        # Remove timestamps older than 1 minute
-        self.message_timestamps = [ts for ts in self.message_timestamps if now - ts < timedelta(minutes=1)]
-        
-        if len(self.message_timestamps) >= self.max_messages_per_minute:
-            return False
-        return True
+        return self.rate_limiter.time_until_next_slot() <= 0
 
     def _send_message(self, message: str, parse_mode: str = 'HTML') -> bool:
-        """Send message to Telegram with error handling and rate limiting"""
+        """Queue message for delivery by the background worker and return immediately"""
         if not self.enabled or not self.bot_token or not self.chat_id:
             return False
+        if TelegramNotifier._global_connection_tested and not self.connection_working:
+            return False
             
-        # Test connection only once globally when first message is sent
+        with self._queue_condition:
+            if len(self.message_queue) == self.message_queue.maxlen:
+                self.dropped_messages += 1  # Oldest message is evicted by the deque
+            self.message_queue.append({'message': message, 'parse_mode': parse_mode, 'queued_at': time.time()})
+            self._queue_condition.notify()
+        self._ensure_worker()
+        return True
+
+    def _ensure_worker(self) -> None:
+        """Start the delivery worker thread if it is not running"""
+        if self.async_delivery:
+            return
+        if self._worker_thread is not None and self._worker_thread.is_alive():
+            return
+        with self._queue_condition:
+            if self._worker_thread is not None and self._worker_thread.is_alive():
+                return
+            self._worker_thread = threading.Thread(target=self._delivery_loop, daemon=True,
+                                                   name='telegram_delivery_thread')
+            self._worker_thread.start()
+
+    def _check_connection_once(self) -> bool:
+        """Test connection only once globally (runs on the delivery thread)"""
         if not TelegramNotifier._global_connection_tested:
             if self._verbose():
                 print("🔍 Testing Telegram connection (one-time test)...")
@@ -188,61 +227,228 @@ class TelegramNotifier:
             TelegramNotifier._global_connection_tested = True
             self.connection_working = TelegramNotifier._global_connection_working
             self.connection_tested = True
-            if not self.connection_working:
-                if self._verbose():
-                    print("❌ Telegram connection failed - messages will be skipped")
+            if not self.connection_working and self._verbose():
+                print("❌ Telegram connection failed - messages will be skipped")
+        return self.connection_working
+
+    def _next_batch(self) -> Optional[Dict[str, Any]]:
+        """Pop the next message, coalescing queued messages when batching is enabled"""
+        with self._queue_condition:
+            if not self.message_queue:
+                return None
+            first = self.message_queue.popleft()
+            if not self.batch_notifications:
+                return first
+            parts = [first['message']]
+            length = len(first['message'])
+            while self.message_queue:
+                candidate = self.message_queue[0]
+                if candidate['parse_mode'] != first['parse_mode']:
+                    break
+                added = len(BATCH_SEPARATOR) + len(candidate['message'])
+                if length + added > TELEGRAM_MAX_MESSAGE_LENGTH:
+                    break
+                parts.append(self.message_queue.popleft()['message'])
+                length += added
+            if len(parts) > 1:
+                self.batched_messages += len(parts) - 1
+            return {'message': BATCH_SEPARATOR.join(parts), 'parse_mode': first['parse_mode'],
+                    'queued_at': first['queued_at'], 'count': len(parts)}
+
+    def _delivery_loop(self) -> None:
+        """Drain the queue continuously at the allowed rate until an event loop takes it over"""
+        while True:
+            with self._queue_condition:
+                while not self.message_queue and not self.async_delivery:
+                    self._queue_condition.wait()
+                if self.async_delivery:
+                    return
+            # Give closely spaced notifications a moment to arrive so they can be combined
+            if self.batch_notifications and self.batch_window_seconds > 0:
+                time.sleep(self.batch_window_seconds)
+            if not self._check_connection_once():
+                with self._queue_condition:
+                    self.dropped_messages += len(self.message_queue)
+                    self.message_queue.clear()
+                continue
+            # Sleep exactly until the next send slot opens; batching absorbs what queues meanwhile
+            self.rate_limiter.acquire()
+            if self.async_delivery:
+                return  # Leave the queue to the event loop
+            item = self._next_batch()
+            if item is None:
+                continue
+            self._in_flight = 1
+            try:
+                self._deliver_with_retry(item['message'], item['parse_mode'])
+            finally:
+                self._in_flight = 0
+
+    @metrics.timed('telegram')
+    def _deliver_with_retry(self, message: str, parse_mode: str) -> bool:
+        """Deliver one message, retrying transient failures with exponential backoff"""
+        delay = self.retry_backoff_seconds
+        for attempt in range(self.max_retries + 1):
+            ok, retry_after = self._deliver(message, parse_mode)
+            if ok:
+                self.delivered_messages += 1
+                return True
+            if retry_after is None or attempt == self.max_retries:
                 return False
+            time.sleep(max(retry_after, delay))
+            delay = min(delay * 2, 60.0)
+            self.rate_limiter.acquire()  # Retries count against the same quota
+        return False
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued messages are delivered (used on shutdown)"""
+        deadline = time.time() + timeout
+        while (self.message_queue or self._in_flight) and time.time() < deadline:
+            if self._worker_thread is None or not self._worker_thread.is_alive():
+                break
+            time.sleep(0.1)
+        return not self.message_queue
+
+    def _payload(self, message: str, parse_mode: str) -> Dict[str, Any]:
+        return {
+            'chat_id': self.chat_id,
+            'text': message,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': True
+        }
+
+    def _send_failed(self, status_code: int, error_data) -> Optional[float]:
+        """Count a rejected sendMessage call; returns retry_after (None for permanent failures)"""
+        retry_after = None
+        if isinstance(error_data, dict):
+            error_msg = str(error_data.get('description', 'Unknown error'))
+            if status_code == 429:
+                retry_after = float(error_data.get('parameters', {}).get('retry_after', self.retry_backoff_seconds))
             
-        if not self.connection_working:
-            return False
-            
-        if not self._rate_limit_check():
+            # Provide helpful error messages
+            if 'chat not found' in error_msg.lower():
+                if self._verbose():
+                    print(f"❌ Telegram error: Chat not found")
+                    print(f"💡 Solution: Send /start to your bot first")
+                    print(f"   1. Open Telegram and search for your bot")
+                    print(f"   2. Send /start to begin conversation")
+                    print(f"   3. Verify your chat ID: {self.chat_id}")
+            elif 'bot was blocked' in error_msg.lower():
+                if self._verbose():
+                    print(f"❌ Telegram error: Bot was blocked by user")
+                    print(f"💡 Solution: Unblock the bot in Telegram")
+            else:
+                if self._verbose():
+                    print(f"❌ Telegram send failed: {error_msg}")
+        elif self._verbose():
+            print(f"❌ Telegram send failed: HTTP {status_code}")
+        
+        # Server-side errors are worth retrying
+        if retry_after is None and status_code >= 500:
+            retry_after = self.retry_backoff_seconds
+        self.consecutive_errors += 1
+        return retry_after
+
+    def _hand_off_worker(self) -> None:
+        """Stop the delivery thread once its current message is sent, leaving one consumer"""
+        with self._queue_condition:
+            self.async_delivery = True
+            self._queue_condition.notify_all()
+            worker = self._worker_thread
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    async def delivery_loop_async(self, session, running: Callable[[], bool]) -> None:
+        """Drain the queue on an asyncio event loop through an aiohttp session instead of the
+        worker thread, until running() is False and the queue is empty"""
+        try:
+            await asyncio.to_thread(self._hand_off_worker)
+            while running() or self.message_queue:
+                if not self.message_queue:
+                    await asyncio.sleep(0.2)
+                    continue
+                if self.batch_notifications and self.batch_window_seconds > 0:
+                    await asyncio.sleep(self.batch_window_seconds)
+                if not await asyncio.to_thread(self._check_connection_once):
+                    with self._queue_condition:
+                        self.dropped_messages += len(self.message_queue)
+                        self.message_queue.clear()
+                    continue
+                await self._acquire_slot_async()
+                item = self._next_batch()
+                if item is None:
+                    continue
+                self._in_flight = 1
+                try:
+                    await self._deliver_with_retry_async(session, item['message'], item['parse_mode'])
+                finally:
+                    self._in_flight = 0
+        finally:
+            self.async_delivery = False
+            self.process_queued_messages()  # Whatever is left goes back to the worker thread
+
+    async def _acquire_slot_async(self) -> None:
+        while not self.rate_limiter.try_acquire():
+            await asyncio.sleep(max(self.rate_limiter.time_until_next_slot(), 0.05))
+
+    async def _deliver_with_retry_async(self, session, message: str, parse_mode: str) -> bool:
+        started = time.perf_counter()
+        try:
+            return await self._retry_async(session, message, parse_mode)
+        except BaseException:
+            metrics.stage_errors.inc(labels={'stage': 'telegram'})
+            raise
+        finally:
+            metrics.observe_stage('telegram', time.perf_counter() - started)
+
+    async def _retry_async(self, session, message: str, parse_mode: str) -> bool:
+        delay = self.retry_backoff_seconds
+        for attempt in range(self.max_retries + 1):
+            ok, retry_after = await self._deliver_async(session, message, parse_mode)
+            if ok:
+                self.delivered_messages += 1
+                return True
+            if retry_after is None or attempt == self.max_retries:
+                return False
+            await asyncio.sleep(max(retry_after, delay))
+            delay = min(delay * 2, 60.0)
+            await self._acquire_slot_async()  # Retries count against the same quota
+        return False
+
+    async def _deliver_async(self, session, message: str, parse_mode: str = 'HTML'):
+        """_deliver over an aiohttp session"""
+        try:
+            async with session.post(f"{self.base_url}/sendMessage", json=self._payload(message, parse_mode)) as response:
+                if response.status == 200:
+                    self.consecutive_errors = 0
+                    return True, None
+                try:
+                    error_data = await response.json(content_type=None)
+                except ValueError:
+                    error_data = None
+                return False, self._send_failed(response.status, error_data)
+        except Exception as e:
             if self._verbose():
-                print("⚠️ Telegram rate limit exceeded - message queued")
-            self.message_queue.append({'message': message, 'parse_mode': parse_mode})
-            return False
-            
+                print(f"❌ Telegram send error: {e}")
+            self.consecutive_errors += 1
+            self.last_error_time = datetime.now()
+            return False, self.retry_backoff_seconds  # Timeouts and connection errors are retried
+
+    def _deliver(self, message: str, parse_mode: str = 'HTML'):
+        """POST a message to Telegram.
+        Returns (success, retry_after) where retry_after is None for permanent failures.
+        """
         try:
-            payload = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'parse_mode': parse_mode,
-                'disable_web_page_preview': True
-            }
-            
-            response = requests.post(f"{self.base_url}/sendMessage", json=payload, timeout=15)
+            response = requests.post(f"{self.base_url}/sendMessage", json=self._payload(message, parse_mode), timeout=15)
             
             if response.status_code == 200:
-                self.message_timestamps.append(datetime.now())
                 self.consecutive_errors = 0
-                return True
-            else:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get('description', 'Unknown error')
-                    
-                    # Provide helpful error messages
-                    if 'chat not found' in error_msg.lower():
-                        if self._verbose():
-                            print(f"❌ Telegram error: Chat not found")
-                            print(f"💡 Solution: Send /start to your bot first")
-                            print(f"   1. Open Telegram and search for your bot")
-                            print(f"   2. Send /start to begin conversation")
-                            print(f"   3. Verify your chat ID: {self.chat_id}")
-                    elif 'bot was blocked' in error_msg.lower():
-                        if self._verbose():
-                            print(f"❌ Telegram error: Bot was blocked by user")
-                            print(f"💡 Solution: Unblock the bot in Telegram")
-                    else:
-                        if self._verbose():
-                            print(f"❌ Telegram send failed: {error_msg}")
-                        
-                except:
-                    if self._verbose():
-                        print(f"❌ Telegram send failed: HTTP {response.status_code}")
-                    
-                self.consecutive_errors += 1
-                return False
+                return True, None
+            try:
+                error_data = response.json()
+            except ValueError:
+                error_data = None
+            return False, self._send_failed(response.status_code, error_data)
                 
         except requests.exceptions.ConnectTimeout:
             if self._verbose():
@@ -250,20 +456,20 @@ class TelegramNotifier:
                 print("💡 This might work on your deployed server even if it fails locally")
             self.consecutive_errors += 1
             self.last_error_time = datetime.now()
-            return False
+            return False, self.retry_backoff_seconds
         except requests.exceptions.ConnectionError:
             if self._verbose():
                 print("❌ Telegram connection failed - check internet connection")
                 print("💡 If running locally, this might work on your deployed server")
             self.consecutive_errors += 1
             self.last_error_time = datetime.now()
-            return False
+            return False, self.retry_backoff_seconds
         except Exception as e:
             if self._verbose():
                 print(f"❌ Telegram send error: {e}")
             self.consecutive_errors += 1
             self.last_error_time = datetime.now()
-            return False
+            return False, None
 
     def _format_price(self, price: float, symbol: str = "USDT") -> str:
         """Format price with appropriate decimal places"""
@@ -506,14 +712,9 @@ class TelegramNotifier:
         return self._send_message(message.strip())
 
     def process_queued_messages(self) -> None:
-        """Process queued messages when rate limit allows"""
-        if not self.message_queue:
-            return
-            
-        # Process one message per call to avoid flooding
-        if self._rate_limit_check() and self.message_queue:
-            queued_message = self.message_queue.pop(0)
-            self._send_message(queued_message['message'], queued_message['parse_mode'])
+        """Make sure the delivery worker is draining the queue"""
+        if self.message_queue:
+            self._ensure_worker()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get notification statistics"""
@@ -522,7 +723,14 @@ class TelegramNotifier:
             'configured': bool(self.bot_token and self.chat_id),
             'consecutive_errors': self.consecutive_errors,
             'queued_messages': len(self.message_queue),
-            'messages_sent_last_minute': len(self.message_timestamps),
+            'queue_capacity': self.message_queue.maxlen,
+            'dropped_messages': self.dropped_messages,
+            'delivered_messages': self.delivered_messages,
+            'batched_messages': self.batched_messages,
+            'worker_alive': bool(self._worker_thread and self._worker_thread.is_alive()),
+            'async_delivery': self.async_delivery,
+            'messages_sent_last_minute': self.rate_limiter.count(),
+            'next_slot_in_seconds': round(self.rate_limiter.time_until_next_slot(), 2),
             'rate_limit_max': self.max_messages_per_minute,
             'last_error_time': self.last_error_time.isoformat() if self.last_error_time else None,
             'bot_token_preview': f"{self.bot_token[:10]}...{self.bot_token[-10:]}" if self.bot_token else None,
@@ -580,6 +788,9 @@ class TelegramNotifier:
 # Global instance
 telegram_notifier = TelegramNotifier()
 
+# Give pending notifications (e.g. BOT STOPPED) a chance to go out on exit
+atexit.register(telegram_notifier.flush)
+
 # Convenience functions for easy integration
 def notify_signal(signal: str, symbol: str, price: float, indicators: Dict[str, Any], reason: str = "") -> bool:
     """Send trading signal notification"""
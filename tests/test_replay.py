@@ -0,0 +1,20 @@
+"""Replay summary checks against the logs the replay writes"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import replay
+
+
+def test_trade_count_matches_trade_history(tmp_path):
+    cwd = os.getcwd()
+    try:
+        result = replay.run_replay(replay.parse_start('2026-10-01T00:00'), 2, workdir=tmp_path)
+    finally:
+        os.chdir(cwd)
+    logged = replay._csv_rows(tmp_path / 'logs' / 'trade_history.csv')
+    assert logged > 0
+    assert result['trades'] == logged
@@ -0,0 +1,90 @@
+"""
+View Caching for CRYPTIX Trading Bot
+Short-TTL cache for rendered dashboard pages and expensive view models, plus
+ETag-based conditional JSON responses for the API endpoints.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from flask import jsonify, request
+
+import config
+
+
+class TTLCache:
+    """Thread-safe key -> value LRU cache with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_set(self, key: str, ttl: float, compute: Callable[[], Any],
+                   cache_if: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Cached value for key, computing (and storing) it when missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = compute()
+        if ttl > 0 and (cache_if is None or cache_if(value)):
+            with self._lock:
+                self._purge_expired(now)
+                self._entries[key] = (now + ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def _purge_expired(self, now: float) -> None:
+        for key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+
+    def invalidate(self, prefix: str = '') -> None:
+        """Drop entries whose key starts with prefix (everything by default)"""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'entries': len(self._entries), 'max_entries': self.max_entries,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+view_cache = TTLCache(getattr(config, 'DASHBOARD', {}).get('view_cache_entries', 256))
+
+
+def cached_view(ttl_seconds: float):
+    """Cache a route's rendered HTML (per path and query string) for ttl_seconds.
+    Only plain string results are cached; views return errors as (body, status)
+    tuples so they are always fresh.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = f"page:{request.full_path}"
+            return view_cache.get_or_set(key, ttl_seconds, lambda: fn(*args, **kwargs),
+                                         cache_if=lambda value: isinstance(value, str))
+        return wrapper
+    return decorator
+
+
+def conditional_json(payload: Any, max_age: int = 0):
+    """jsonify payload with an ETag; answers 304 when the client's copy is current"""
+    response = jsonify(payload)
+    response.add_etag()
+    response.cache_control.max_age = max_age
+    response.cache_control.no_cache = True  # Revalidate every time; a 304 costs no body
+    return response.make_conditional(request)
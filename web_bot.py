@@ -1,54 +1,96 @@
-from flask import Flask, render_template_string, jsonify, redirect, send_file
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
+from startup_profile import startup_profiler
+from flask import Flask, render_template, jsonify, redirect, request, Response, stream_with_context
 from dotenv import load_dotenv
 import config  # Import trading configuration
-import os, time, threading, subprocess
+import os, time, threading, queue
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from textblob import TextBlob
 import requests  # Added for Coinbase API calls
 import pytz
 import csv
 from pathlib import Path
-import io
-import zipfile
 # from keep_alive import keep_alive  # Disabled to avoid Flask conflicts
 import sys
 import json
+import atexit
+import importlib.util
 from datetime import datetime, timedelta
 
-# Import Telegram notifications
-try:
-    from telegram_notify import (
-        notify_signal, notify_trade, notify_error, notify_bot_status, 
-        notify_daily_summary, notify_market_update, process_queued_notifications,
-        get_telegram_stats, telegram_notifier
-    )
-    TELEGRAM_AVAILABLE = True
-    print("✅ Telegram notifications module loaded successfully")
-except ImportError as e:
-    print(f"⚠️ Telegram notifications not available: {e}")
-    TELEGRAM_AVAILABLE = False
-    # Create dummy functions to prevent errors
-    def notify_signal(*args, **kwargs): return False
-    def notify_trade(*args, **kwargs): return False
-    def notify_error(*args, **kwargs): return False
-    def notify_bot_status(*args, **kwargs): return False
-    def notify_daily_summary(*args, **kwargs): return False
-    def notify_market_update(*args, **kwargs): return False
-    def process_queued_notifications(): pass
-    def get_telegram_stats(): return {}
-    telegram_notifier = None
-
-# Install psutil if not present
-try:
-    import psutil
-except ImportError:
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "psutil"])
-    import psutil
+startup_profiler.checkpoint('third-party imports')
+
+from sentiment_engine import parse_market_data, SentimentService
+from error_tracking import ErrorAggregator, ErrorRingBuffer
+from bot_state import BotState
+from candle_store import CandleStore
+from candle_resampler import INTERVAL_SECONDS, can_derive, interval_seconds, rows_needed
+from kline_decoder import decode_klines
+from regime_engine import RegimeEngine, HOURS_1H, CANDLES_5M
+from opportunity import ScanOpportunity
+from log_index import LogJournal, parse_time_key
+from performance_tracker import PerformanceTracker
+from view_cache import view_cache, cached_view, conditional_json
+from status_stream import StatusBroadcaster, STREAM_FIELDS, format_sse
+from leader_lock import LeaderLock
+from metrics import metrics
+import clock
+from api_tape import TapeWriter, RecordingClient
+from log_export import stream_zip, iter_csv_chunks, iter_parquet_chunks, parquet_available
+
+startup_profiler.checkpoint('local modules')
+
+# Telegram notifications are imported on first use (telegram_notify starts its sender at import)
+TELEGRAM_AVAILABLE = importlib.util.find_spec('telegram_notify') is not None
+_telegram_module = None
+_telegram_import_lock = threading.Lock()
+
+def _load_telegram():
+    """Import telegram_notify once; None if it fails to load"""
+    global _telegram_module, TELEGRAM_AVAILABLE
+    if _telegram_module is None and TELEGRAM_AVAILABLE:
+        with _telegram_import_lock:
+            if _telegram_module is None:
+                try:
+                    import telegram_notify
+                    _telegram_module = telegram_notify
+                    print("✅ Telegram notifications module loaded successfully")
+                except ImportError as e:
+                    print(f"⚠️ Telegram notifications not available: {e}")
+                    TELEGRAM_AVAILABLE = False
+    return _telegram_module
+
+def _telegram_call(name, default=False):
+    def call(*args, **kwargs):
+        module = _load_telegram()
+        return getattr(module, name)(*args, **kwargs) if module is not None else default
+    call.__name__ = name
+    return call
+
+notify_signal = _telegram_call('notify_signal')
+notify_trade = _telegram_call('notify_trade')
+notify_error = _telegram_call('notify_error')
+notify_bot_status = _telegram_call('notify_bot_status')
+notify_daily_summary = _telegram_call('notify_daily_summary')
+notify_market_update = _telegram_call('notify_market_update')
+process_queued_notifications = _telegram_call('process_queued_notifications', None)
+get_telegram_stats = _telegram_call('get_telegram_stats', {})
+
+# python-binance pulls in aiohttp and dateparser (~0.5s); it is imported with the client.
+# Until then nothing can raise a Binance error, so this placeholder never matches.
+Client = None
+
+class BinanceAPIException(Exception):
+    """Placeholder replaced by binance.exceptions.BinanceAPIException in _load_binance()"""
+
+def _load_binance():
+    global Client, BinanceAPIException
+    if Client is None:
+        from binance.client import Client as _Client
+        from binance.exceptions import BinanceAPIException as _BinanceAPIException
+        BinanceAPIException = _BinanceAPIException
+        Client = _Client
+    return Client
 
 # Watchdog and auto-restart functionality has been removed
 
@@ -67,7 +109,7 @@ CAIRO_TZ = pytz.timezone('Africa/Cairo')
 
 def get_cairo_time():
     """Get current time in Cairo, Egypt timezone"""
-    return datetime.now(CAIRO_TZ)
+    return clock.now(CAIRO_TZ)
 
 def format_cairo_time(dt=None):
     """Format datetime to Cairo timezone string"""
@@ -113,8 +155,15 @@ def get_time_remaining_for_next_signal():
         return "Unknown"
 
 # CSV Trade History Logging
+_verified_csv_files = None
+
 def setup_csv_logging():
     """Initialize CSV logging directories and files while preserving existing data"""
+    global _verified_csv_files
+    # Headers are verified once per process; later calls only check the files still exist
+    if _verified_csv_files and all(p.exists() for p in _verified_csv_files.values()):
+        return _verified_csv_files
+
     # Create logs directory if it doesn't exist
     logs_dir = Path('logs')
     logs_dir.mkdir(exist_ok=True)
@@ -194,12 +243,105 @@ def setup_csv_logging():
                 except Exception as be:
                     print(f"Error creating backup of {file_type} log file: {be}")
     
+    _verified_csv_files = csv_files
     return csv_files
 
+# Time column and numeric columns for each indexed CSV journal
+LOG_JOURNAL_SPECS = {
+    'trades': ('cairo_time', ['quantity', 'price', 'value', 'fee', 'rsi', 'balance_before', 'balance_after', 'profit_loss']),
+    'signals': ('cairo_time', ['price', 'rsi', 'macd', 'sma5', 'sma20']),
+    'performance': ('date', ['win_rate', 'total_revenue', 'daily_pnl', 'total_volume', 'max_drawdown']),
+    'errors': ('cairo_time', [])
+}
+_log_journals = {}
+
+def get_log_journal(log_type):
+    """Indexed journal for one of the CSV logs (created on first use)"""
+    journal = _log_journals.get(log_type)
+    if journal is None:
+        csv_files = setup_csv_logging()
+        time_column, numeric_columns = LOG_JOURNAL_SPECS[log_type]
+        journal = _log_journals[log_type] = LogJournal(csv_files[log_type], time_column, numeric_columns)
+    return journal
+
+# Running per-day performance counters (bootstrapped from the trade log at startup)
+performance_tracker = PerformanceTracker()
+
+def bootstrap_performance_tracker():
+    """Replay the trade log once so running stats cover existing history"""
+    try:
+        performance_tracker.bootstrap(
+            get_log_journal('trades').iter_rows(),
+            (row.get('date', '') for row in get_log_journal('performance').iter_rows())
+        )
+    except Exception as e:
+        print(f"⚠️ Performance tracker bootstrap failed: {e}")
+
+# Optional SQLite backend (dual-written alongside the CSV journals)
+_storage_config = getattr(config, 'STORAGE', {})
+sqlite_store = None
+if _storage_config.get('backend', 'csv') == 'sqlite':
+    try:
+        from storage import SQLiteStore
+        sqlite_store = SQLiteStore(
+            _storage_config.get('sqlite_path', 'logs/cryptix.db'),
+            batch_size=_storage_config.get('batch_size', 100),
+            flush_interval=_storage_config.get('flush_interval_seconds', 1.0),
+            logs_dir='logs'  # Empty tables start from the existing CSV logs
+        )
+        print(f"✅ SQLite storage enabled: {sqlite_store.path}")
+    except Exception as e:
+        print(f"⚠️ SQLite storage unavailable, using CSV only: {e}")
+        sqlite_store = None
+
+# Optional API response recording (compressed tapes replayable with api_tape.TapeExchange)
+_recording_config = getattr(config, 'RECORDING', {})
+api_tape = None
+if str(os.getenv('CRYPTIX_RECORD', _recording_config.get('enabled', False))).strip().lower() in {'1', 'true', 'yes', 'on'}:
+    try:
+        api_tape = TapeWriter(
+            Path(_recording_config.get('dir', 'logs/tapes')) / f"api-{clock.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.tape",
+            batch_size=_recording_config.get('batch_size', 500),
+            flush_interval=_recording_config.get('flush_interval_seconds', 1.0),
+            compression_level=_recording_config.get('compression_level', 1),
+            max_pending=_recording_config.get('max_pending', 10000)
+        )
+        atexit.register(api_tape.close)  # Write out queued records on shutdown
+        print(f"📼 Recording API responses to {api_tape.path}")
+    except Exception as e:
+        print(f"⚠️ API recording unavailable: {e}")
+        api_tape = None
+
+def record_api_response(source, endpoint, params, response):
+    """Queue a non-client response (e.g. Coinbase) to the API tape when recording"""
+    if api_tape is not None:
+        api_tape.record(source, endpoint, params, response)
+
+@metrics.timed('csv_log')
+def append_log_row(log_type, row):
+    """Append a row to the CSV journal (and queue it for SQLite when enabled)"""
+    get_log_journal(log_type).append(row)
+    if sqlite_store is not None:
+        sqlite_store.enqueue(log_type, row)
+
+def query_log(log_type, limit=100, cursor=None, days=None):
+    """Newest-first page of a log: {'rows', 'next_cursor', 'total'}"""
+    since = get_cairo_time() - timedelta(days=days) if days else None
+    if sqlite_store is not None:
+        since_key = parse_time_key(since.strftime('%Y-%m-%d %H:%M:%S')) if since else None
+        return sqlite_store.page(log_type, limit=limit, cursor=cursor, since=since_key)
+    return get_log_journal(log_type).page(limit=limit, cursor=cursor, since=since)
+
+def count_log(log_type):
+    """Total rows in a log"""
+    if sqlite_store is not None:
+        return sqlite_store.count(log_type)
+    return get_log_journal(log_type).count()
+
 def log_trade_to_csv(trade_info, additional_data=None):
     """Log trade information to CSV file"""
     try:
-        csv_files = setup_csv_logging()
+        setup_csv_logging()  # Ensure log files and headers exist
         
         # Prepare trade data
         trade_data = [
@@ -221,29 +363,20 @@ def log_trade_to_csv(trade_info, additional_data=None):
             additional_data.get('profit_loss', 0) if additional_data else 0
         ]
         
-        # Write to CSV with most recent at top
-        import tempfile
-        temp_file = csv_files['trades'].with_suffix('.tmp')
-        
-        # Read existing data
-        existing_data = []
-        if csv_files['trades'].exists():
-            with open(csv_files['trades'], 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                existing_data = list(reader)
-        
-        # Write new data at top
-        with open(temp_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            if existing_data and existing_data[0]:  # Write header if exists
-                writer.writerow(existing_data[0])
-                writer.writerow(trade_data)  # New entry at top
-                writer.writerows(existing_data[1:])  # Rest of data
-            else:
-                writer.writerow(trade_data)
-        
-        # Replace original file
-        temp_file.replace(csv_files['trades'])
+        # Append; the journal index serves newest-first reads without rewriting the file
+        append_log_row('trades', trade_data)
+        performance_tracker.record_trade(trade_data[1], trade_data[8], trade_data[6], trade_data[15])  # cairo_time, status, value, profit_loss
+        trades_counter.inc(labels={'signal': trade_data[2], 'status': trade_data[8]})
+        status_broadcaster.publish_trade({
+            'time': trade_data[1],
+            'signal': trade_data[2],
+            'symbol': trade_data[3],
+            'quantity': trade_data[4],
+            'price': trade_data[5],
+            'value': trade_data[6],
+            'status': trade_data[8],
+            'profit_loss': trade_data[15]
+        })
             
         print(f"Trade logged to CSV: {trade_info.get('signal', 'UNKNOWN')} at {trade_info.get('price', 0)}")
         
@@ -259,7 +392,7 @@ def log_signal_to_csv(signal, price, indicators, reason=""):
     global last_signals, last_signal_time
     try:
         symbol = indicators.get('symbol', 'UNKNOWN')
-        current_time = datetime.now()
+        current_time = clock.now()
         
         print(f"🔍 Attempting to log signal: {signal} for {symbol} at ${price:.4f}")  # Debug
 
@@ -304,10 +437,10 @@ def log_signal_to_csv(signal, price, indicators, reason=""):
         last_signals[symbol_key] = current_time
         last_signals[signal_key] = current_time
         
-        csv_files = setup_csv_logging()
+        setup_csv_logging()  # Ensure log files and headers exist
         
         signal_data = [
-            datetime.now().isoformat(),
+            clock.now().isoformat(),
             format_cairo_time(),
             signal,
             symbol,
@@ -321,9 +454,7 @@ def log_signal_to_csv(signal, price, indicators, reason=""):
             reason
         ]
         
-        with open(csv_files['signals'], 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(signal_data)
+        append_log_row('signals', signal_data)
             
         print(f"✅ Signal logged: {signal} for {symbol} at ${price:.4f} - {reason}")  # Debug confirmation
             
@@ -334,13 +465,11 @@ def log_signal_to_csv(signal, price, indicators, reason=""):
         print(f"Stack trace: {traceback.format_exc()}")
 
 def log_daily_performance(date_dt: datetime | None = None):
-    """Compute and log daily performance for the given Cairo date.
+    """Log daily performance for the given Cairo date.
     If date_dt is None, uses current Cairo date. Avoids duplicate rows for the same date.
-    Metrics are computed from logs/trade_history.csv to ensure per-day accuracy.
+    Metrics come from the running performance tracker, which is updated as each trade is logged.
     """
     try:
-        csv_files = setup_csv_logging()
-
         # Determine which date to log (Cairo date string YYYY-MM-DD)
         day_dt = date_dt or get_cairo_time()
         if day_dt.tzinfo is None:
@@ -350,193 +479,91 @@ def log_daily_performance(date_dt: datetime | None = None):
         day_str = day_dt.strftime('%Y-%m-%d')
 
         # Check if already logged for this date
-        already_logged = False
-        if csv_files['performance'].exists():
-            try:
-                pdf = pd.read_csv(csv_files['performance'])
-                if not pdf.empty and 'date' in pdf.columns:
-                    already_logged = (pdf['date'].astype(str) == day_str).any()
-            except Exception:
-                pass
-        if already_logged:
+        if performance_tracker.is_reported(day_str):
             return True
 
-        # Compute metrics from trade history
-        total_trades = successful_trades = failed_trades = 0
-        win_rate = 0.0
-        total_revenue = 0.0
-        daily_pnl = 0.0
-        total_volume = 0.0
-        max_drawdown = 0.0  # Placeholder
-
-        if csv_files['trades'].exists():
-            try:
-                tdf = pd.read_csv(csv_files['trades'])
-                if not tdf.empty:
-                    # Ensure columns exist
-                    if 'cairo_time' in tdf.columns:
-                        # Extract Cairo date portion
-                        tdf['cairo_date'] = tdf['cairo_time'].astype(str).str[:10]
-                        ddf = tdf[tdf['cairo_date'] == day_str]
-                    else:
-                        ddf = pd.DataFrame()
-
-                    if not ddf.empty:
-                        total_trades = len(ddf)
-                        successful_trades = int((ddf.get('status', pd.Series(dtype=str)) == 'success').sum())
-                        failed_trades = total_trades - successful_trades
-                        # Sum numeric fields safely
-                        if 'profit_loss' in ddf.columns:
-                            daily_pnl = pd.to_numeric(ddf['profit_loss'], errors='coerce').fillna(0).sum()
-                        if 'value' in ddf.columns:
-                            total_volume = pd.to_numeric(ddf['value'], errors='coerce').fillna(0).sum()
-                        # For total_revenue, reuse daily_pnl as realized result
-                        total_revenue = float(daily_pnl)
-                        win_rate = (successful_trades / total_trades * 100.0) if total_trades > 0 else 0.0
-            except Exception as e:
-                print(f"Error computing daily metrics for {day_str}: {e}")
-
-        # Prepare row
+        summary = performance_tracker.day_summary(day_str)
         performance_data = [
             day_str,
-            total_trades,
-            successful_trades,
-            failed_trades,
-            win_rate,
-            total_revenue,
-            daily_pnl,
-            total_volume,
-            max_drawdown
+            summary['total_trades'],
+            summary['successful_trades'],
+            summary['failed_trades'],
+            summary['win_rate'],
+            summary['total_revenue'],
+            summary['daily_pnl'],
+            summary['total_volume'],
+            summary['max_drawdown']
         ]
 
-        # Append row
-        with open(csv_files['performance'], 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(performance_data)
+        # Append row, then remember the date so a failed write is retried
+        append_log_row('performance', performance_data)
+        performance_tracker.mark_reported(day_str)
         return True
     except Exception as e:
         print(f"Error logging daily performance to CSV: {e}")
         return False
 
+_error_aggregation_config = getattr(config, 'ERROR_AGGREGATION', {})
+error_aggregator = ErrorAggregator(
+    window_seconds=_error_aggregation_config.get('window_seconds', 300),
+    max_fingerprints=_error_aggregation_config.get('max_fingerprints', 500),
+    clock=clock.monotonic
+)
+
+def _write_error_row(error_message, error_type, function_name, severity):
+    """Append one error row to the CSV and forward ERROR/CRITICAL to Telegram"""
+    setup_csv_logging()  # Ensure log files and headers exist
+    
+    error_data = [
+        clock.now().isoformat(),
+        format_cairo_time(),
+        error_type,
+        str(error_message),
+        function_name,
+        severity,
+        bot_status.get('running', False)
+    ]
+    
+    # Append (the journal index keeps reads time-ordered, so no full-file rewrite is needed)
+    append_log_row('errors', error_data)
+        
+    print(f"Error logged to CSV: {error_type} - {error_message}")
+    
+    # Send Telegram notification for critical errors
+    if TELEGRAM_AVAILABLE and severity in ['ERROR', 'CRITICAL']:
+        try:
+            notify_error(str(error_message), error_type, function_name, severity)
+        except Exception as telegram_error:
+            print(f"Telegram error notification failed: {telegram_error}")
+
+def flush_error_summaries(force=False):
+    """Log one summary row (and notification) per closed window with suppressed repeats"""
+    try:
+        for summary in error_aggregator.pop_summaries(force=force):
+            message = (f"{summary['message']} "
+                       f"(repeated {summary['count']}x in {summary['window_seconds']:.0f}s)")
+            _write_error_row(message, summary['error_type'], summary['function_name'], summary['severity'])
+    except Exception as e:
+        print(f"Error flushing error summaries: {e}")
+
 def log_error_to_csv(error_message, error_type="GENERAL", function_name="", severity="ERROR"):
-    """Log errors to CSV file"""
+    """Log errors to CSV file (repeats within the aggregation window are counted, not re-logged)"""
     try:
-        csv_files = setup_csv_logging()
-        
-        error_data = [
-            datetime.now().isoformat(),
-            format_cairo_time(),
-            error_type,
-            str(error_message),
-            function_name,
-            severity,
-            bot_status.get('running', False)
-        ]
-        
-        # Write to CSV with most recent at top
-        import tempfile
-        temp_file = csv_files['errors'].with_suffix('.tmp')
-        
-        # Read existing data
-        existing_data = []
-        if csv_files['errors'].exists():
-            with open(csv_files['errors'], 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                existing_data = list(reader)
-        
-        # Write new data at top
-        with open(temp_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            if existing_data and existing_data[0]:  # Write header if exists
-                writer.writerow(existing_data[0])
-                writer.writerow(error_data)  # New entry at top
-                writer.writerows(existing_data[1:])  # Rest of data
-            else:
-                writer.writerow(error_data)
-        
-        # Replace original file
-        temp_file.replace(csv_files['errors'])
-            
-        print(f"Error logged to CSV: {error_type} - {error_message}")
-        
-        # Send Telegram notification for critical errors
-        if TELEGRAM_AVAILABLE and severity in ['ERROR', 'CRITICAL']:
-            try:
-                notify_error(str(error_message), error_type, function_name, severity)
-            except Exception as telegram_error:
-                print(f"Telegram error notification failed: {telegram_error}")
+        if _error_aggregation_config.get('enabled', True):
+            emit = error_aggregator.record(error_type, function_name, str(error_message), severity)
+            flush_error_summaries()
+            if not emit:
+                return
+        _write_error_row(error_message, error_type, function_name, severity)
             
     except Exception as e:
         print(f"Error logging error to CSV: {e}")
 
-def get_csv_trade_history(days=30):
-    """Read and return trade history from CSV"""
-    try:
-        csv_files = setup_csv_logging()
-        
-        if not csv_files['trades'].exists():
-            return []
-        
-        # Read CSV file
-        df = pd.read_csv(csv_files['trades'])
-        
-        # Filter by date if needed
-        if days > 0 and not df.empty:
-            try:
-                # Handle different timestamp formats
-                if 'timestamp' in df.columns:
-                    # Try to parse the timestamp column, removing timezone info to avoid warnings
-                    df['timestamp'] = pd.to_datetime(df['timestamp'].str.replace(r' [A-Z]{3,4}$', '', regex=True), errors='coerce')
-                    
-                    # Remove rows where timestamp parsing failed
-                    df = df.dropna(subset=['timestamp'])
-                    
-                    if not df.empty:
-                        # Create cutoff date with timezone awareness
-                        cutoff_date = get_cairo_time() - pd.Timedelta(days=days)
-                        
-                        # If timestamps are timezone-naive, make them timezone-aware for comparison
-                        if df['timestamp'].dt.tz is None:
-                            # Assume UTC if no timezone info
-                            df['timestamp'] = df['timestamp'].dt.tz_localize('UTC')
-                        
-                        # Convert cutoff_date to the same timezone as df timestamps
-                        if cutoff_date.tzinfo is None:
-                            cutoff_date = CAIRO_TZ.localize(cutoff_date)
-                        
-                        # Filter by date
-                        df = df[df['timestamp'] >= cutoff_date]
-                        
-            except Exception as date_error:
-                log_error_to_csv(f"Date filtering error in CSV read: {date_error}", 
-                               "CSV_DATE_ERROR", "get_csv_trade_history", "WARNING")
-                # Continue without date filtering if there's an error
-        
-        # Sort by timestamp to show newest first (similar to Signal History)
-        if not df.empty and 'timestamp' in df.columns:
-            try:
-                # Ensure timestamp column is properly parsed
-                df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-                df = df.dropna(subset=['timestamp'])
-                # Sort by timestamp, newest first
-                df = df.sort_values('timestamp', ascending=False)
-            except Exception as sort_error:
-                # Fallback: reverse the order to show newest first
-                df = df.iloc[::-1]
-        else:
-            # Fallback: reverse the order to show newest first
-            df = df.iloc[::-1]
-        
-        # Convert to list of dictionaries
-        return df.to_dict('records')
-        
-    except Exception as e:
-        log_error_to_csv(f"Error reading CSV trade history: {e}", 
-                       "CSV_READ_ERROR", "get_csv_trade_history", "ERROR")
-        return []
+# Recently fetched candle series, referenced from scan results by handle
+candle_store = CandleStore(max_entries=64, clock=clock.time)
 
 # Global bot status
-bot_status = {
+bot_status = BotState({
     'running': False,
     'signal_scanning_active': False,  # Track signal scanning status
     'last_signal': 'UNKNOWN',
@@ -546,7 +573,7 @@ bot_status = {
     'last_update': None,
     'api_connected': False,
     'total_trades': 0,
-    'errors': [],
+    'errors': ErrorRingBuffer(getattr(config, 'ERROR_AGGREGATION', {}).get('status_buffer_size', 200)),  # Recent errors (bounded)
     'start_time': get_cairo_time(),
     'consecutive_errors': 0,
     'rsi': 50,
@@ -581,48 +608,60 @@ bot_status = {
     'coinbase_cache': {},          # {'BTC-USD': {'time': dt, 'data': {...}}}
     # Logging deduplication
     'last_logged_signal': {}       # per-symbol last logged signal value
-}
+})
+
+# Live status feed: push public field changes to /api/stream subscribers
+status_broadcaster = StatusBroadcaster(queue_size=getattr(config, 'DASHBOARD', {}).get('stream_queue_size', 100),
+                                       max_subscribers=getattr(config, 'DASHBOARD', {}).get('stream_max_clients', 4))
+bot_status.watch(STREAM_FIELDS, status_broadcaster.publish_changes)
+
+# Prometheus counters/gauges (stage timers are registered by metrics.timed)
+trades_counter = metrics.counter('trades_total', 'Logged trades by signal and status')
+metrics.gauge('bot_running', 'Whether the trading loop is running', lambda: 1 if bot_status.get('running') else 0)
+metrics.gauge('errors_recorded', 'Errors recorded since start', lambda: bot_status['errors'].total)
+metrics.gauge('consecutive_errors', 'Current consecutive trading-loop errors', lambda: bot_status.get('consecutive_errors', 0))
+metrics.gauge('stream_subscribers', 'Open /api/stream connections', lambda: status_broadcaster.subscriber_count())
 
 app = Flask(__name__)
 
+# Serving mode; the bot runs in a single server process guarded by the leader lock
+_server_config = getattr(config, 'SERVER', {})
+engine_lock = LeaderLock(_server_config.get('leader_lock_path', 'logs/trading_engine.lock'))
+
+_dashboard_config = getattr(config, 'DASHBOARD', {})
+PAGE_CACHE_SECONDS = _dashboard_config.get('page_cache_seconds', 2)
+DASHBOARD_TEMPLATES = ('home.html', 'logs.html', 'trade_logs.html', 'signal_logs.html',
+                       'performance_logs.html', 'error_logs.html')
+
+def warm_template_cache():
+    """Compile dashboard templates once at startup (Jinja keeps them cached)"""
+    for name in DASHBOARD_TEMPLATES:
+        try:
+            app.jinja_env.get_template(name)
+        except Exception as e:
+            print(f"⚠️ Template warmup failed for {name}: {e}")
+
+warm_template_cache()
+startup_profiler.checkpoint('templates')
+
 # Initialize CSV logging on startup
 setup_csv_logging()
+startup_profiler.checkpoint('csv logging')
+bootstrap_performance_tracker()
+startup_profiler.checkpoint('performance bootstrap')
 
-# Initialize API credentials with multiple fallback methods for Render deployment
 print("🚀 CRYPTIX Bot Starting...")
 
+# Credentials are read (and the client created) by initialize_client()
 api_key = None
 api_secret = None
 client = None
 
-# Try multiple methods to get environment variables without noisy prints
-try:
-    # Method 1: os.getenv (standard)
-    api_key = os.getenv("API_KEY")
-    api_secret = os.getenv("API_SECRET")
-    # Method 2: Direct os.environ access (backup)
-    if not api_key:
-        api_key = os.environ.get("API_KEY")
-    if not api_secret:
-        api_secret = os.environ.get("API_SECRET")
-    if _verbose():
-        print(f"🔑 Initial credential check:")
-        print(f"   API_KEY loaded: {'✓' if api_key else '✗'}")
-        print(f"   API_SECRET loaded: {'✓' if api_secret else '✗'}")
-        if api_key and api_secret:
-            print(f"   API_KEY format: {len(api_key)} chars, preview: {api_key[:8]}...{api_key[-4:]}")
-            print("✅ Credentials loaded successfully at startup")
-        else:
-            print("⚠️  Credentials not found at startup - will retry during initialization")
-except Exception as e:
-    if _verbose():
-        print(f"⚠️  Error loading credentials at startup: {e}")
-        print("   Will attempt to load during client initialization")
-
 # Lightweight sentiment analysis function
 def get_sentiment_score(text):
     """Enhanced sentiment scoring with crypto-specific keyword weighting"""
     try:
+        from textblob import TextBlob  # Heavy (nltk); imported only when scoring text
         blob = TextBlob(text)
         base_sentiment = blob.sentiment.polarity
         
@@ -651,92 +690,132 @@ def get_sentiment_score(text):
         print(f"Sentiment scoring error: {e}")
         return 0
 
-def initialize_client():
-    global client, bot_status, api_key, api_secret
-    try:
-        # Skip if already connected and client exists
-        if client and bot_status.get('api_connected', False):
-            print("✅ API client already connected")
-            return True
-            
-        # Reload environment variables to ensure we have latest values
-        load_dotenv()
-        
-        # Get API credentials with multiple fallback methods for Render
-        api_key = (
-            os.getenv("API_KEY") or 
-            os.environ.get("API_KEY") or 
-            os.getenv("BINANCE_API_KEY") or
-            os.environ.get("BINANCE_API_KEY") or
-            None
-        )
-        api_secret = (
-            os.getenv("API_SECRET") or 
-            os.environ.get("API_SECRET") or 
-            os.getenv("BINANCE_API_SECRET") or
-            os.environ.get("BINANCE_API_SECRET") or
-            None
-        )
-        
-        # Detailed logging for debugging (verbose only)
-        if _verbose():
-            print(f"🔍 Environment check:")
-            print(f"   API_KEY found: {'Yes' if api_key else 'No'}")
-            print(f"   API_SECRET found: {'Yes' if api_secret else 'No'}")
-            if api_key:
-                print(f"   API_KEY length: {len(api_key)}")
-                print(f"   API_KEY preview: {api_key[:8]}...{api_key[-4:]}")
-        
-        if not api_key or not api_secret:
-            error_msg = f"API credentials missing - API_KEY: {'✓' if api_key else '✗'}, API_SECRET: {'✓' if api_secret else '✗'}"
-            print(f"❌ {error_msg}")
-            bot_status['errors'].append(error_msg)
-            log_error_to_csv(error_msg, "CREDENTIALS_ERROR", "initialize_client", "ERROR")
-            return False
-        
-        # Determine whether to use Binance Testnet (via env or config)
-        def _truthy(v):
-            return str(v).strip().lower() in {"1", "true", "yes", "on"}
-        env_flag = os.getenv("BINANCE_TESTNET") or os.getenv("USE_TESTNET")
-        use_testnet = _truthy(env_flag) if env_flag is not None else getattr(config, 'USE_TESTNET', False)
+_client_init_lock = threading.Lock()
+
+_exchange_config = getattr(config, 'EXCHANGE', {})
+
+def _exchange_mode():
+    return (os.getenv('CRYPTIX_EXCHANGE') or _exchange_config.get('mode', 'live')).strip().lower()
+
+def create_fake_client(**overrides):
+    """Offline FakeBinanceClient configured from config.EXCHANGE['fake'] (keyword overrides win)"""
+    from fake_exchange import FakeBinanceClient
+    options = dict(_exchange_config.get('fake', {}))
+    options.update(overrides)
+    return FakeBinanceClient(**options)
+
+def initialize_client(exchange_client=None):
+    """Create and verify the Binance client (serialized: startup init may run in the background).
+    exchange_client injects a ready client instead, e.g. create_fake_client() for offline runs."""
+    with _client_init_lock:
+        return _connect_client(exchange_client)
+
+def _use_testnet():
+    """Whether to use Binance Testnet (via env or config)"""
+    def _truthy(v):
+        return str(v).strip().lower() in {"1", "true", "yes", "on"}
+    env_flag = os.getenv("BINANCE_TESTNET") or os.getenv("USE_TESTNET")
+    return _truthy(env_flag) if env_flag is not None else getattr(config, 'USE_TESTNET', False)
+
+def _create_binance_client():
+    """Read credentials and create the python-binance client (False if credentials are unusable)"""
+    global client, api_key, api_secret
+    # Reload environment variables to ensure we have latest values
+    load_dotenv()
+    
+    # Get API credentials with multiple fallback methods for Render
+    api_key = (
+        os.getenv("API_KEY") or 
+        os.environ.get("API_KEY") or 
+        os.getenv("BINANCE_API_KEY") or
+        os.environ.get("BINANCE_API_KEY") or
+        None
+    )
+    api_secret = (
+        os.getenv("API_SECRET") or 
+        os.environ.get("API_SECRET") or 
+        os.getenv("BINANCE_API_SECRET") or
+        os.environ.get("BINANCE_API_SECRET") or
+        None
+    )
+    
+    # Detailed logging for debugging (verbose only)
+    if _verbose():
+        print(f"🔍 Environment check:")
+        print(f"   API_KEY found: {'Yes' if api_key else 'No'}")
+        print(f"   API_SECRET found: {'Yes' if api_secret else 'No'}")
+        if api_key:
+            print(f"   API_KEY length: {len(api_key)}")
+            print(f"   API_KEY preview: {api_key[:8]}...{api_key[-4:]}")
+    
+    if not api_key or not api_secret:
+        error_msg = f"API credentials missing - API_KEY: {'✓' if api_key else '✗'}, API_SECRET: {'✓' if api_secret else '✗'}"
+        print(f"❌ {error_msg}")
+        bot_status['errors'].append(error_msg, "CREDENTIALS")
+        log_error_to_csv(error_msg, "CREDENTIALS_ERROR", "initialize_client", "ERROR")
+        return False
+    
+    use_testnet = _use_testnet()
 
-        # Validate credential format (less strict for testnet); allow variation in lengths on LIVE
-        if not use_testnet and len(api_key) < 32:
-            error_msg = f"Invalid API key format - too short for LIVE (len={len(api_key)})"
-            print(f"❌ {error_msg}")
-            bot_status['errors'].append(error_msg)
-            log_error_to_csv(error_msg, "CREDENTIALS_ERROR", "initialize_client", "ERROR")
-            return False
-        if not use_testnet and len(api_secret) < 32:
-            error_msg = f"Invalid API secret format - too short for LIVE (len={len(api_secret)})"
+    # Validate credential format (less strict for testnet); allow variation in lengths on LIVE
+    if not use_testnet and len(api_key) < 32:
+        error_msg = f"Invalid API key format - too short for LIVE (len={len(api_key)})"
+        print(f"❌ {error_msg}")
+        bot_status['errors'].append(error_msg, "CREDENTIALS")
+        log_error_to_csv(error_msg, "CREDENTIALS_ERROR", "initialize_client", "ERROR")
+        return False
+    if not use_testnet and len(api_secret) < 32:
+        error_msg = f"Invalid API secret format - too short for LIVE (len={len(api_secret)})"
+        print(f"❌ {error_msg}")
+        bot_status['errors'].append(error_msg, "CREDENTIALS")
+        log_error_to_csv(error_msg, "CREDENTIALS_ERROR", "initialize_client", "ERROR")
+        return False
+    if use_testnet:
+        # Basic sanity check only
+        if len(api_key) < 24 or len(api_secret) < 24:
+            error_msg = f"Testnet credentials look too short (key {len(api_key)}, secret {len(api_secret)})"
             print(f"❌ {error_msg}")
-            bot_status['errors'].append(error_msg)
+            bot_status['errors'].append(error_msg, "CREDENTIALS")
             log_error_to_csv(error_msg, "CREDENTIALS_ERROR", "initialize_client", "ERROR")
             return False
-        if use_testnet:
-            # Basic sanity check only
-            if len(api_key) < 24 or len(api_secret) < 24:
-                error_msg = f"Testnet credentials look too short (key {len(api_key)}, secret {len(api_secret)})"
-                print(f"❌ {error_msg}")
-                bot_status['errors'].append(error_msg)
-                log_error_to_csv(error_msg, "CREDENTIALS_ERROR", "initialize_client", "ERROR")
-                return False
-
-        print(f"🔗 Initializing Binance client for {'TESTNET' if use_testnet else 'LIVE'} trading...")
-        client = Client(api_key, api_secret, testnet=use_testnet)
-        # Ensure Spot Testnet base URL when requested
-        if use_testnet:
-            try:
-                client.API_URL = 'https://testnet.binance.vision/api'
-            except Exception:
-                pass
+
+    print(f"🔗 Initializing Binance client for {'TESTNET' if use_testnet else 'LIVE'} trading...")
+    _load_binance()
+    client = Client(api_key, api_secret, testnet=use_testnet)
+    # Ensure Spot Testnet base URL when requested
+    if use_testnet:
         try:
-            base_url = getattr(client, 'API_URL', None) or getattr(client, 'BASE_URL', None)
-            if base_url:
-                print(f"   Base URL: {base_url}")
+            client.API_URL = 'https://testnet.binance.vision/api'
         except Exception:
             pass
-        
+    try:
+        base_url = getattr(client, 'API_URL', None) or getattr(client, 'BASE_URL', None)
+        if base_url:
+            print(f"   Base URL: {base_url}")
+    except Exception:
+        pass
+    return True
+
+def _connect_client(exchange_client=None):
+    global client, bot_status, BinanceAPIException
+    try:
+        # Skip if already connected and client exists
+        if exchange_client is None and client and bot_status.get('api_connected', False):
+            print("✅ API client already connected")
+            return True
+            
+        if exchange_client is None and _exchange_mode() == 'fake':
+            exchange_client = create_fake_client()
+        if exchange_client is not None:
+            # Simulated exchanges raise their own API error type with the same attributes
+            BinanceAPIException = getattr(exchange_client, 'APIException', BinanceAPIException)
+            client = exchange_client
+            print(f"🧪 Using simulated exchange ({type(exchange_client).__name__}); no requests reach Binance")
+        elif not _create_binance_client():
+            return False
+        if api_tape is not None and not isinstance(client, RecordingClient):
+            client = RecordingClient(client, api_tape)
+
         # Test API connection with minimal call
         if _verbose():
             print("📊 Testing API connection...")
@@ -765,7 +844,7 @@ def initialize_client():
     except BinanceAPIException as e:
         error_msg = f"Binance API Error {e.code}: {e.message}"
         print(f"❌ {error_msg}")
-        bot_status['errors'].append(error_msg)
+        bot_status['errors'].append(error_msg, "API_ERROR")
         bot_status['api_connected'] = False
         client = None
         
@@ -782,7 +861,7 @@ def initialize_client():
     except Exception as e:
         error_msg = f"Unexpected error initializing client: {str(e)}"
         print(f"❌ {error_msg}")
-        bot_status['errors'].append(error_msg)
+        bot_status['errors'].append(error_msg, "CLIENT_INIT")
         bot_status['api_connected'] = False
         client = None
         log_error_to_csv(error_msg, "CLIENT_ERROR", "initialize_client", "ERROR")
@@ -790,6 +869,15 @@ def initialize_client():
 
 # Market data based sentiment analysis is used instead of social sentiment
 
+COINBASE_API_URL = "https://api.exchange.coinbase.com"
+COINBASE_HEADERS = {
+    'User-Agent': 'CRYPTIX-ML/1.0',
+    'Accept': 'application/json'
+}
+
+# Shared pool for concurrent Coinbase requests (order book + trades per product)
+_coinbase_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='coinbase_http')
+
 def fetch_coinbase_data(product: str = "BTC-USD", ttl_seconds: int = 30):
     """Fetch Coinbase public market data with simple TTL cache and backoff.
     Returns dict with order_book, recent_trades, timestamp or None on error.
@@ -802,25 +890,27 @@ def fetch_coinbase_data(product: str = "BTC-USD", ttl_seconds: int = 30):
         if entry and (now - entry['time']).total_seconds() < ttl_seconds:
             return entry['data']
 
-        base_url = "https://api.exchange.coinbase.com"
-        headers = {
-            'User-Agent': 'CRYPTIX-ML/1.0',
-            'Accept': 'application/json'
-        }
-
         if _verbose():
             print(f"Fetching Coinbase order book for {product}...")
 
+        # Replaying an API tape: Coinbase payloads come from the tape, never the network
+        recorded = getattr(client, 'coinbase', None)
+        if recorded is not None:
+            order_book = recorded('coinbase_book', product)
+            if not coinbase_book_valid(product, order_book):
+                return None
+            return store_coinbase_data(product, order_book, recorded('coinbase_trades', product))
+
         # Helper for GET with backoff
         def get_with_backoff(url, max_retries=3):
             delay = 0.35
             for attempt in range(max_retries):
                 try:
-                    resp = requests.get(url, headers=headers, timeout=5)
+                    resp = requests.get(url, headers=COINBASE_HEADERS, timeout=5)
                 except Exception as req_err:
                     if attempt == max_retries - 1:
                         raise req_err
-                    time.sleep(delay)
+                    clock.sleep(delay)
                     delay = min(delay * 2, 2.0)
                     continue
                 if resp.status_code == 200:
@@ -829,103 +919,91 @@ def fetch_coinbase_data(product: str = "BTC-USD", ttl_seconds: int = 30):
                     retry_after = resp.headers.get('Retry-After')
                     wait_s = float(retry_after) if retry_after else delay
                     log_error_to_csv("Coinbase rate limit exceeded", "API_RATE_LIMIT", "fetch_coinbase_data", "WARNING")
-                    time.sleep(wait_s)
+                    clock.sleep(wait_s)
                     delay = min(delay * 2, 2.0)
                     continue
                 # Other errors: raise after final attempt
                 if attempt == max_retries - 1:
                     raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:200]}")
-                time.sleep(delay)
+                clock.sleep(delay)
                 delay = min(delay * 2, 2.0)
             return None
 
-        # Requests
-        order_book_resp = get_with_backoff(f"{base_url}/products/{product}/book?level=2")
+        # Order book and trades are independent - fetch them concurrently
+        book_future = _coinbase_pool.submit(get_with_backoff, f"{COINBASE_API_URL}/products/{product}/book?level=2")
+        trades_future = _coinbase_pool.submit(get_with_backoff, f"{COINBASE_API_URL}/products/{product}/trades")
+        order_book_resp = book_future.result()
         order_book = order_book_resp.json() if order_book_resp is not None else None
-        if not isinstance(order_book, dict) or 'bids' not in order_book or 'asks' not in order_book:
-            log_error_to_csv(f"Invalid Coinbase order book response for {product}", "COINBASE_ERROR", "fetch_coinbase_data", "ERROR")
+        if not coinbase_book_valid(product, order_book):
             return None
 
-        time.sleep(0.2)  # slight pacing between requests
-        trades_resp = get_with_backoff(f"{base_url}/products/{product}/trades")
+        trades_resp = trades_future.result()
         trades = trades_resp.json() if trades_resp is not None else []
-
-        data = {
-            'order_book': order_book,
-            'recent_trades': trades,
-            'timestamp': datetime.now().timestamp()
-        }
-        # Save in cache
-        cache[product] = {'time': now, 'data': data}
-        bot_status['coinbase_cache'] = cache
-        return data
+        return store_coinbase_data(product, order_book, trades)
     except Exception as e:
         print(f"Coinbase data fetch error: {e}")
         return None
 
-def analyze_market_sentiment():
-    """Analyze market sentiment from multiple sources"""
+def coinbase_book_valid(product, order_book):
+    """Record the order book response; False (logged) if it is not a usable level-2 book"""
+    record_api_response('coinbase', 'coinbase_book', {'product': product}, order_book)
+    if not isinstance(order_book, dict) or 'bids' not in order_book or 'asks' not in order_book:
+        log_error_to_csv(f"Invalid Coinbase order book response for {product}", "COINBASE_ERROR", "fetch_coinbase_data", "ERROR")
+        return False
+    return True
+
+def store_coinbase_data(product, order_book, trades):
+    """Record the trades response, parse both payloads and cache the result for product"""
+    record_api_response('coinbase', 'coinbase_trades', {'product': product}, trades)
+    data = {
+        'order_book': order_book,
+        'recent_trades': trades,
+        # Parsed once per fetch so sentiment math runs on contiguous arrays
+        'parsed': parse_market_data(order_book, trades),
+        'timestamp': clock.time()
+    }
+    # Save in cache
+    cache = bot_status.get('coinbase_cache') or {}
+    cache[product] = {'time': get_cairo_time(), 'data': data}
+    bot_status['coinbase_cache'] = cache
+    return data
+
+def _refresh_coinbase_data(product: str):
+    """Fetch fresh Coinbase data for the background sentiment service"""
+    return fetch_coinbase_data(product, ttl_seconds=0)
+
+sentiment_service = SentimentService(_refresh_coinbase_data, clock=clock.time)
+
+def sentiment_product_for(symbol: str | None = None) -> str:
+    """Map a Binance symbol to the Coinbase product used for its sentiment"""
+    default_product = getattr(config, 'SENTIMENT', {}).get('product', 'BTC-USD')
+    if symbol and symbol.endswith('USDT'):
+        product = f"{symbol[:-4]}-USD"
+        if product in sentiment_service.products:
+            return product
+    return default_product
+
+@metrics.timed('sentiment')
+def analyze_market_sentiment(product: str | None = None):
+    """Return the latest market sentiment for a Coinbase product.
+    Sentiment is refreshed by the sentiment service, which runs only while the bot
+    runs; this reads from memory (registering the product for the next refresh) so
+    signal generation never blocks on Coinbase HTTP latency.
+    """
     try:
-        # Initialize sentiment components
-        order_book_sentiment = 0
-        trade_flow_sentiment = 0
-        print("\nAnalyzing market sentiment from order book and trade data...")  # Debug log
-        
-        # 1. Order Book Analysis
-        cb_data = fetch_coinbase_data("BTC-USD")
-        if cb_data:
-            order_book = cb_data['order_book']
-            if 'bids' in order_book and 'asks' in order_book:
-                # Calculate buy/sell pressure
-                bid_volume = sum(float(bid[1]) for bid in order_book['bids'][:10])
-                ask_volume = sum(float(ask[1]) for ask in order_book['asks'][:10])
-                
-                # Normalize order book sentiment
-                total_volume = bid_volume + ask_volume
-                if total_volume > 0:
-                    order_book_sentiment = (bid_volume - ask_volume) / total_volume
-        
-            # 3. Recent Trade Flow Analysis
-            if 'recent_trades' in cb_data:
-                recent_trades = cb_data['recent_trades']
-                buy_volume = sum(float(trade['size']) for trade in recent_trades if trade['side'] == 'buy')
-                sell_volume = sum(float(trade['size']) for trade in recent_trades if trade['side'] == 'sell')
-                
-                total_trade_volume = buy_volume + sell_volume
-                if total_trade_volume > 0:
-                    trade_flow_sentiment = (buy_volume - sell_volume) / total_trade_volume
-        
-        # Market data based sentiment weights
-        weights = {
-            'order_book': 0.6,  # Order book pressure weight
-            'trade_flow': 0.4   # Recent trade flow weight
-        }
-        
-        # Calculate combined sentiment using market data
-        combined_sentiment = (
-            weights['order_book'] * order_book_sentiment +
-            weights['trade_flow'] * trade_flow_sentiment
-        )
-        
-        # Advanced sentiment thresholds with confidence levels
-        sentiment_data = {
-            'value': combined_sentiment,
-            'components': {
-                'order_book_sentiment': order_book_sentiment,
-                'trade_flow_sentiment': trade_flow_sentiment
-            },
-            'confidence': min(1.0, abs(combined_sentiment) * 2)  # Confidence score 0-1
-        }
-        # Determine sentiment with confidence threshold
-        if abs(combined_sentiment) < 0.1:
-            return "neutral"
-        elif combined_sentiment > 0:
-            return "bullish" if sentiment_data['confidence'] > 0.5 else "neutral"
-        else:
-            return "bearish" if sentiment_data['confidence'] > 0.5 else "neutral"
-            
+        product = product or getattr(config, 'SENTIMENT', {}).get('product', 'BTC-USD')
+        sentiment_service.track(product)
+
+        sentiment_data = sentiment_service.get_sentiment(product)
+        if _verbose():
+            components = sentiment_data['components']
+            print(f"Sentiment {product}: {sentiment_data['label']} ({sentiment_data['value']:+.3f}; "
+                  f"book {components['order_book_sentiment']:+.2f}, flow {components['trade_flow_sentiment']:+.2f}, "
+                  f"vwap {components['vwap_skew']:+.2f})")
+        return sentiment_data['label']
+
     except Exception as e:
-        bot_status['errors'].append(f"Market sentiment analysis failed: {e}")
+        bot_status['errors'].append(f"Market sentiment analysis failed: {e}", "SENTIMENT")
         return "neutral"
 
 def get_exchange_info_cached(ttl_seconds: int = 300):
@@ -1074,199 +1152,280 @@ def calculate_macd(prices, fast=None, slow=None, signal=None):
         log_error_to_csv(f"MACD calculation error: {e}", "MACD_ERROR", "calculate_macd", "ERROR")
         return {"macd": 0, "signal": 0, "histogram": 0, "trend": "NEUTRAL"}
 
+_candles_config = getattr(config, 'CANDLES', {})
+
+@metrics.timed('kline_request')
+def _request_klines(symbol, interval, limit):
+    """One kline request -> raw OHLCV frame indexed by candle open time (None without a client)"""
+    if not client:
+        error_msg = "Trading client not initialized. Cannot fetch market data."
+        log_error_to_csv(error_msg, "CLIENT_ERROR", "fetch_data", "ERROR")
+        return None
+    if _verbose():
+        print(f"\n=== Fetching {limit} x {interval} candles for {symbol} ===")  # Debug log
+    klines = client.get_klines(symbol=symbol, interval=interval, limit=limit)
+    if _verbose():
+        print(f"Received {len(klines)} candles from Binance")  # Debug log
+    df = decode_klines(klines)
+    if _candles_config.get('resample', True) and interval in INTERVAL_SECONDS:
+        candle_store.put_base(symbol, interval, df)
+    return df
+
+def fetch_klines(symbol="BTCUSDT", interval="1h", limit=100):
+    """Raw OHLCV candles, derived from a fresh finer series in the candle store when one covers the request"""
+    if _candles_config.get('resample', True):
+        df = candle_store.derive(symbol, interval, limit, max_age=_candles_config.get('max_age_seconds', 20))
+        if df is not None:
+            return df
+    df = _request_klines(symbol, interval, limit)
+    return df.copy() if df is not None else None  # The stored base frame stays untouched
+
+def candle_request(requirements):
+    """(interval, limit) of the one kline request every interval in requirements ({interval: limit})
+    can be derived from, or None if resampling is off or that would exceed one request"""
+    if not _candles_config.get('resample', True) or not all(i in INTERVAL_SECONDS for i in requirements):
+        return None
+    finest = min(requirements, key=interval_seconds)
+    if not all(can_derive(finest, interval) for interval in requirements):
+        return None
+    rows = max(rows_needed(finest, interval, limit) for interval, limit in requirements.items())
+    if rows > _candles_config.get('max_request_limit', 1000):
+        return None
+    return finest, rows
+
+def candles_stored(symbol, requirements, max_age=None):
+    """True if every interval in requirements can be derived from a fresh stored series"""
+    max_age = _candles_config.get('max_age_seconds', 20) if max_age is None else max_age
+    return _candles_config.get('resample', True) and all(
+        candle_store.covers(symbol, interval, limit, max_age=max_age) for interval, limit in requirements.items())
+
+def prefetch_candles(symbol, requirements):
+    """Fetch the finest interval in requirements ({interval: limit}) once, sized so every
+    other interval can be derived from it. Returns False if that would exceed one request."""
+    request = candle_request(requirements)
+    if request is None:
+        return False
+    try:
+        return _request_klines(symbol, *request) is not None
+    except Exception as e:
+        log_error_to_csv(f"Candle prefetch failed for {symbol}: {e}", "DATA_FETCH_ERROR", "prefetch_candles", "WARNING")
+        return False
+
+@metrics.timed('fetch_data')
 def fetch_data(symbol="BTCUSDT", interval="1h", limit=100):
     """Fetch historical price data from Binance."""
     try:
-        if _verbose():
-            print(f"\n=== Fetching data for {symbol} ===")  # Debug log
-        if client:
-            if _verbose():
-                print("Using Binance client...")  # Debug log
-            klines = client.get_klines(symbol=symbol, interval=interval, limit=limit)
-            if _verbose():
-                print(f"Received {len(klines)} candles from Binance")  # Debug log
-            df = pd.DataFrame(klines, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume', 'close_time', 
-                                             'quote_asset_volume', 'number_of_trades', 'taker_buy_base_asset_volume', 
-                                             'taker_buy_quote_asset_volume', 'ignore'])
-            
-            # Convert numeric columns to float
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-        else:
-            error_msg = "Trading client not initialized. Cannot fetch market data."
-            log_error_to_csv(error_msg, "CLIENT_ERROR", "fetch_data", "ERROR")
+        df = fetch_klines(symbol, interval, limit)
+        if df is None:
             return None
-        
-        # Calculate technical indicators
-        df['sma5'] = df['close'].rolling(5).mean()
-        df['sma20'] = df['close'].rolling(20).mean()
-
-        # EMA family (uses config periods)
-        try:
-            ema_fast = config.EMA_PERIODS.get('fast', 12)
-            ema_slow = config.EMA_PERIODS.get('slow', 26)
-            ema_mid = config.EMA_PERIODS.get('mid', 50)
-            ema_long = config.EMA_PERIODS.get('long', 200)
-        except Exception:
-            ema_fast, ema_slow, ema_mid, ema_long = 12, 26, 50, 200
-        df['ema_fast'] = df['close'].ewm(span=ema_fast, adjust=False).mean()
-        df['ema_slow'] = df['close'].ewm(span=ema_slow, adjust=False).mean()
-        df['ema50'] = df['close'].ewm(span=ema_mid, adjust=False).mean()
-        df['ema200'] = df['close'].ewm(span=ema_long, adjust=False).mean()
-        
-        # Bollinger Bands
-        df['bb_middle'] = df['close'].rolling(window=20).mean()
-        df['bb_upper'] = df['bb_middle'] + 2 * df['close'].rolling(window=20).std()
-        df['bb_lower'] = df['bb_middle'] - 2 * df['close'].rolling(window=20).std()
-        
-        # Calculate RSI with proper error handling
-        prices = df['close'].values
-        try:
-            rsi_value = calculate_rsi(prices)
-            if isinstance(rsi_value, (int, float)):
-                df['rsi'] = rsi_value  # Single value for entire series
-            else:
-                df['rsi'] = 50  # Default fallback
-        except Exception as rsi_error:
-            log_error_to_csv(f"RSI calculation failed for {symbol}: {rsi_error}", 
-                           "RSI_ERROR", "fetch_data", "WARNING")
-            df['rsi'] = 50
-        
-        # Calculate MACD with proper error handling
-        try:
-            macd_data = calculate_macd(prices)
-            df['macd'] = macd_data.get('macd', 0)
-            df['macd_signal'] = macd_data.get('signal', 0)
-            df['macd_histogram'] = macd_data.get('histogram', 0)
-            df['macd_trend'] = macd_data.get('trend', 'NEUTRAL')
-        except Exception as macd_error:
-            log_error_to_csv(f"MACD calculation failed for {symbol}: {macd_error}", 
-                           "MACD_ERROR", "fetch_data", "WARNING")
-            df['macd'] = 0
-            df['macd_signal'] = 0
-            df['macd_histogram'] = 0
-            df['macd_trend'] = 'NEUTRAL'
-        
-        # Volatility
-        df['volatility'] = df['close'].pct_change().rolling(window=20).std() * np.sqrt(252)
-        
-        # True Range helpers for ATR and ADX
-        high_low = df['high'] - df['low']
-        high_close = (df['high'] - df['close'].shift()).abs()
-        low_close = (df['low'] - df['close'].shift()).abs()
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        df['atr'] = tr.rolling(config.ATR_PERIOD).mean()
-
-        # Stochastic Oscillator %K and %D
-        try:
-            k_period = config.STOCH.get('k_period', 14)
-            d_period = config.STOCH.get('d_period', 3)
-        except Exception:
-            k_period, d_period = 14, 3
-        lowest_low = df['low'].rolling(window=k_period).min()
-        highest_high = df['high'].rolling(window=k_period).max()
-        df['stoch_k'] = np.where(
-            (highest_high - lowest_low) > 0,
-            (df['close'] - lowest_low) / (highest_high - lowest_low) * 100,
-            50
-        )
-        df['stoch_d'] = df['stoch_k'].rolling(window=d_period).mean()
-
-        # VWAP (rolling approximation)
-        try:
-            vwap_window = config.VWAP.get('window', 20)
-        except Exception:
-            vwap_window = 20
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
-        pv = typical_price * df['volume']
-        df['vwap'] = pv.rolling(window=vwap_window).sum() / df['volume'].rolling(window=vwap_window).sum()
-
-        # ADX
-        try:
-            adx_period = config.ADX.get('period', 14)
-        except Exception:
-            adx_period = 14
-        up_move = df['high'].diff()
-        down_move = -df['low'].diff()
-        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
-        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
-        atr_smooth = tr.rolling(window=adx_period).mean()
-        plus_di = 100 * (pd.Series(plus_dm, index=df.index).rolling(window=adx_period).sum() / atr_smooth)
-        minus_di = 100 * (pd.Series(minus_dm, index=df.index).rolling(window=adx_period).sum() / atr_smooth)
-        dx = (abs(plus_di - minus_di) / (plus_di + minus_di)).replace([np.inf, -np.inf], np.nan) * 100
-        df['adx'] = dx.rolling(window=adx_period).mean()
-        
-    # Volume trend
-        df['volume_sma'] = df['volume'].rolling(20).mean()
-        df['volume_trend'] = df['volume'] / df['volume_sma']
-        
-        return df
+        return compute_indicators(df, symbol)
         
     except Exception as e:
         error_msg = f"Error fetching data for {symbol}: {e}"
         log_error_to_csv(error_msg, "DATA_FETCH_ERROR", "fetch_data", "ERROR")
-        bot_status['errors'].append(error_msg)
+        bot_status['errors'].append(error_msg, "DATA_FETCH_ERROR")
         return None
 
-def detect_market_regime():
-    """Professional market regime detection for intelligent timing"""
+@metrics.timed('indicators')
+def compute_indicators(df, symbol=""):
+    """Add the technical indicator columns used by the strategies to an OHLCV frame (in place)"""
+    # Calculate technical indicators
+    df['sma5'] = df['close'].rolling(5).mean()
+    df['sma20'] = df['close'].rolling(20).mean()
+
+    # EMA family (uses config periods)
+    try:
+        ema_fast = config.EMA_PERIODS.get('fast', 12)
+        ema_slow = config.EMA_PERIODS.get('slow', 26)
+        ema_mid = config.EMA_PERIODS.get('mid', 50)
+        ema_long = config.EMA_PERIODS.get('long', 200)
+    except Exception:
+        ema_fast, ema_slow, ema_mid, ema_long = 12, 26, 50, 200
+    df['ema_fast'] = df['close'].ewm(span=ema_fast, adjust=False).mean()
+    df['ema_slow'] = df['close'].ewm(span=ema_slow, adjust=False).mean()
+    df['ema50'] = df['close'].ewm(span=ema_mid, adjust=False).mean()
+    df['ema200'] = df['close'].ewm(span=ema_long, adjust=False).mean()
+    
+    # Bollinger Bands
+    df['bb_middle'] = df['close'].rolling(window=20).mean()
+    df['bb_upper'] = df['bb_middle'] + 2 * df['close'].rolling(window=20).std()
+    df['bb_lower'] = df['bb_middle'] - 2 * df['close'].rolling(window=20).std()
+    
+    # Calculate RSI with proper error handling
+    prices = df['close'].values
+    try:
+        rsi_value = calculate_rsi(prices)
+        if isinstance(rsi_value, (int, float)):
+            df['rsi'] = rsi_value  # Single value for entire series
+        else:
+            df['rsi'] = 50  # Default fallback
+    except Exception as rsi_error:
+        log_error_to_csv(f"RSI calculation failed for {symbol}: {rsi_error}", 
+                       "RSI_ERROR", "fetch_data", "WARNING")
+        df['rsi'] = 50
+    
+    # Calculate MACD with proper error handling
+    try:
+        macd_data = calculate_macd(prices)
+        df['macd'] = macd_data.get('macd', 0)
+        df['macd_signal'] = macd_data.get('signal', 0)
+        df['macd_histogram'] = macd_data.get('histogram', 0)
+        df['macd_trend'] = macd_data.get('trend', 'NEUTRAL')
+    except Exception as macd_error:
+        log_error_to_csv(f"MACD calculation failed for {symbol}: {macd_error}", 
+                       "MACD_ERROR", "fetch_data", "WARNING")
+        df['macd'] = 0
+        df['macd_signal'] = 0
+        df['macd_histogram'] = 0
+        df['macd_trend'] = 'NEUTRAL'
+    
+    # Volatility
+    df['volatility'] = df['close'].pct_change().rolling(window=20).std() * np.sqrt(252)
+    
+    # True Range helpers for ATR and ADX
+    high_low = df['high'] - df['low']
+    high_close = (df['high'] - df['close'].shift()).abs()
+    low_close = (df['low'] - df['close'].shift()).abs()
+    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    df['atr'] = tr.rolling(config.ATR_PERIOD).mean()
+
+    # Stochastic Oscillator %K and %D
+    try:
+        k_period = config.STOCH.get('k_period', 14)
+        d_period = config.STOCH.get('d_period', 3)
+    except Exception:
+        k_period, d_period = 14, 3
+    lowest_low = df['low'].rolling(window=k_period).min()
+    highest_high = df['high'].rolling(window=k_period).max()
+    df['stoch_k'] = np.where(
+        (highest_high - lowest_low) > 0,
+        (df['close'] - lowest_low) / (highest_high - lowest_low) * 100,
+        50
+    )
+    df['stoch_d'] = df['stoch_k'].rolling(window=d_period).mean()
+
+    # VWAP (rolling approximation)
+    try:
+        vwap_window = config.VWAP.get('window', 20)
+    except Exception:
+        vwap_window = 20
+    typical_price = (df['high'] + df['low'] + df['close']) / 3
+    pv = typical_price * df['volume']
+    df['vwap'] = pv.rolling(window=vwap_window).sum() / df['volume'].rolling(window=vwap_window).sum()
+
+    # ADX
+    try:
+        adx_period = config.ADX.get('period', 14)
+    except Exception:
+        adx_period = 14
+    up_move = df['high'].diff()
+    down_move = -df['low'].diff()
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    atr_smooth = tr.rolling(window=adx_period).mean()
+    plus_di = 100 * (pd.Series(plus_dm, index=df.index).rolling(window=adx_period).sum() / atr_smooth)
+    minus_di = 100 * (pd.Series(minus_dm, index=df.index).rolling(window=adx_period).sum() / atr_smooth)
+    dx = (abs(plus_di - minus_di) / (plus_di + minus_di)).replace([np.inf, -np.inf], np.nan) * 100
+    df['adx'] = dx.rolling(window=adx_period).mean()
+    
+    # Volume trend
+    df['volume_sma'] = df['volume'].rolling(20).mean()
+    df['volume_trend'] = df['volume'] / df['volume_sma']
+    
+    return df
+
+_regime_config = getattr(config, 'REGIME', {})
+regime_engine = RegimeEngine(
+    anchor=_regime_config.get('anchor', 'BTCUSDT'),
+    candle_seconds=interval_seconds(_regime_config.get('candle_interval', '5m')),
+    breadth_extreme=_regime_config.get('breadth_extreme', 0.3),
+    breadth_volatile=_regime_config.get('breadth_volatile', 0.4),
+    breadth_quiet=_regime_config.get('breadth_quiet', 0.6),
+    breadth_refresh=_regime_config.get('breadth_refresh_seconds', 3600),
+    clock=clock.time
+)
+
+def _regime_symbols():
+    quote = getattr(config, 'QUOTE_ASSET', 'USDT')
+    symbols = [f"{asset}{quote}" for asset in getattr(config, 'MONITORED_BASE_ASSETS', ['BTC'])]
+    if regime_engine.anchor not in symbols:
+        symbols.insert(0, regime_engine.anchor)
+    return symbols
+
+REGIME_CANDLES = {"1h": HOURS_1H, "5m": CANDLES_5M}
+
+def _regime_pair_frames(symbol):
+    """1h/5m OHLCV for one pair; reuses candles fetched since the last candle close"""
+    since_close = regime_engine.seconds_since_close()
+    df_1h = candle_store.derive(symbol, "1h", HOURS_1H, max_age=since_close)
+    df_5m = candle_store.derive(symbol, "5m", CANDLES_5M, max_age=since_close)
+    if df_1h is None or df_5m is None:
+        prefetch_candles(symbol, REGIME_CANDLES)  # One request per pair
+        df_1h = fetch_klines(symbol, "1h", HOURS_1H)
+        df_5m = fetch_klines(symbol, "5m", CANDLES_5M)
+    if df_1h is not None and df_5m is not None:
+        regime_engine.store_frames(symbol, df_1h, df_5m)
+    return df_1h, df_5m
+
+def regime_fetch_symbols():
+    """Pairs the next regime evaluation requests candles for (none while the result is cached)"""
+    if regime_engine.cached() is not None:
+        return []
+    since_close = regime_engine.seconds_since_close()
+    return [symbol for symbol in regime_engine.due_symbols(_regime_symbols())
+            if not candles_stored(symbol, REGIME_CANDLES, max_age=since_close)]
+
+def _regime_frames():
+    """1h/5m OHLCV per watchlist pair. Only the anchor is refetched after every candle close;
+    breadth pairs are refetched together once their candles are REGIME['breadth_refresh_seconds'] old."""
+    frames = {}
+    for symbol in _regime_symbols():
+        try:
+            frames[symbol] = regime_engine.stored_frames(symbol) or _regime_pair_frames(symbol)
+        except Exception as e:
+            log_error_to_csv(f"Regime data unavailable for {symbol}: {e}", "REGIME_DETECTION", "detect_market_regime", "WARNING")
+    return frames
+
+@metrics.timed('regime')
+def detect_market_regime(force=False):
+    """Professional market regime detection for intelligent timing.
+    Classifies the whole watchlist; the result is reused until the next candle close.
+    """
     try:
+        cached = None if force else regime_engine.cached()
+        if cached is not None:
+            return cached['regime']
+
         print("\n=== Detecting Market Regime ===")
-        
-        # Get multi-timeframe data for regime analysis
-        btc_1h = fetch_data("BTCUSDT", "1h", 48)  # 48 hours
-        btc_5m = fetch_data("BTCUSDT", "5m", 288)  # 24 hours in 5-min candles
-        
-        if btc_1h is None or btc_5m is None or len(btc_1h) < 24 or len(btc_5m) < 144:
+        result = regime_engine.evaluate(_regime_frames())
+        if result is None:
             return 'NORMAL'  # Default regime
         
-        # Calculate market volatility measures
-        hourly_vol = btc_1h['close'].pct_change().rolling(24).std() * np.sqrt(24 * 365)
-        five_min_vol = btc_5m['close'].pct_change().rolling(144).std() * np.sqrt(288 * 365)
-        
-        current_hourly_vol = hourly_vol.iloc[-1] if not pd.isna(hourly_vol.iloc[-1]) else 0.5
-        current_5m_vol = five_min_vol.iloc[-1] if not pd.isna(five_min_vol.iloc[-1]) else 0.5
-        
-        # Volume surge detection
-        avg_volume_1h = btc_1h['volume'].rolling(24).mean().iloc[-1]
-        current_volume_1h = btc_1h['volume'].iloc[-1]
-        volume_surge = current_volume_1h / avg_volume_1h if avg_volume_1h > 0 else 1
-        
-        # Price movement analysis
-        price_change_1h = abs(btc_1h['close'].pct_change().iloc[-1])
-        price_change_24h = abs((btc_1h['close'].iloc[-1] - btc_1h['close'].iloc[-24]) / btc_1h['close'].iloc[-24])
-        
-        # Market regime classification
-        if (current_hourly_vol > 1.5 or current_5m_vol > 2.0 or 
-            volume_surge > 3.0 or price_change_1h > 0.05):
-            regime = 'EXTREME'
-        elif (current_hourly_vol > 0.8 or current_5m_vol > 1.2 or 
-              volume_surge > 2.0 or price_change_1h > 0.03):
-            regime = 'VOLATILE'
-        elif (current_hourly_vol < 0.3 and current_5m_vol < 0.5 and 
-              volume_surge < 1.2 and price_change_1h < 0.01):
-            regime = 'QUIET'
-        else:
-            regime = 'NORMAL'
+        regime = result['regime']
+        breadth = result['breadth']
+        anchor = result['pairs'].get(result['anchor']) or next(iter(result['pairs'].values()))
         
         # Store regime data for analytics
         bot_status['market_regime'] = regime
         bot_status['volatility_metrics'] = {
-            'hourly_vol': current_hourly_vol,
-            'five_min_vol': current_5m_vol,
-            'volume_surge': volume_surge,
-            'price_change_1h': price_change_1h,
-            'price_change_24h': price_change_24h
-        }
-        
-        print(f"Market Regime: {regime}")
-        print(f"Hourly Volatility: {current_hourly_vol:.3f}")
-        print(f"5min Volatility: {current_5m_vol:.3f}")
-        print(f"Volume Surge: {volume_surge:.2f}x")
-        print(f"1h Price Change: {price_change_1h:.3f}")
+            'hourly_vol': anchor['hourly_vol'],
+            'five_min_vol': anchor['five_min_vol'],
+            'volume_surge': anchor['volume_surge'],
+            'price_change_1h': anchor['price_change_1h'],
+            'price_change_24h': anchor['price_change_24h'],
+            'anchor_regime': result['anchor_regime'],
+            'breadth_regime': result['breadth_regime'],
+            'breadth': breadth,
+            'pair_regimes': {symbol: pair['regime'] for symbol, pair in result['pairs'].items()}
+        }
+        
+        print(f"Market Regime: {regime} ({result['anchor']}: {result['anchor_regime']}, breadth: {result['breadth_regime']})")
+        print(f"Hourly Volatility: {anchor['hourly_vol']:.3f}")
+        print(f"5min Volatility: {anchor['five_min_vol']:.3f}")
+        print(f"Volume Surge: {anchor['volume_surge']:.2f}x")
+        print(f"1h Price Change: {anchor['price_change_1h']:.3f}")
+        print(f"Breadth: {breadth['pairs']} pairs, {breadth['extreme_share']:.0%} extreme, "
+              f"{breadth['volatile_share']:.0%} volatile+, {breadth['advancing_share']:.0%} advancing")
         
         return regime
         
@@ -1274,24 +1433,33 @@ def detect_market_regime():
         log_error_to_csv(str(e), "REGIME_DETECTION", "detect_market_regime", "ERROR")
         return 'NORMAL'
 
+BREAKOUT_PAIRS = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT"]  # Restored original 5 symbols
+BREAKOUT_CANDLES = {"5m": 100, "1m": 40}  # Reduced from 144/60
+
+@metrics.timed('breakout_scan')
 def detect_breakout_opportunities():
     """Real-time breakout and momentum opportunity detection with rate limiting"""
     try:
         opportunities = []
-        major_pairs = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT"]  # Restored original 5 symbols
+        major_pairs = BREAKOUT_PAIRS
         
         # Rate limiting between API calls
         breakout_delay = 0.3  # 300ms delay between fetch calls
         
         for symbol in major_pairs:
             try:
-                # Rate limiting before API calls
-                time.sleep(breakout_delay)
+                # Candles already fetched (the asyncio engine prefetches them) need no pause
+                stored = candles_stored(symbol, BREAKOUT_CANDLES)
+                if not stored:
+                    clock.sleep(breakout_delay)  # Rate limiting before API calls
                 
-                # Get short-term data for breakout detection (reduced limits)
+                # Get short-term data for breakout detection (reduced limits);
+                # one 1m request covers both timeframes when resampling is enabled
+                prefetched = stored or prefetch_candles(symbol, BREAKOUT_CANDLES)
                 df_5m = fetch_data(symbol, "5m", 100)  # Reduced from 144 to 100
                 
-                time.sleep(breakout_delay)  # Rate limit between calls
+                if not prefetched:
+                    clock.sleep(breakout_delay)  # Rate limit between calls
                 
                 df_1m = fetch_data(symbol, "1m", 40)   # Reduced from 60 to 40
                 
@@ -1441,6 +1609,11 @@ def calculate_smart_interval():
         log_error_to_csv(str(e), "SMART_INTERVAL", "calculate_smart_interval", "ERROR")
         return 900, 'NORMAL'  # Default fallback
 
+def regime_check_due(current_time):
+    """True when should_scan_now re-evaluates the market regime"""
+    last_regime_check = bot_status.get('last_volatility_check')
+    return not last_regime_check or (current_time - last_regime_check).total_seconds() > 300  # Every 5 minutes
+
 def should_scan_now():
     """Intelligent decision on whether to scan now based on market conditions"""
     try:
@@ -1455,10 +1628,7 @@ def should_scan_now():
             return True, "Scheduled scan time reached"
             
         # Override scheduling for extreme conditions
-        last_regime_check = bot_status.get('last_volatility_check')
-        if (not last_regime_check or 
-            (current_time - last_regime_check).total_seconds() > 300):  # Check regime every 5 minutes
-            
+        if regime_check_due(current_time):
             regime = detect_market_regime()
             bot_status['last_volatility_check'] = current_time
             
@@ -1531,7 +1701,7 @@ def analyze_trading_pairs():
                 # Get sentiment for major coins
                 sentiment = 'neutral'
                 if symbol in ['BTCUSDT', 'ETHUSDT', 'BNBUSDT']:
-                    sentiment = analyze_market_sentiment()
+                    sentiment = analyze_market_sentiment(sentiment_product_for(symbol))
                 
                 # Calculate trend metrics
                 trend_strength = 0
@@ -1946,8 +2116,10 @@ def get_account_balances_summary():
         log_error_to_csv(error_msg, "BALANCE_SUMMARY_ERROR", "get_account_balances_summary", "ERROR")
         return {"error": error_msg}
 
-def check_coin_balance(symbol):
-    """Check if we have sufficient balance to place a SELL order for the given symbol"""
+@metrics.timed('balance_check')
+def check_coin_balance(symbol, account_info=None):
+    """Check if we have sufficient balance to place a SELL order for the given symbol.
+    account_info: a get_account() response to read instead of requesting one"""
     try:
         # Cache to reduce repeated API calls within a short window
         if 'balance_cache' not in bot_status:
@@ -1982,7 +2154,8 @@ def check_coin_balance(symbol):
         print(f"🔍 Checking {base_asset} balance for potential sell order...")
         
         # Get account balances
-        account_info = client.get_account()
+        if account_info is None:
+            account_info = client.get_account()
         asset_balance = 0
         
         for balance in account_info['balances']:
@@ -2029,6 +2202,7 @@ def check_coin_balance(symbol):
         log_error_to_csv(error_msg, "BALANCE_CHECK_ERROR", "check_coin_balance", "ERROR")
         return False, 0, error_msg
 
+@metrics.timed('strategy')
 def signal_generator(df, symbol="BTCUSDT"):
     print("\n=== Generating Trading Signal ===")  # Debug log
     if df is None or len(df) < 30:
@@ -2057,7 +2231,7 @@ def signal_generator(df, symbol="BTCUSDT"):
     else:
         risk_locked = False
     
-    sentiment = analyze_market_sentiment()
+    sentiment = analyze_market_sentiment(sentiment_product_for(symbol))
     
     # Get the latest technical indicators with error handling
     try:
@@ -2305,6 +2479,7 @@ def update_trade_tracking(trade_result, profit_loss=0):
     except Exception as e:
         log_error_to_csv(str(e), "TRACKING_ERROR", "update_trade_tracking", "ERROR")
 
+@metrics.timed('execute_trade')
 def execute_trade(signal, symbol="BTCUSDT", qty=None):
     print("\n=== Trade Execution Debug Log ===")
     print(f"Attempting trade: {signal} for {symbol}")
@@ -2531,9 +2706,10 @@ def execute_trade(signal, symbol="BTCUSDT", qty=None):
             bot_status['daily_loss'] = bot_status.get('daily_loss', 0.0) + (-revenue if revenue < 0 else 0.0)
 
         # Update trade history (keep last 10 trades)
-        bot_status['trading_summary']['trades_history'].insert(0, trade_info)
-        if len(bot_status['trading_summary']['trades_history']) > 10:
-            bot_status['trading_summary']['trades_history'].pop()
+        with bot_status.lock:
+            bot_status['trading_summary']['trades_history'].insert(0, trade_info)
+            if len(bot_status['trading_summary']['trades_history']) > 10:
+                bot_status['trading_summary']['trades_history'].pop()
 
         # Log real trade to CSV
         try:
@@ -2595,7 +2771,7 @@ def execute_trade(signal, symbol="BTCUSDT", qty=None):
         trade_info['status'] = 'api_error'
         bot_status['trading_summary']['failed_trades'] += 1
         bot_status['trading_summary']['trades_history'].insert(0, trade_info)
-        bot_status['errors'].append(str(e))
+        bot_status['errors'].append(str(e), "TRADE_API_ERROR")
 
         # Update smart trade tracking for failed trades
         update_trade_tracking('failed', -1)
@@ -2621,26 +2797,158 @@ def execute_trade(signal, symbol="BTCUSDT", qty=None):
 
         return f"Order failed: {str(e)}"
 
-def scan_trading_pairs(base_assets=None, quote_asset="USDT", min_volume_usdt=1000000):
-    """Smart multi-coin scanner for best trading opportunities with rate limiting"""
-    opportunities = []
-    
-    # Default assets if none provided
-    if base_assets is None:
-        base_assets = ["BTC", "ETH", "BNB", "XRP", "SOL", "MATIC", "DOT", "ADA", "AVAX", "LINK"]  # Restored original 10 symbols
-    
-    # Add rate limiting to prevent API ban
-    scan_delay = 0.5  # 500ms delay between API calls
-    
-    for base in base_assets:
-        try:
-            symbol = f"{base}{quote_asset}"
-            
-            # Rate limiting - wait before each API call
-            time.sleep(scan_delay)
-            
-            # Get 24h ticker statistics
-            ticker = client.get_ticker(symbol=symbol)
+DEFAULT_SCAN_ASSETS = ["BTC", "ETH", "BNB", "XRP", "SOL", "MATIC", "DOT", "ADA", "AVAX", "LINK"]  # Restored original 10 symbols
+
+def score_opportunity(symbol, df, volume_usdt, price_change_pct, min_volume_usdt, balance=None):
+    """Score one scanned pair (0-100) from its 1h candles and 24h ticker; None if indicators are unusable.
+    balance: (has_balance, amount, message) as returned by check_coin_balance, looked up when omitted"""
+    # Calculate technical indicators with proper error handling
+    current_price = float(df['close'].iloc[-1])
+
+    # Get RSI - it should already be calculated in fetch_data
+    if 'rsi' in df.columns and not pd.isna(df['rsi'].iloc[-1]):
+        current_rsi = float(df['rsi'].iloc[-1])
+    else:
+        # Fallback calculation
+        prices = df['close'].values
+        current_rsi = calculate_rsi(prices, period=14)
+
+    # Get MACD trend - it should already be calculated in fetch_data  
+    if 'macd_trend' in df.columns and not pd.isna(df['macd_trend'].iloc[-1]):
+        macd_trend = df['macd_trend'].iloc[-1]
+    else:
+        # Fallback calculation
+        prices = df['close'].values
+        macd_result = calculate_macd(prices)
+        macd_trend = macd_result.get('trend', 'NEUTRAL')
+
+    # Get SMA values with error handling
+    try:
+        sma_fast = calculate_sma(df, period=10)
+        sma_slow = calculate_sma(df, period=20)
+
+        if len(sma_fast) == 0 or len(sma_slow) == 0:
+            return None  # Skip if we can't calculate SMAs
+
+        sma_fast_value = float(sma_fast.iloc[-1])
+        sma_slow_value = float(sma_slow.iloc[-1])
+    except Exception as sma_error:
+        log_error_to_csv(f"SMA calculation error for {symbol}: {sma_error}", 
+                       "SMA_ERROR", "scan_trading_pairs", "WARNING")
+        return None
+
+    # Score the opportunity (0-100)
+    opportunity_score = 0
+    signals = []
+
+    # Check if we have balance for this coin (for potential sell signals)
+    has_balance, available_balance, balance_msg = balance if balance is not None else check_coin_balance(symbol)
+    can_sell = has_balance and available_balance > 0
+
+    # RSI scoring with balance-aware adjustments
+    if current_rsi < 30:  # Oversold - good for buying
+        opportunity_score += 30
+        signals.append("RSI_OVERSOLD")
+    elif current_rsi > 70:  # Overbought - good for selling if we have balance
+        if can_sell:
+            opportunity_score += 25  # Higher score if we can actually sell
+            signals.append("RSI_OVERBOUGHT_SELLABLE")
+        else:
+            opportunity_score += 5  # Lower score if we can't sell
+            signals.append("RSI_OVERBOUGHT_NO_BALANCE")
+    elif 45 <= current_rsi <= 55:  # Neutral zone
+        opportunity_score += 10
+        signals.append("RSI_NEUTRAL")
+
+    # MACD scoring with balance awareness
+    if macd_trend == "BULLISH":
+        opportunity_score += 20
+        signals.append("MACD_BULLISH")
+    elif macd_trend == "BEARISH":
+        if can_sell:
+            opportunity_score += 15  # Bearish trend good for selling if we have balance
+            signals.append("MACD_BEARISH_SELLABLE")
+        else:
+            signals.append("MACD_BEARISH_NO_BALANCE")
+
+    # Price momentum scoring
+    if abs(price_change_pct) > 5:  # High volatility
+        opportunity_score += 15
+        signals.append("HIGH_VOLATILITY")
+
+    # Volume scoring
+    if volume_usdt > min_volume_usdt * 5:  # Very high volume
+        opportunity_score += 15
+        signals.append("HIGH_VOLUME")
+
+    # SMA trend scoring with balance considerations
+    if current_price > sma_fast_value > sma_slow_value:
+        opportunity_score += 10
+        signals.append("UPTREND")
+    elif current_price < sma_fast_value < sma_slow_value:
+        if can_sell:
+            opportunity_score += 15  # Downtrend good for selling if we have balance
+            signals.append("DOWNTREND_SELLABLE")
+        else:
+            opportunity_score += 5  # Lower score if we can't sell
+            signals.append("DOWNTREND_NO_BALANCE")
+
+    return ScanOpportunity(
+        symbol=symbol,
+        score=opportunity_score,
+        price=current_price,
+        volume_usdt=volume_usdt,
+        price_change_pct=price_change_pct,
+        rsi=current_rsi,
+        macd_trend=macd_trend,
+        sma_fast=sma_fast_value,
+        sma_slow=sma_slow_value,
+        has_balance=can_sell,
+        available_balance=available_balance if has_balance else 0,
+        balance_msg=balance_msg,
+        signals=signals,
+        candles=candle_store.put(symbol, "1h", df)  # Full series stays in the bounded candle store
+    )
+
+def rank_opportunities(opportunities):
+    """Sort scan results by score (in place) and print the top five"""
+    # Sort by opportunity score (highest first)
+    opportunities.sort(key=lambda x: x.score, reverse=True)
+    
+    # Log top opportunities with balance information
+    if opportunities:
+        print(f"\n=== Top Trading Opportunities ===")
+        for i, opp in enumerate(opportunities[:5]):  # Show top 5
+            balance_status = "✅" if opp.has_balance else "❌"
+            balance_amount = f"{opp.available_balance:.4f}" if opp.has_balance else "0"
+            
+            print(f"{i+1}. {opp.symbol}: Score {opp.score}, RSI {opp.rsi:.1f}, "
+                  f"Change {opp.price_change_pct:.2f}%, Balance: {balance_status}({balance_amount}), "
+                  f"Signals: {', '.join(opp.signals)}")
+    
+    return opportunities
+
+@metrics.timed('pair_scan')
+def scan_trading_pairs(base_assets=None, quote_asset="USDT", min_volume_usdt=1000000):
+    """Smart multi-coin scanner for best trading opportunities with rate limiting"""
+    opportunities = []
+    
+    # Default assets if none provided
+    if base_assets is None:
+        base_assets = DEFAULT_SCAN_ASSETS
+    
+    # Add rate limiting to prevent API ban
+    scan_delay = 0.5  # 500ms delay between API calls
+    
+    for base in base_assets:
+        try:
+            symbol = f"{base}{quote_asset}"
+            
+            # Rate limiting - wait before each API call
+            clock.sleep(scan_delay)
+            
+            # Get 24h ticker statistics
+            ticker = client.get_ticker(symbol=symbol)
             volume_usdt = float(ticker['quoteVolume'])
             price_change_pct = float(ticker['priceChangePercent'])
             
@@ -2649,166 +2957,26 @@ def scan_trading_pairs(base_assets=None, quote_asset="USDT", min_volume_usdt=100
                 continue
             
             # Rate limiting before data fetch
-            time.sleep(scan_delay)
+            clock.sleep(scan_delay)
             
             # Fetch market data with smaller limit to reduce API weight
             df = fetch_data(symbol=symbol, limit=30)  # Reduced from 50 to 30
             if df is None or len(df) < 15:  # Reduced minimum from 20 to 15
                 continue
             
-            # Calculate technical indicators with proper error handling
-            current_price = float(df['close'].iloc[-1])
-            
-            # Get RSI - it should already be calculated in fetch_data
-            if 'rsi' in df.columns and not pd.isna(df['rsi'].iloc[-1]):
-                current_rsi = float(df['rsi'].iloc[-1])
-            else:
-                # Fallback calculation
-                prices = df['close'].values
-                current_rsi = calculate_rsi(prices, period=14)
-            
-            # Get MACD trend - it should already be calculated in fetch_data  
-            if 'macd_trend' in df.columns and not pd.isna(df['macd_trend'].iloc[-1]):
-                macd_trend = df['macd_trend'].iloc[-1]
-            else:
-                # Fallback calculation
-                prices = df['close'].values
-                macd_result = calculate_macd(prices)
-                macd_trend = macd_result.get('trend', 'NEUTRAL')
-            
-            # Get SMA values with error handling
-            try:
-                sma_fast = calculate_sma(df, period=10)
-                sma_slow = calculate_sma(df, period=20)
-                
-                if len(sma_fast) == 0 or len(sma_slow) == 0:
-                    continue  # Skip if we can't calculate SMAs
-                    
-                sma_fast_value = float(sma_fast.iloc[-1])
-                sma_slow_value = float(sma_slow.iloc[-1])
-            except Exception as sma_error:
-                log_error_to_csv(f"SMA calculation error for {symbol}: {sma_error}", 
-                               "SMA_ERROR", "scan_trading_pairs", "WARNING")
-                continue
-            
-            # Score the opportunity (0-100)
-            opportunity_score = 0
-            signals = []
-            
-            # Check if we have balance for this coin (for potential sell signals)
-            has_balance, available_balance, balance_msg = check_coin_balance(symbol)
-            can_sell = has_balance and available_balance > 0
-            
-            # RSI scoring with balance-aware adjustments
-            if current_rsi < 30:  # Oversold - good for buying
-                opportunity_score += 30
-                signals.append("RSI_OVERSOLD")
-            elif current_rsi > 70:  # Overbought - good for selling if we have balance
-                if can_sell:
-                    opportunity_score += 25  # Higher score if we can actually sell
-                    signals.append("RSI_OVERBOUGHT_SELLABLE")
-                else:
-                    opportunity_score += 5  # Lower score if we can't sell
-                    signals.append("RSI_OVERBOUGHT_NO_BALANCE")
-            elif 45 <= current_rsi <= 55:  # Neutral zone
-                opportunity_score += 10
-                signals.append("RSI_NEUTRAL")
-            
-            # MACD scoring with balance awareness
-            if macd_trend == "BULLISH":
-                opportunity_score += 20
-                signals.append("MACD_BULLISH")
-            elif macd_trend == "BEARISH":
-                if can_sell:
-                    opportunity_score += 15  # Bearish trend good for selling if we have balance
-                    signals.append("MACD_BEARISH_SELLABLE")
-                else:
-                    signals.append("MACD_BEARISH_NO_BALANCE")
-            
-            # Price momentum scoring
-            if abs(price_change_pct) > 5:  # High volatility
-                opportunity_score += 15
-                signals.append("HIGH_VOLATILITY")
-            
-            # Volume scoring
-            if volume_usdt > min_volume_usdt * 5:  # Very high volume
-                opportunity_score += 15
-                signals.append("HIGH_VOLUME")
-            
-            # SMA trend scoring with balance considerations
-            if current_price > sma_fast_value > sma_slow_value:
-                opportunity_score += 10
-                signals.append("UPTREND")
-            elif current_price < sma_fast_value < sma_slow_value:
-                if can_sell:
-                    opportunity_score += 15  # Downtrend good for selling if we have balance
-                    signals.append("DOWNTREND_SELLABLE")
-                else:
-                    opportunity_score += 5  # Lower score if we can't sell
-                    signals.append("DOWNTREND_NO_BALANCE")
-            
-            # Add balance information to the opportunity
-            balance_info = {
-                'has_balance': can_sell,
-                'available_balance': available_balance if has_balance else 0,
-                'balance_msg': balance_msg
-            }
-            
-            opportunities.append({
-                'symbol': symbol,
-                'score': opportunity_score,
-                'price': current_price,
-                'volume_usdt': volume_usdt,
-                'price_change_pct': price_change_pct,
-                'rsi': current_rsi,
-                'macd_trend': macd_trend,
-                'signals': signals,
-                'balance_info': balance_info,  # Add balance information
-                'data': df  # Include data for immediate analysis if selected
-            })
+            opportunity = score_opportunity(symbol, df, volume_usdt, price_change_pct, min_volume_usdt)
+            if opportunity is not None:
+                opportunities.append(opportunity)
             
         except Exception as e:
             log_error_to_csv(f"Error scanning {base}{quote_asset}: {e}", 
                            "SCAN_ERROR", "scan_trading_pairs", "WARNING")
             continue
     
-    # Sort by opportunity score (highest first)
-    opportunities.sort(key=lambda x: x['score'], reverse=True)
-    
-    # Log top opportunities with balance information
-    if opportunities:
-        print(f"\n=== Top Trading Opportunities ===")
-        for i, opp in enumerate(opportunities[:5]):  # Show top 5
-            balance_status = "✅" if opp['balance_info']['has_balance'] else "❌"
-            balance_amount = f"{opp['balance_info']['available_balance']:.4f}" if opp['balance_info']['has_balance'] else "0"
-            
-            print(f"{i+1}. {opp['symbol']}: Score {opp['score']}, RSI {opp['rsi']:.1f}, "
-                  f"Change {opp['price_change_pct']:.2f}%, Balance: {balance_status}({balance_amount}), "
-                  f"Signals: {', '.join(opp['signals'])}")
-    
-    return opportunities
+    return rank_opportunities(opportunities)
 
-def trading_loop():
-    """Professional AI Trading Wolf - Intelligent Timing and Opportunity Hunting"""
-    bot_status['running'] = True
-    bot_status['signal_scanning_active'] = True  # Activate signal scanning
-    consecutive_errors = 0
-    max_consecutive_errors = 5
-    error_sleep_time = 60  # Start with 1 minute on errors
-    
-    print("\n🐺 === AI TRADING WOLF ACTIVATED ===")
-    print("🎯 Professional timing system engaged")
-    print("📊 Market regime detection online")
-    print("⚡ Breakout opportunity scanning active")
-    print("📡 Signal scanning activated")
-    print("\n🛡️ === RATE LIMITING ACTIVE ===")
-    print("⏱️ Global signal cooldown: 45 seconds between ANY signals")
-    print("🔒 Symbol signal cooldown: 90 seconds per symbol")
-    print("🚫 Signal type cooldown: 180 seconds for same signal type")
-    print("📊 Scan cycle limit: 1 signal per scanning cycle")
-    print("🕒 BTC fallback cooldown: 60 seconds")
-    print("=" * 50)
-    
+def prepare_trading_session():
+    """Reset per-session state before a trading loop starts; False if the API client cannot connect"""
     # Initialize trading summary if not exists
     if 'trading_summary' not in bot_status:
         bot_status['trading_summary'] = {
@@ -2822,24 +2990,376 @@ def trading_loop():
             'average_trade_size': 0.0,
             'trades_history': []
         }
-    
+
     # Ensure API client is initialized (should already be done at startup)
     if not bot_status.get('api_connected', False):
         print("⚠️ API client not connected at trading loop start - attempting reconnection...")
         initialize_client()
         if not bot_status.get('api_connected', False):
             log_error_to_csv("API client not initialized before trading loop start", "CLIENT_ERROR", "trading_loop", "ERROR")
-            time.sleep(10)  # Wait longer before giving up
-            return  # Exit trading loop if can't connect
+            clock.sleep(10)  # Wait longer before giving up
+            return False  # Exit trading loop if can't connect
 
     # Initialize multi-coin tracking and regime detection
     bot_status['monitored_pairs'] = {}
     bot_status['market_regime'] = 'NORMAL'
     bot_status['hunting_mode'] = False
     bot_status['last_daily_summary'] = None  # Track when we last sent daily summary
+    return True
+
+def decay_consecutive_losses(current_time):
+    """Safety: decay consecutive losses after a cooldown period (e.g., 2 hours without trades)"""
+    try:
+        last_trade_time = None
+        if bot_status.get('trading_summary', {}).get('trades_history'):
+            last_trade = bot_status['trading_summary']['trades_history'][0]
+            last_trade_time = last_trade.get('timestamp')
+        if last_trade_time:
+            # Parse time if string
+            if isinstance(last_trade_time, str):
+                try:
+                    last_trade_dt = datetime.fromisoformat(last_trade_time.replace('Z', '+00:00'))
+                except Exception:
+                    last_trade_dt = current_time
+            else:
+                last_trade_dt = last_trade_time
+            if (current_time - last_trade_dt).total_seconds() > 2 * 3600:
+                # Gradually reduce penalties
+                bot_status['consecutive_losses'] = max(0, bot_status.get('consecutive_losses', 0) - 1)
+        # Hard cap to avoid indefinite lockout
+        bot_status['consecutive_losses'] = min(bot_status.get('consecutive_losses', 0), config.MAX_CONSECUTIVE_LOSSES)
+    except Exception:
+        pass
+
+def process_opportunities(opportunities):
+    """Analyze the top scan opportunity (or the BTCUSDT fallback) and execute its signal if risk checks pass"""
+    if not opportunities:
+        print("😴 No significant opportunities found - Wolf resting")
+
+        # Fallback to default pair (only if not already processed)
+        current_symbol = "BTCUSDT"
+
+        # Check if BTCUSDT was already processed in recent scan (within last 60 seconds)
+        last_btc_scan = bot_status.get('last_btc_scan_time')
+        current_time = get_cairo_time()
+
+        if (last_btc_scan is None or 
+            (current_time - last_btc_scan).total_seconds() > 60):
+
+            df = fetch_data(symbol=current_symbol, interval="5m", limit=100)
+            if df is not None:
+                signal = signal_generator(df, current_symbol)
+                current_price = float(df['close'].iloc[-1])
+
+                bot_status.update({
+                    'current_symbol': current_symbol,
+                    'last_signal': signal,
+                    'last_price': current_price,
+                    'last_update': format_cairo_time(),
+                    'rsi': float(df['rsi'].iloc[-1]),
+                    'macd': {
+                        'macd': float(df['macd'].iloc[-1]),
+                        'signal': float(df['macd_signal'].iloc[-1]),
+                        'trend': df['macd_trend'].iloc[-1]
+                    },
+                    'last_btc_scan_time': current_time  # Track when we last scanned BTC
+                })
+                print(f"📊 Default analysis: {signal} for {current_symbol}")
+        else:
+            print(f"⚠️ Skipping default {current_symbol} scan - analyzed recently")
+    else:
+        print(f"🎯 Found {len(opportunities)} hunting targets")
+
+        # Process top opportunities with intelligent prioritization
+        max_targets = 1  # Limit to 1 target per cycle to prevent signal flooding
+        processed_symbols = set()  # Track processed symbols to avoid duplicates
+        signals_generated_this_cycle = 0  # Track signals in this cycle
+
+        for i, opportunity in enumerate(opportunities[:max_targets]):
+            current_symbol = opportunity['symbol']
+            current_score = opportunity.get('score', 0)
+
+            # Skip if we've already processed this symbol in this cycle
+            if current_symbol in processed_symbols:
+                print(f"⚠️ Skipping {current_symbol} - already processed in this cycle")
+                continue
+            processed_symbols.add(current_symbol)
+
+            # Limit signals per cycle
+            if signals_generated_this_cycle >= 1:
+                print(f"🛑 Signal limit reached for this cycle - skipping remaining opportunities")
+                break
+
+            print(f"\n🎯 === TARGET {i+1}: {current_symbol} ===")
+            print(f"💪 Score: {current_score:.1f}")
+
+            # Get fresh data for analysis
+            interval = "1m" if bot_status.get('hunting_mode') else "5m"
+            df = fetch_data(symbol=current_symbol, interval=interval, limit=100)
+
+            if df is None:
+                continue
+
+            # Enhanced signal generation with market regime consideration
+            signal = signal_generator(df, current_symbol)
+            signals_generated_this_cycle += 1  # Track signals generated in this cycle
+            current_price = float(df['close'].iloc[-1])
+
+            print(f"🚦 Signal: {signal} (#{signals_generated_this_cycle} this cycle)")
+            print(f"💰 Price: ${current_price:.4f}")
+
+            if 'rsi' in opportunity:
+                print(f"📈 RSI: {opportunity['rsi']:.1f}")
+            if 'signals' in opportunity:
+                print(f"⚡ Triggers: {', '.join(opportunity['signals'])}")
+
+            # Update pair tracking
+            with bot_status.lock:
+                if current_symbol not in bot_status['monitored_pairs']:
+                    bot_status['monitored_pairs'][current_symbol] = {
+                        'last_signal': 'HOLD',
+                        'last_price': 0,
+                        'rsi': 50,
+                        'macd': {'macd': 0, 'signal': 0, 'trend': 'NEUTRAL'},
+                        'sentiment': 'neutral',
+                        'total_trades': 0,
+                        'successful_trades': 0,
+                        'last_trade_time': None
+                    }
+
+                bot_status['monitored_pairs'][current_symbol].update({
+                    'last_signal': signal,
+                    'last_price': current_price,
+                    'rsi': float(df['rsi'].iloc[-1]),
+                    'macd': {'trend': df['macd_trend'].iloc[-1]},
+                    'last_update': format_cairo_time(),
+                    'opportunity_score': current_score
+                })
+
+            # Update main status with best target
+            if i == 0:
+                bot_status.update({
+                    'current_symbol': current_symbol,
+                    'last_signal': signal,
+                    'last_price': current_price,
+                    'last_update': format_cairo_time(),
+                    'rsi': float(df['rsi'].iloc[-1]),
+                    'macd': {'trend': df['macd_trend'].iloc[-1]},
+                    'opportunity_score': current_score
+                })
+
+            # Execute trade with enhanced conditions
+            if signal in ["BUY", "SELL"]:
+                # Initialize risk tracking if not present
+                if 'consecutive_losses' not in bot_status:
+                    bot_status['consecutive_losses'] = 0
+                if 'daily_loss' not in bot_status:
+                    bot_status['daily_loss'] = 0.0
+
+                # Risk management checks with debug logging
+                consecutive_losses = bot_status.get('consecutive_losses', 0)
+                daily_loss = bot_status.get('daily_loss', 0.0)
+
+                print(f"🔍 Risk Management Check:")
+                print(f"   Consecutive losses: {consecutive_losses}/{config.MAX_CONSECUTIVE_LOSSES}")
+                print(f"   Daily loss: ${daily_loss:.2f}/${config.MAX_DAILY_LOSS}")
+                print(f"   API Connected: {bot_status.get('api_connected', False)}")
+                print(f"   Can Trade (Account): {bot_status.get('can_trade', False)}")
+
+                can_trade = (
+                    consecutive_losses < config.MAX_CONSECUTIVE_LOSSES and
+                    daily_loss < config.MAX_DAILY_LOSS and
+                    bot_status.get('api_connected', False) and
+                    bot_status.get('can_trade', False)
+                )
+
+                # Additional hunting mode conditions
+                if bot_status.get('hunting_mode'):
+                    can_trade = can_trade and current_score >= 50  # Higher threshold in hunting mode
+                    print(f"   Hunting mode score: {current_score}/50")
+
+                if can_trade:
+                    print(f"🚀 EXECUTING {signal} for {current_symbol}")
+                    result = execute_trade(signal, current_symbol)
+                    print(f"📊 Result: {result}")
+
+                    # Update tracking
+                    bot_status['monitored_pairs'][current_symbol]['total_trades'] += 1
+                    if "executed" in str(result).lower():
+                        bot_status['monitored_pairs'][current_symbol]['successful_trades'] += 1
+
+                    # In hunting mode, only take the best trade
+                    if bot_status.get('hunting_mode'):
+                        break
+                else:
+                    print(f"🛑 Trade blocked by risk management")
+                    print(f"   Consecutive losses: {consecutive_losses}/{config.MAX_CONSECUTIVE_LOSSES}")
+                    print(f"   Daily loss: ${daily_loss:.2f}/${config.MAX_DAILY_LOSS}")
+                    print(f"   API Connected: {bot_status.get('api_connected', False)}")
+                    print(f"   Account Can Trade: {bot_status.get('can_trade', False)}")
+                    if bot_status.get('hunting_mode'):
+                        print(f"   Hunting mode score: {current_score}/50")
+
+def send_periodic_reports(current_time, last_major_scan):
+    """Hourly Telegram market update and the 08:00 Cairo daily summary/performance row"""
+    # Send periodic Telegram market updates (every hour)
+    if TELEGRAM_AVAILABLE and (current_time - last_major_scan).total_seconds() > 3600:
+        try:
+            volatility_metrics = bot_status.get('volatility_metrics', {})
+            next_scan_str = format_cairo_time(bot_status['next_signal_time'])
+            notify_market_update(
+                bot_status.get('market_regime', 'NORMAL'),
+                bot_status.get('hunting_mode', False),
+                next_scan_str,
+                volatility_metrics
+            )
+        except Exception as telegram_error:
+            print(f"Telegram market update failed: {telegram_error}")
+
+    # Send daily summary each day at 08:00 Cairo time (once per day) and log daily performance for the previous day
+    if config.TELEGRAM.get('notifications', {}).get('daily_summary', True):
+        try:
+            last_summary_date = bot_status.get('last_daily_summary')
+            current_date = current_time.strftime('%Y-%m-%d')
+            # Trigger within the first 15 minutes after 08:00 to allow for scheduling jitter
+            if (current_time.hour == 8 and current_time.minute < 15 and
+                (last_summary_date != current_date)):
+                # First, write yesterday's performance row to CSV
+                yesterday = (current_time - timedelta(days=1)).replace(hour=12, minute=0, second=0, microsecond=0)
+                log_daily_performance(yesterday)
+                # Then, send Telegram daily summary if Telegram is available
+                if TELEGRAM_AVAILABLE:
+                    notify_daily_summary(bot_status.get('trading_summary', {}))
+                bot_status['last_daily_summary'] = current_date
+                print(f"📊 Daily performance logged and summary processed for {current_date} (08:00 Cairo)")
+        except Exception as telegram_error:
+            print(f"Daily summary notification failed: {telegram_error}")
+
+class ScanPolicy:
+    """Which scans a trading cycle runs; shared by trading_loop and the asyncio engine,
+    which only differ in how they fetch"""
+
+    REGIME_REFRESH_SECONDS = 1800  # Re-detect the regime every 30 minutes
+    FULL_SCAN_SECONDS = 3600  # Force a full scan every hour
+    MAX_QUICK_SCANS = 5  # Breakout-only cycles before a full scan
+
+    def __init__(self, now):
+        self.last_major_scan = now
+        self.quick_scan_count = 0
+
+    def regime_refresh_due(self, current_time):
+        """True (and starts a new major period) when the regime should be re-detected"""
+        if (current_time - self.last_major_scan).total_seconds() > self.REGIME_REFRESH_SECONDS:
+            self.last_major_scan = current_time
+            self.quick_scan_count = 0
+            return True
+        return False
+
+    def breakout_scan_due(self):
+        """Quick breakout scan in hunting mode or volatile markets"""
+        if bot_status.get('hunting_mode') or bot_status.get('market_regime') in ['VOLATILE', 'EXTREME']:
+            self.quick_scan_count += 1
+            return True
+        return False
+
+    def full_scan_due(self, current_time, breakout_opportunities):
+        """Full market scan unless fresh breakout results can be used"""
+        if breakout_opportunities:
+            print(f"🚀 BREAKOUT OPPORTUNITIES DETECTED:")
+            for opp in breakout_opportunities[:2]:
+                print(f"   💎 {opp['symbol']}: Score {opp['score']}, Signals: {', '.join(opp['signals'])}")
+        full_scan = (
+            not breakout_opportunities or  # No breakouts found
+            self.quick_scan_count >= self.MAX_QUICK_SCANS or  # Max quick scans reached
+            (current_time - self.last_major_scan).total_seconds() > self.FULL_SCAN_SECONDS
+        )
+        if full_scan:
+            print("🔍 Performing FULL MARKET SCAN")
+            self.quick_scan_count = 0
+        else:
+            print("⚡ Using BREAKOUT SCAN results")
+        return full_scan
+
+MAX_CONSECUTIVE_ERRORS = 5
+ERROR_SLEEP_SECONDS = 60  # Start with 1 minute on errors
+
+def announce_trading_loop(engine_label=""):
+    print(f"\n🐺 === AI TRADING WOLF ACTIVATED{engine_label} ===")
+    print("🎯 Professional timing system engaged")
+    print("📊 Market regime detection online")
+    print("⚡ Breakout opportunity scanning active")
+    print("📡 Signal scanning activated")
+    print("\n🛡️ === RATE LIMITING ACTIVE ===")
+    print("⏱️ Global signal cooldown: 45 seconds between ANY signals")
+    print("🔒 Symbol signal cooldown: 90 seconds per symbol")
+    print("🚫 Signal type cooldown: 180 seconds for same signal type")
+    print("📊 Scan cycle limit: 1 signal per scanning cycle")
+    print("🕒 BTC fallback cooldown: 60 seconds")
+    print("=" * 50)
+
+def announce_scan(scan_reason, title="WOLF SCANNING ACTIVATED"):
+    print(f"\n🐺 === {title} ===")
+    print(f"🕒 Time: {format_cairo_time()}")
+    print(f"🎯 Scan Reason: {scan_reason}")
+    print(f"📊 Market Regime: {bot_status.get('market_regime', 'NORMAL')}")
+    print(f"⚡ Hunting Mode: {'ON' if bot_status.get('hunting_mode') else 'OFF'}")
+
+def schedule_next_scan(next_interval=None, next_mode=None):
+    """Set next_signal_time from the smart interval; returns the interval in seconds"""
+    if next_interval is None:
+        next_interval, next_mode = calculate_smart_interval()
+    bot_status['next_signal_time'] = get_cairo_time() + timedelta(seconds=next_interval)
+    bot_status['signal_interval'] = next_interval
+    if next_mode:
+        print(f"\n🎯 Next scan: {next_mode} mode in {next_interval}s ({next_interval/60:.1f}min)")
+    print(f"📅 Expected at: {format_cairo_time(bot_status['next_signal_time'])}")
+    return next_interval
+
+def reconnect_client():
+    """Reinitialize a lost API connection; False if it is still down"""
+    print("🔄 API connection lost - attempting to reconnect...")
+    initialize_client()
+    if not bot_status['api_connected']:
+        print("❌ Failed to reconnect to API - retrying in next cycle")
+        return False
+    return True
+
+def handle_trading_loop_error(e, consecutive_errors, log_error=None):
+    """Record a failed trading cycle; seconds to back off before retrying, or None once the loop should stop"""
+    error_msg = f"Trading wolf error (attempt {consecutive_errors}/{MAX_CONSECUTIVE_ERRORS}): {e}"
+    print(f"⚠️ {error_msg}")
+    
+    # Log error to CSV
+    (log_error or log_error_to_csv)(str(e), "TRADING_LOOP_ERROR", "trading_loop", "ERROR")
+    
+    # Update bot status
+    bot_status['errors'].append(error_msg, "TRADING_LOOP_ERROR")
+    bot_status['last_error'] = error_msg
+    bot_status['last_update'] = format_cairo_time()
+    
+    if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+        print(f"💀 Maximum errors reached ({MAX_CONSECUTIVE_ERRORS}). Wolf hibernating.")
+        bot_status['running'] = False
+        bot_status['status'] = 'stopped_due_to_errors'
+        return None
+    
+    # Smart error recovery with exponential backoff
+    sleep_time = min(ERROR_SLEEP_SECONDS * (2 ** (consecutive_errors - 1)), 300)  # Max 5 minutes
+    print(f"😴 Wolf resting for {sleep_time} seconds before retry...")
+    return sleep_time
+
+def trading_loop():
+    """Professional AI Trading Wolf - Intelligent Timing and Opportunity Hunting"""
+    bot_status['running'] = True
+    bot_status['signal_scanning_active'] = True  # Activate signal scanning
+    consecutive_errors = 0
     
+    announce_trading_loop()
+    if not prepare_trading_session():
+        return
+
     # Initial market regime detection and IMMEDIATE first scan
-    initial_regime = detect_market_regime()
+    detect_market_regime()
     # Mark last regime check now to avoid immediate duplicate checks
     bot_status['last_volatility_check'] = get_cairo_time()
     initial_interval, initial_mode = calculate_smart_interval()
@@ -2849,10 +3369,7 @@ def trading_loop():
     
     # Perform immediate first scan
     try:
-        print(f"\n🐺 === WOLF SCANNING ACTIVATED (STARTUP) ===")
-        print(f"🕒 Time: {format_cairo_time()}")
-        print(f"🎯 Scan Reason: STARTUP_SCAN")
-        print(f"📊 Market Regime: {bot_status.get('market_regime', 'NORMAL')}")
+        announce_scan("STARTUP_SCAN", "WOLF SCANNING ACTIVATED (STARTUP)")
         
         # Scan all trading pairs immediately (restored to original scan)
         scan_results = scan_trading_pairs()  # Uses default 10 symbols
@@ -2863,310 +3380,63 @@ def trading_loop():
         print(f"⚠️ Startup scan failed: {e}")
     
     # Set next scan time after immediate scan
-    bot_status['next_signal_time'] = get_cairo_time() + timedelta(seconds=initial_interval)
-    bot_status['signal_interval'] = initial_interval
-    print(f"📅 Next scan: {format_cairo_time(bot_status['next_signal_time'])}")
-    
-    last_major_scan = get_cairo_time()
-    quick_scan_count = 0
+    schedule_next_scan(initial_interval)
+    scan_policy = ScanPolicy(get_cairo_time())
     
     while bot_status['running']:
         try:
+            cycle_started = time.perf_counter()
             current_time = get_cairo_time()
 
-            # Safety: decay consecutive losses after cooldown period (e.g., 2 hours without trades)
-            try:
-                last_trade_time = None
-                if bot_status.get('trading_summary', {}).get('trades_history'):
-                    last_trade = bot_status['trading_summary']['trades_history'][0]
-                    last_trade_time = last_trade.get('timestamp')
-                if last_trade_time:
-                    # Parse time if string
-                    if isinstance(last_trade_time, str):
-                        try:
-                            last_trade_dt = datetime.fromisoformat(last_trade_time.replace('Z', '+00:00'))
-                        except Exception:
-                            last_trade_dt = current_time
-                    else:
-                        last_trade_dt = last_trade_time
-                    if (current_time - last_trade_dt).total_seconds() > 2 * 3600:
-                        # Gradually reduce penalties
-                        bot_status['consecutive_losses'] = max(0, bot_status.get('consecutive_losses', 0) - 1)
-                # Hard cap to avoid indefinite lockout
-                bot_status['consecutive_losses'] = min(bot_status.get('consecutive_losses', 0), config.MAX_CONSECUTIVE_LOSSES)
-            except Exception:
-                pass
+            decay_consecutive_losses(current_time)
             
             # Health check - only reinitialize if connection is actually lost
-            if not bot_status['api_connected']:
-                print("🔄 API connection lost - attempting to reconnect...")
-                initialize_client()
-                if not bot_status['api_connected']:
-                    print("❌ Failed to reconnect to API - retrying in next cycle")
-                    time.sleep(30)  # Wait before retrying
-                    continue
+            if not bot_status['api_connected'] and not reconnect_client():
+                clock.sleep(30)  # Wait before retrying
+                continue
             
             # Intelligent scan decision
             should_scan, scan_reason = should_scan_now()
             
             if not should_scan:
                 # Sleep in short bursts to allow for interruptions
-                time.sleep(min(30, bot_status.get('signal_interval', 300) // 10))
+                clock.sleep(min(30, bot_status.get('signal_interval', 300) // 10))
                 continue
                 
-            print(f"\n🐺 === WOLF SCANNING ACTIVATED ===")
-            print(f"🕒 Time: {format_cairo_time()}")
-            print(f"🎯 Scan Reason: {scan_reason}")
-            print(f"📊 Market Regime: {bot_status.get('market_regime', 'NORMAL')}")
-            print(f"⚡ Hunting Mode: {'ON' if bot_status.get('hunting_mode') else 'OFF'}")
+            announce_scan(scan_reason)
             
             # Update market regime every major scan
-            if (current_time - last_major_scan).total_seconds() > 1800:  # Every 30 minutes
+            if scan_policy.regime_refresh_due(current_time):
                 detect_market_regime()
-                last_major_scan = current_time
-                quick_scan_count = 0
                 
             # Quick breakout scan if in hunting mode
             breakout_opportunities = []
-            if bot_status.get('hunting_mode') or bot_status.get('market_regime') in ['VOLATILE', 'EXTREME']:
+            if scan_policy.breakout_scan_due():
                 breakout_opportunities = detect_breakout_opportunities()
-                quick_scan_count += 1
-                
-                if breakout_opportunities:
-                    print(f"🚀 BREAKOUT OPPORTUNITIES DETECTED:")
-                    for opp in breakout_opportunities[:2]:
-                        print(f"   💎 {opp['symbol']}: Score {opp['score']}, Signals: {', '.join(opp['signals'])}")
             
             # Full market scan (intelligent frequency)
-            should_full_scan = (
-                not breakout_opportunities or  # No breakouts found
-                quick_scan_count >= 5 or      # Max quick scans reached
-                (current_time - last_major_scan).total_seconds() > 3600  # Force every hour
-            )
-            
-            if should_full_scan:
-                print("🔍 Performing FULL MARKET SCAN")
+            if scan_policy.full_scan_due(current_time, breakout_opportunities):
                 opportunities = scan_trading_pairs(
-                    base_assets=["BTC", "ETH", "BNB", "XRP", "SOL", "MATIC", "DOT", "ADA", "AVAX", "LINK"],  # Restored original 10 symbols
+                    base_assets=DEFAULT_SCAN_ASSETS,
                     quote_asset="USDT",
                     min_volume_usdt=500000  # Lower threshold for more opportunities
                 )
-                bot_status['last_scan_time'] = get_cairo_time()  # Record full scan time
-                quick_scan_count = 0
             else:
-                print("⚡ Using BREAKOUT SCAN results")
                 opportunities = breakout_opportunities
-                bot_status['last_scan_time'] = get_cairo_time()  # Record breakout scan time
+            bot_status['last_scan_time'] = get_cairo_time()  # Record scan time
             
             # Process opportunities
-            if not opportunities:
-                print("😴 No significant opportunities found - Wolf resting")
-                
-                # Fallback to default pair (only if not already processed)
-                current_symbol = "BTCUSDT"
-                
-                # Check if BTCUSDT was already processed in recent scan (within last 60 seconds)
-                last_btc_scan = bot_status.get('last_btc_scan_time')
-                current_time = get_cairo_time()
-                
-                if (last_btc_scan is None or 
-                    (current_time - last_btc_scan).total_seconds() > 60):
-                    
-                    df = fetch_data(symbol=current_symbol, interval="5m", limit=100)
-                    if df is not None:
-                        signal = signal_generator(df, current_symbol)
-                        current_price = float(df['close'].iloc[-1])
-                        
-                        bot_status.update({
-                            'current_symbol': current_symbol,
-                            'last_signal': signal,
-                            'last_price': current_price,
-                            'last_update': format_cairo_time(),
-                            'rsi': float(df['rsi'].iloc[-1]),
-                            'macd': {
-                                'macd': float(df['macd'].iloc[-1]),
-                                'signal': float(df['macd_signal'].iloc[-1]),
-                                'trend': df['macd_trend'].iloc[-1]
-                            },
-                            'last_btc_scan_time': current_time  # Track when we last scanned BTC
-                        })
-                        print(f"📊 Default analysis: {signal} for {current_symbol}")
-                else:
-                    print(f"⚠️ Skipping default {current_symbol} scan - analyzed recently")
-            else:
-                print(f"🎯 Found {len(opportunities)} hunting targets")
-                
-                # Process top opportunities with intelligent prioritization
-                max_targets = 1  # Limit to 1 target per cycle to prevent signal flooding
-                processed_symbols = set()  # Track processed symbols to avoid duplicates
-                signals_generated_this_cycle = 0  # Track signals in this cycle
-                
-                for i, opportunity in enumerate(opportunities[:max_targets]):
-                    current_symbol = opportunity['symbol']
-                    current_score = opportunity.get('score', 0)
-                    
-                    # Skip if we've already processed this symbol in this cycle
-                    if current_symbol in processed_symbols:
-                        print(f"⚠️ Skipping {current_symbol} - already processed in this cycle")
-                        continue
-                    processed_symbols.add(current_symbol)
-                    
-                    # Limit signals per cycle
-                    if signals_generated_this_cycle >= 1:
-                        print(f"🛑 Signal limit reached for this cycle - skipping remaining opportunities")
-                        break
-                    
-                    print(f"\n🎯 === TARGET {i+1}: {current_symbol} ===")
-                    print(f"💪 Score: {current_score:.1f}")
-                    
-                    # Get fresh data for analysis
-                    interval = "1m" if bot_status.get('hunting_mode') else "5m"
-                    df = fetch_data(symbol=current_symbol, interval=interval, limit=100)
-                    
-                    if df is None:
-                        continue
-                        
-                    # Enhanced signal generation with market regime consideration
-                    signal = signal_generator(df, current_symbol)
-                    signals_generated_this_cycle += 1  # Track signals generated in this cycle
-                    current_price = float(df['close'].iloc[-1])
-                    
-                    print(f"🚦 Signal: {signal} (#{signals_generated_this_cycle} this cycle)")
-                    print(f"💰 Price: ${current_price:.4f}")
-                    
-                    if 'rsi' in opportunity:
-                        print(f"📈 RSI: {opportunity['rsi']:.1f}")
-                    if 'signals' in opportunity:
-                        print(f"⚡ Triggers: {', '.join(opportunity['signals'])}")
-                    
-                    # Update pair tracking
-                    if current_symbol not in bot_status['monitored_pairs']:
-                        bot_status['monitored_pairs'][current_symbol] = {
-                            'last_signal': 'HOLD',
-                            'last_price': 0,
-                            'rsi': 50,
-                            'macd': {'macd': 0, 'signal': 0, 'trend': 'NEUTRAL'},
-                            'sentiment': 'neutral',
-                            'total_trades': 0,
-                            'successful_trades': 0,
-                            'last_trade_time': None
-                        }
-                    
-                    bot_status['monitored_pairs'][current_symbol].update({
-                        'last_signal': signal,
-                        'last_price': current_price,
-                        'rsi': float(df['rsi'].iloc[-1]),
-                        'macd': {'trend': df['macd_trend'].iloc[-1]},
-                        'last_update': format_cairo_time(),
-                        'opportunity_score': current_score
-                    })
-                    
-                    # Update main status with best target
-                    if i == 0:
-                        bot_status.update({
-                            'current_symbol': current_symbol,
-                            'last_signal': signal,
-                            'last_price': current_price,
-                            'last_update': format_cairo_time(),
-                            'rsi': float(df['rsi'].iloc[-1]),
-                            'macd': {'trend': df['macd_trend'].iloc[-1]},
-                            'opportunity_score': current_score
-                        })
-                    
-                    # Execute trade with enhanced conditions
-                    if signal in ["BUY", "SELL"]:
-                        # Initialize risk tracking if not present
-                        if 'consecutive_losses' not in bot_status:
-                            bot_status['consecutive_losses'] = 0
-                        if 'daily_loss' not in bot_status:
-                            bot_status['daily_loss'] = 0.0
-                        
-                        # Risk management checks with debug logging
-                        consecutive_losses = bot_status.get('consecutive_losses', 0)
-                        daily_loss = bot_status.get('daily_loss', 0.0)
-                        
-                        print(f"🔍 Risk Management Check:")
-                        print(f"   Consecutive losses: {consecutive_losses}/{config.MAX_CONSECUTIVE_LOSSES}")
-                        print(f"   Daily loss: ${daily_loss:.2f}/${config.MAX_DAILY_LOSS}")
-                        print(f"   API Connected: {bot_status.get('api_connected', False)}")
-                        print(f"   Can Trade (Account): {bot_status.get('can_trade', False)}")
-                        
-                        can_trade = (
-                            consecutive_losses < config.MAX_CONSECUTIVE_LOSSES and
-                            daily_loss < config.MAX_DAILY_LOSS and
-                            bot_status.get('api_connected', False) and
-                            bot_status.get('can_trade', False)
-                        )
-                        
-                        # Additional hunting mode conditions
-                        if bot_status.get('hunting_mode'):
-                            can_trade = can_trade and current_score >= 50  # Higher threshold in hunting mode
-                            print(f"   Hunting mode score: {current_score}/50")
-                        
-                        if can_trade:
-                            print(f"🚀 EXECUTING {signal} for {current_symbol}")
-                            result = execute_trade(signal, current_symbol)
-                            print(f"📊 Result: {result}")
-                            
-                            # Update tracking
-                            bot_status['monitored_pairs'][current_symbol]['total_trades'] += 1
-                            if "executed" in str(result).lower():
-                                bot_status['monitored_pairs'][current_symbol]['successful_trades'] += 1
-                            
-                            # In hunting mode, only take the best trade
-                            if bot_status.get('hunting_mode'):
-                                break
-                        else:
-                            print(f"🛑 Trade blocked by risk management")
-                            print(f"   Consecutive losses: {consecutive_losses}/{config.MAX_CONSECUTIVE_LOSSES}")
-                            print(f"   Daily loss: ${daily_loss:.2f}/${config.MAX_DAILY_LOSS}")
-                            print(f"   API Connected: {bot_status.get('api_connected', False)}")
-                            print(f"   Account Can Trade: {bot_status.get('can_trade', False)}")
-                            if bot_status.get('hunting_mode'):
-                                print(f"   Hunting mode score: {current_score}/50")
+            process_opportunities(opportunities)
             
             consecutive_errors = 0  # Reset error counter on successful cycle
             
             # Calculate next scan time with intelligent timing
-            next_interval, next_mode = calculate_smart_interval()
-            bot_status['next_signal_time'] = get_cairo_time() + timedelta(seconds=next_interval)
-            bot_status['signal_interval'] = next_interval
+            next_interval = schedule_next_scan()
             
-            print(f"\n🎯 Next scan: {next_mode} mode in {next_interval}s ({next_interval/60:.1f}min)")
-            print(f"📅 Expected at: {format_cairo_time(bot_status['next_signal_time'])}")
+            send_periodic_reports(current_time, scan_policy.last_major_scan)
             
-            # Send periodic Telegram market updates (every hour)
-            if TELEGRAM_AVAILABLE and (current_time - last_major_scan).total_seconds() > 3600:
-                try:
-                    volatility_metrics = bot_status.get('volatility_metrics', {})
-                    next_scan_str = format_cairo_time(bot_status['next_signal_time'])
-                    notify_market_update(
-                        bot_status.get('market_regime', 'NORMAL'),
-                        bot_status.get('hunting_mode', False),
-                        next_scan_str,
-                        volatility_metrics
-                    )
-                except Exception as telegram_error:
-                    print(f"Telegram market update failed: {telegram_error}")
-            
-            # Send daily summary each day at 08:00 Cairo time (once per day) and log daily performance for the previous day
-            if config.TELEGRAM.get('notifications', {}).get('daily_summary', True):
-                try:
-                    last_summary_date = bot_status.get('last_daily_summary')
-                    current_date = current_time.strftime('%Y-%m-%d')
-                    # Trigger within the first 15 minutes after 08:00 to allow for scheduling jitter
-                    if (current_time.hour == 8 and current_time.minute < 15 and
-                        (last_summary_date != current_date)):
-                        # First, write yesterday's performance row to CSV
-                        yesterday = (current_time - timedelta(days=1)).replace(hour=12, minute=0, second=0, microsecond=0)
-                        log_daily_performance(yesterday)
-                        # Then, send Telegram daily summary if Telegram is available
-                        if TELEGRAM_AVAILABLE:
-                            notify_daily_summary(bot_status.get('trading_summary', {}))
-                        bot_status['last_daily_summary'] = current_date
-                        print(f"📊 Daily performance logged and summary processed for {current_date} (08:00 Cairo)")
-                except Exception as telegram_error:
-                    print(f"Daily summary notification failed: {telegram_error}")
+            # Emit summaries for repeated errors whose aggregation window closed
+            flush_error_summaries()
             
             # Process any queued Telegram messages
             if TELEGRAM_AVAILABLE:
@@ -3175,6 +3445,8 @@ def trading_loop():
                 except Exception as telegram_error:
                     print(f"Telegram queue processing failed: {telegram_error}")
             
+            metrics.observe_stage('trading_cycle', time.perf_counter() - cycle_started)
+            
             # Smart sleep with early wake capabilities
             sleep_chunks = max(1, next_interval // 30)  # Wake up periodically
             chunk_size = next_interval / sleep_chunks
@@ -3182,7 +3454,7 @@ def trading_loop():
             for _ in range(int(sleep_chunks)):
                 if not bot_status['running']:
                     break
-                time.sleep(chunk_size)
+                clock.sleep(chunk_size)
         
         except KeyboardInterrupt:
             print("\n🛑 === KEYBOARD INTERRUPT ===")
@@ -3191,27 +3463,10 @@ def trading_loop():
             
         except Exception as e:
             consecutive_errors += 1
-            error_msg = f"Trading wolf error (attempt {consecutive_errors}/{max_consecutive_errors}): {e}"
-            print(f"⚠️ {error_msg}")
-            
-            # Log error to CSV
-            log_error_to_csv(str(e), "TRADING_LOOP_ERROR", "trading_loop", "ERROR")
-            
-            # Update bot status
-            bot_status['errors'].append(error_msg)
-            bot_status['last_error'] = error_msg
-            bot_status['last_update'] = format_cairo_time()
-            
-            if consecutive_errors >= max_consecutive_errors:
-                print(f"💀 Maximum errors reached ({max_consecutive_errors}). Wolf hibernating.")
-                bot_status['running'] = False
-                bot_status['status'] = 'stopped_due_to_errors'
+            sleep_time = handle_trading_loop_error(e, consecutive_errors)
+            if sleep_time is None:
                 break
-            
-            # Smart error recovery with exponential backoff
-            sleep_time = min(error_sleep_time * (2 ** (consecutive_errors - 1)), 300)  # Max 5 minutes
-            print(f"😴 Wolf resting for {sleep_time} seconds before retry...")
-            time.sleep(sleep_time)
+            clock.sleep(sleep_time)
     
     print("\n🐺 === AI TRADING WOLF DEACTIVATED ===")
     bot_status['running'] = False
@@ -3285,6 +3540,10 @@ def stop_trading_bot():
     bot_status['running'] = False
     bot_status['signal_scanning_active'] = False  # Deactivate signal scanning
     bot_status['next_signal_time'] = None  # Clear next signal time when stopped
+    sentiment_service.stop()
+    flush_error_summaries(force=True)
+    if sqlite_store is not None:
+        sqlite_store.flush()
     
     # Send Telegram notification for bot stop
     if TELEGRAM_AVAILABLE:
@@ -3293,6 +3552,19 @@ def stop_trading_bot():
         except Exception as telegram_error:
             print(f"Telegram bot stop notification failed: {telegram_error}")
 
+_engine_config = getattr(config, 'ENGINE', {})
+async_engine = None  # AsyncTradingEngine while the asyncio engine runs
+
+def _engine_mode():
+    return (os.getenv('CRYPTIX_ENGINE') or _engine_config.get('mode', 'threaded')).strip().lower()
+
+def run_async_engine(**options):
+    """Run the trading loop on the asyncio engine (blocks until the bot stops)"""
+    global async_engine
+    from async_engine import AsyncTradingEngine
+    async_engine = AsyncTradingEngine(sys.modules[__name__], **options)
+    async_engine.run()
+
 def start_trading_bot():
     """Start the trading bot in a separate thread"""
     try:
@@ -3307,6 +3579,16 @@ def start_trading_bot():
                 print("⚠️ Trading thread already exists and is running")
                 bot_status['running'] = True  # Ensure status is consistent
                 return
+
+        # Bot state lives in one process; never trade from a second one on the same logs/
+        if not engine_lock.acquire():
+            message = (f"Trading engine already runs in process {engine_lock.holder_pid()}; not starting a second instance "
+                       f"(serve CRYPTIX from a single worker process)")
+            print(f"⚠️ {message}")
+            bot_status['engine_role'] = 'follower'
+            bot_status['errors'].append(message, "ENGINE_LEADER")
+            return
+        bot_status['engine_role'] = 'leader'
             
         # Only initialize client if not already connected
         if not bot_status.get('api_connected', False):
@@ -3316,8 +3598,14 @@ def start_trading_bot():
                 log_error_to_csv("Failed to initialize API client on start", "CLIENT_ERROR", "start_trading_bot", "ERROR")
                 return
         
+        # Warm market sentiment in the background before the first scan (the asyncio engine refreshes it itself)
+        use_asyncio = _engine_mode() == 'asyncio'
+        if not use_asyncio:
+            sentiment_service.start()
+
         # Start trading loop in background thread with a unique name
-        trading_thread = threading.Thread(target=trading_loop, daemon=True, name='trading_loop_thread')
+        trading_thread = threading.Thread(target=run_async_engine if use_asyncio else trading_loop,
+                                          daemon=True, name='trading_loop_thread')
         trading_thread.start()
         bot_status['running'] = True
         bot_status['status'] = 'running'
@@ -3337,34 +3625,56 @@ def start_trading_bot():
 
 @app.route('/download_logs')
 def download_logs():
-    """Create a zip file containing all CSV log files and send it to the user"""
+    """Stream a zip of the CSV logs to the user.
+    Query params: files=trades,signals,performance,errors  start/end=YYYY-MM-DD  format=csv|parquet
+    """
     try:
-        # Create an in-memory zip file
-        memory_file = io.BytesIO()
-        with zipfile.ZipFile(memory_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Get all CSV files from logs directory
-            logs_dir = Path('logs')
-            if not logs_dir.exists():
-                return jsonify({'error': 'No log files found'}), 404
-                
-            for csv_file in logs_dir.glob('*.csv'):
-                if csv_file.exists():
-                    # Add file to zip with relative path
-                    zf.write(csv_file, csv_file.name)
-        
-        # Prepare the zip file for sending
-        memory_file.seek(0)
-        return send_file(
-            memory_file,
+        csv_files = setup_csv_logging()
+        requested = [f.strip() for f in request.args.get('files', '').split(',') if f.strip()]
+        unknown = [f for f in requested if f not in csv_files]
+        if unknown:
+            return jsonify({'error': f"Unknown log files: {', '.join(unknown)}"}), 400
+        selected = [t for t in (requested or csv_files) if csv_files[t].exists()]
+        if not selected:
+            return jsonify({'error': 'No log files found'}), 404
+        
+        start = request.args.get('start') or None
+        end = request.args.get('end') or None
+        for value in (start, end):
+            if value:
+                try:
+                    datetime.strptime(value, '%Y-%m-%d')
+                except ValueError:
+                    return jsonify({'error': f"Invalid date '{value}', expected YYYY-MM-DD"}), 400
+        
+        export_format = request.args.get('format', 'csv').lower()
+        if export_format not in ('csv', 'parquet'):
+            return jsonify({'error': "format must be 'csv' or 'parquet'"}), 400
+        if export_format == 'parquet' and not parquet_available():
+            return jsonify({'error': 'Parquet export requires pyarrow'}), 400
+        
+        def entries():
+            for log_type in selected:
+                path = csv_files[log_type]
+                time_column, numeric_columns = LOG_JOURNAL_SPECS[log_type]
+                if export_format == 'parquet':
+                    # Already gzip-compressed inside Parquet, so store without deflate
+                    yield (path.stem + '.parquet',
+                           iter_parquet_chunks(path, time_column, numeric_columns, start, end), False)
+                else:
+                    yield path.name, iter_csv_chunks(path, time_column, start, end), True
+        
+        return Response(
+            stream_with_context(stream_zip(entries())),
             mimetype='application/zip',
-            as_attachment=True,
-            download_name='trading_bot_logs.zip'
+            headers={'Content-Disposition': 'attachment; filename=trading_bot_logs.zip'}
         )
     except Exception as e:
         print(f"Error creating log zip file: {e}")
         return jsonify({'error': 'Failed to create zip file'}), 500
 
 @app.route('/')
+@cached_view(PAGE_CACHE_SECONDS)
 def home():
     # Get current strategy for display
     current_strategy = bot_status.get('trading_strategy', 'STRICT')
@@ -3375,527 +3685,7 @@ def home():
     }
     strategy_desc = strategy_descriptions.get(current_strategy, '')
     
-    return render_template_string("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>🐺 CRYPTIX AI Trading Wolf</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 15px;
-            color: #333;
-        }
-        
-        .container {
-            max-width: 420px;
-            margin: 0 auto;
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 24px;
-            box-shadow: 0 25px 50px rgba(0, 0, 0, 0.15);
-            overflow: hidden;
-            backdrop-filter: blur(20px);
-        }
-        
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px 20px;
-            text-align: center;
-            position: relative;
-        }
-        
-        .header::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-        }
-        
-        .header-content {
-            position: relative;
-            z-index: 1;
-        }
-        
-        .header h1 {
-            font-size: 1.8rem;
-            font-weight: 700;
-            margin-bottom: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 10px;
-        }
-        
-        .subtitle {
-            font-size: 0.9rem;
-            opacity: 0.9;
-            font-weight: 500;
-        }
-        
-        .main-content {
-            padding: 25px 20px;
-        }
-        
-        /* Status Cards */
-        .status-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 12px;
-            margin-bottom: 25px;
-        }
-        
-        .status-card {
-            padding: 16px;
-            border-radius: 16px;
-            text-align: center;
-            font-weight: 600;
-            font-size: 0.85rem;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            transition: transform 0.2s ease;
-        }
-        
-        .status-card:hover {
-            transform: translateY(-2px);
-        }
-        
-        .status-running {
-            background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-            color: #155724;
-            border: 1px solid #c3e6cb;
-        }
-        
-        .status-stopped {
-            background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-        }
-        
-        .status-connected {
-            background: linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%);
-            color: #0c5460;
-            border: 1px solid #bee5eb;
-        }
-        
-        .status-disconnected {
-            background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
-            color: #856404;
-            border: 1px solid #ffeaa7;
-        }
-        
-        .status-label {
-            display: block;
-            font-size: 0.75rem;
-            opacity: 0.8;
-            margin-bottom: 4px;
-        }
-        
-        .status-value {
-            font-size: 0.9rem;
-            font-weight: 700;
-        }
-        
-        /* Wolf Intelligence Section */
-        .wolf-section {
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            border-radius: 18px;
-            padding: 20px;
-            margin-bottom: 25px;
-            border: 1px solid #dee2e6;
-        }
-        
-        .wolf-title {
-            text-align: center;
-            font-size: 1.1rem;
-            font-weight: 700;
-            color: #495057;
-            margin-bottom: 15px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 8px;
-        }
-        
-        .wolf-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 10px;
-        }
-        
-        .wolf-card {
-            padding: 12px;
-            border-radius: 12px;
-            text-align: center;
-            font-size: 0.75rem;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-        
-        .wolf-card .label {
-            opacity: 0.8;
-            margin-bottom: 4px;
-            font-weight: 500;
-        }
-        
-        .wolf-card .value {
-            font-weight: 700;
-            font-size: 0.85rem;
-        }
-        
-        /* Trading Info Section */
-        .trading-section {
-            background: white;
-            border-radius: 18px;
-            padding: 20px;
-            margin-bottom: 25px;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            border: 1px solid #e9ecef;
-        }
-        
-        .section-title {
-            font-size: 1.1rem;
-            font-weight: 700;
-            color: #495057;
-            margin-bottom: 15px;
-            text-align: center;
-        }
-        
-        .info-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 12px 0;
-            border-bottom: 1px solid #f8f9fa;
-        }
-        
-        .info-item:last-child {
-            border-bottom: none;
-        }
-        
-        .info-label {
-            font-weight: 600;
-            color: #6c757d;
-            font-size: 0.85rem;
-        }
-        
-        .info-value {
-            font-weight: 700;
-            color: #495057;
-            font-size: 0.9rem;
-        }
-        
-        .signal-buy { color: #28a745; }
-        .signal-sell { color: #dc3545; }
-        .signal-hold { color: #6c757d; }
-        
-        .countdown-timer {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white !important;
-            padding: 6px 12px;
-            border-radius: 12px;
-            font-family: 'SF Mono', Monaco, monospace;
-            font-weight: 700;
-            font-size: 0.85rem;
-            box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3);
-        }
-        
-        /* Strategy Section */
-        .strategy-section {
-            background: white;
-            border-radius: 18px;
-            padding: 20px;
-            margin-bottom: 25px;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            border: 1px solid #e9ecef;
-        }
-        
-        .strategy-desc {
-            text-align: center;
-            color: #6c757d;
-            font-size: 0.85rem;
-            margin-bottom: 20px;
-            line-height: 1.5;
-        }
-        
-        .strategy-buttons {
-            display: grid;
-            grid-template-columns: 1fr;
-            gap: 10px;
-        }
-        
-        .strategy-btn {
-            padding: 14px;
-            border-radius: 14px;
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 0.85rem;
-            text-align: center;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 8px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-        
-        .strategy-btn.active {
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            color: white;
-            transform: scale(1.02);
-        }
-        
-        .strategy-btn:not(.active) {
-            background: #f8f9fa;
-            color: #6c757d;
-            border: 1px solid #dee2e6;
-        }
-        
-        .strategy-btn:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-        }
-        
-        /* Controls */
-        .controls {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 12px;
-            margin-bottom: 20px;
-        }
-        
-        .btn {
-            padding: 14px;
-            border-radius: 14px;
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 0.85rem;
-            text-align: center;
-            transition: all 0.3s ease;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }
-        
-        .btn:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-        }
-        
-        .btn-start {
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            color: white;
-        }
-        
-        .btn-stop {
-            background: linear-gradient(135deg, #dc3545 0%, #c82333 100%);
-            color: white;
-        }
-        
-        .btn-secondary {
-            background: linear-gradient(135deg, #6c757d 0%, #5a6268 100%);
-            color: white;
-        }
-        
-        .btn-warning {
-            background: linear-gradient(135deg, #ffc107 0%, #e0a800 100%);
-            color: #212529;
-        }
-        
-        /* Footer */
-        .footer {
-            text-align: center;
-            padding: 20px;
-            font-size: 0.75rem;
-            color: #6c757d;
-            border-top: 1px solid #f8f9fa;
-        }
-        
-        .footer a {
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-        }
-        
-        /* Mobile Optimizations */
-        @media (max-width: 480px) {
-            body { padding: 10px; }
-            .container { max-width: 100%; }
-            .header { padding: 20px 15px; }
-            .main-content { padding: 20px 15px; }
-            .header h1 { font-size: 1.6rem; }
-            .status-grid { 
-                grid-template-columns: 1fr 1fr;
-                gap: 8px; 
-            }
-            .wolf-grid { gap: 8px; }
-            .controls { grid-template-columns: 1fr; }
-        }
-        
-        /* Animations */
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.7; }
-        }
-        
-        .countdown-timer {
-            animation: pulse 2s infinite;
-        }
-        
-        /* Responsive adjustments */
-        @media (min-width: 481px) and (max-width: 768px) {
-            .container { max-width: 480px; }
-            .strategy-buttons { grid-template-columns: 1fr; }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div class="header-content">
-                <h1>
-                    🐺 CRYPTIX<br>Trading Wolf
-                </h1>
-                <div class="subtitle">Professional Trading Intelligence</div>
-            </div>
-        </div>
-        
-        <div class="main-content">
-            <!-- Status Cards -->
-            <div class="status-grid">
-                <div class="status-card {{ 'status-running' if status.running else 'status-stopped' }}">
-                    <div class="status-label">Bot Status</div>
-                    <div class="status-value">{{ 'Running' if status.running else 'Stopped' }}</div>
-                </div>
-                <div class="status-card {{ 'status-connected' if status.api_connected else 'status-disconnected' }}">
-                    <div class="status-label">API Status</div>
-                    <div class="status-value">{{ 'Connected' if status.api_connected else 'Disconnected' }}</div>
-                </div>
-            </div>
-            
-            <!-- AI Wolf Intelligence -->
-            <div class="wolf-section">
-                <div class="wolf-title">
-                    🧠 AI Wolf Intelligence
-                </div>
-                <div class="wolf-grid">
-                    <div class="wolf-card" style="background: {{ '#d4edda' if status.get('market_regime') == 'EXTREME' else '#d1ecf1' if status.get('market_regime') == 'VOLATILE' else '#fff3cd' if status.get('market_regime') == 'QUIET' else '#e9ecef' }}; 
-                                               color: {{ '#155724' if status.get('market_regime') == 'EXTREME' else '#0c5460' if status.get('market_regime') == 'VOLATILE' else '#856404' if status.get('market_regime') == 'QUIET' else '#495057' }};">
-                        <div class="label">Market Regime</div>
-                        <div class="value">{{ status.get('market_regime', 'NORMAL') }}</div>
-                    </div>
-                    <div class="wolf-card" style="background: {{ '#f8d7da' if status.get('hunting_mode') else '#e9ecef' }}; 
-                                               color: {{ '#721c24' if status.get('hunting_mode') else '#495057' }};">
-                        <div class="label">Wolf Mode</div>
-                        <div class="value">{{ 'HUNTING 🎯' if status.get('hunting_mode') else 'PASSIVE' }}</div>
-                    </div>
-                    <div class="wolf-card" style="background: #e9ecef; color: #495057;">
-                        <div class="label">Scan Interval</div>
-                        <div class="value">{{ (status.get('signal_interval', 900) // 60) }}min</div>
-                    </div>
-                    <div class="wolf-card" style="background: #e9ecef; color: #495057;">
-                        <div class="label">Next Scan</div>
-                        <div class="value countdown-timer">{{ time_remaining }}</div>
-                    </div>
-                </div>
-            </div>
-            
-            <!-- Trading Information -->
-            <div class="trading-section">
-                <div class="section-title">📊 Trading Status</div>
-                <div class="info-item">
-                    <span class="info-label">Last Signal</span>
-                    <span class="info-value signal-{{ status.last_signal.lower() }}">{{ status.last_signal }}</span>
-                </div>
-                <div class="info-item">
-                    <span class="info-label">Last Scan</span>
-                    <span class="info-value">{{ status.last_scan_time.strftime('%H:%M:%S') if status.last_scan_time else 'Never' }}</span>
-                </div>
-                <div class="info-item">
-                    <span class="info-label">Current Symbol</span>
-                    <span class="info-value">{{ status.current_symbol }}</span>
-                </div>
-                <div class="info-item">
-                    <span class="info-label">Current Price</span>
-                    <span class="info-value">${{ "{:,.2f}".format(status.last_price) if status.last_price else 'N/A' }}</span>
-                </div>
-                <div class="info-item">
-                    <span class="info-label">Total Revenue</span>
-                    <span class="info-value" style="color: {{ '#28a745' if status.trading_summary.total_revenue > 0 else '#dc3545' if status.trading_summary.total_revenue < 0 else '#6c757d' }}">
-                        ${{ "{:,.2f}".format(status.trading_summary.total_revenue) }}
-                    </span>
-                </div>
-                <div class="info-item">
-                    <span class="info-label">Win Rate</span>
-                    <span class="info-value">{{ "{:.1f}".format(status.trading_summary.win_rate) }}%</span>
-                </div>
-            </div>
-            
-            <!-- Strategy Section -->
-            <div class="strategy-section">
-                <div class="section-title">🎯 Trading Strategy</div>
-                <div class="strategy-desc">{{ strategy_desc }}</div>
-                <div class="strategy-buttons">
-                    <a href="/strategy/strict" class="strategy-btn {{ 'active' if status.trading_strategy == 'STRICT' else '' }}">
-                        🎯 <span>Strict - Conservative Trading</span>
-                    </a>
-                    <a href="/strategy/moderate" class="strategy-btn {{ 'active' if status.trading_strategy == 'MODERATE' else '' }}">
-                        ⚖️ <span>Moderate - Balanced Approach</span>
-                    </a>
-                    <a href="/strategy/adaptive" class="strategy-btn {{ 'active' if status.trading_strategy == 'ADAPTIVE' else '' }}">
-                        🧠 <span>Adaptive - Smart & Dynamic</span>
-                    </a>
-                </div>
-            </div>
-            
-            <!-- Controls -->
-            <div class="controls">
-                <a href="/start" class="btn btn-start">🚀 Start Bot</a>
-                <a href="/stop" class="btn btn-stop">🛑 Stop Bot</a>
-            </div>
-            
-            <div style="margin-bottom: 15px;">
-                <a href="/logs" class="btn btn-secondary" style="width: 100%; display: block;">📋 View Logs</a>
-            </div>
-        </div>
-        
-        <div class="footer">
-            <div style="margin-bottom: 10px;">
-                <strong>Cairo Time: {{ current_time }}</strong>
-            </div>
-            Auto-refresh every 30s • <a href="javascript:location.reload()">Manual Refresh</a>
-        </div>
-    </div>
-    
-    <script>
-        // Auto-refresh every 30 seconds
-        setTimeout(function() {
-            location.reload();
-        }, 30000);
-        
-        // Add touch feedback for mobile
-        document.querySelectorAll('.btn, .strategy-btn').forEach(button => {
-            button.addEventListener('touchstart', function() {
-                this.style.transform = 'scale(0.98)';
-            });
-            button.addEventListener('touchend', function() {
-                this.style.transform = '';
-            });
-        });
-    </script>
-</body>
-</html>
-    """, status=bot_status, current_time=format_cairo_time(), time_remaining=get_time_remaining_for_next_signal(), strategy_desc=strategy_desc)
+    return render_template('home.html', status=bot_status.snapshot(), current_time=format_cairo_time(), time_remaining=get_time_remaining_for_next_signal(), strategy_desc=strategy_desc)
 
 
 @app.route('/start')
@@ -3904,9 +3694,10 @@ def start():
     if not bot_status.get('running', False):
         try:
             start_trading_bot()
+            view_cache.invalidate('page:')
             return redirect('/')
         except Exception as e:
-            bot_status['errors'].append(f"Failed to start bot: {str(e)}")
+            bot_status['errors'].append(f"Failed to start bot: {str(e)}", "BOT_START")
             return redirect('/')
     else:
         print("⚠️ Bot is already running")
@@ -3917,6 +3708,7 @@ def stop():
     """Manual stop route"""
     try:
         stop_trading_bot()  # Call the proper stop function
+        view_cache.invalidate('page:')
         print("Bot manually stopped via web interface")
         return redirect('/')
     except Exception as e:
@@ -3937,6 +3729,7 @@ def force_scan():
         
         # Force immediate scan by setting next_signal_time to now
         bot_status['next_signal_time'] = get_cairo_time()
+        view_cache.invalidate('page:')
         
         return jsonify({
             'success': True, 
@@ -3958,6 +3751,7 @@ def set_strategy(name):
             
             # Update bot status
             bot_status['trading_strategy'] = new_strategy
+            view_cache.invalidate('page:')
             
             # Log the strategy change
             log_error_to_csv(
@@ -3988,823 +3782,154 @@ def set_strategy(name):
 
 @app.route('/api/status')
 def api_status():
-    """JSON API endpoint for bot status"""
-    return jsonify(bot_status)
+    """JSON API endpoint for bot status (public fields only)"""
+    return conditional_json(bot_status.snapshot())
+
+@app.route('/api/stream')
+def api_stream():
+    """Server-Sent Events feed: snapshot on connect, then status diffs and trades as they happen.
+    Each open stream holds a server thread, so connections are capped (extra clients get 503
+    and the dashboard polls instead) and closed after stream_max_seconds to be reopened."""
+    keepalive = _dashboard_config.get('stream_keepalive_seconds', 15)
+    max_seconds = _dashboard_config.get('stream_max_seconds', 300)
+    subscription = status_broadcaster.subscribe()
+    if subscription is None:
+        return Response('Too many live streams; poll /api/status instead\n', status=503,
+                        mimetype='text/plain', headers={'Retry-After': str(int(max_seconds))})
+
+    def events():
+        deadline = time.monotonic() + max_seconds
+        yield 'retry: 5000\n\n'
+        yield format_sse(status_broadcaster.version, 'snapshot',
+                         status_broadcaster.initial_state(bot_status.snapshot(STREAM_FIELDS)))
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return  # The client reconnects after the retry delay, freeing this thread meanwhile
+            try:
+                version, event, data = subscription.get(timeout=min(keepalive, remaining))
+            except queue.Empty:
+                yield ': keepalive\n\n'  # Keeps proxies from closing an idle stream
+                continue
+            yield format_sse(version, event, data)
+
+    response = Response(stream_with_context(events()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    response.call_on_close(lambda: status_broadcaster.unsubscribe(subscription))
+    return response
+
+@app.route('/api/errors')
+def api_errors():
+    """Paginated JSON API for recent errors (newest first)"""
+    try:
+        offset = request.args.get('offset', 0, type=int)
+        limit = request.args.get('limit', 50, type=int)
+        error_type = request.args.get('type') or None
+        return conditional_json(bot_status['errors'].page(offset=offset, limit=limit, error_type=error_type))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/logs/<log_type>')
+def api_logs(log_type):
+    """Cursor-paginated JSON API over the CSV logs (newest first)"""
+    if log_type not in LOG_JOURNAL_SPECS:
+        return jsonify({'error': f"Unknown log type: {log_type}"}), 404
+    try:
+        limit = min(max(request.args.get('limit', 100, type=int), 1), 1000)
+        days = request.args.get('days', type=int)
+        return conditional_json(query_log(log_type, limit=limit, cursor=request.args.get('cursor'), days=days))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/performance')
+def api_performance():
+    """Running performance stats (equity curve, drawdown, profit factor, streaks)"""
+    try:
+        stats = performance_tracker.snapshot()
+        stats['today'] = performance_tracker.day_summary(get_cairo_time().strftime('%Y-%m-%d'))
+        return conditional_json(stats)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
 @app.route('/api/balances')
 def api_balances():
     """JSON API endpoint for account balances"""
     try:
-        balance_summary = get_account_balances_summary()
-        return jsonify(balance_summary)
+        balance_summary = view_cache.get_or_set(
+            'model:balances', _dashboard_config.get('balances_cache_seconds', 15),
+            get_account_balances_summary,
+            cache_if=lambda summary: isinstance(summary, dict) and 'error' not in summary
+        )
+        return conditional_json(balance_summary)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/logs')
+@cached_view(PAGE_CACHE_SECONDS)
 def view_logs():
     """View CSV logs interface"""
-    return render_template_string("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>📋 CRYPTIX Logs</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 15px;
-            color: #333;
-        }
-        
-        .container {
-            max-width: 420px;
-            margin: 0 auto;
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 24px;
-            box-shadow: 0 25px 50px rgba(0, 0, 0, 0.15);
-            overflow: hidden;
-            backdrop-filter: blur(20px);
-        }
-        
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px 20px;
-            text-align: center;
-            position: relative;
-        }
-        
-        .header::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-        }
-        
-        .header-content {
-            position: relative;
-            z-index: 1;
-        }
-        
-        .header h1 {
-            font-size: 1.8rem;
-            font-weight: 700;
-            margin-bottom: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 10px;
-        }
-        
-        .subtitle {
-            font-size: 0.9rem;
-            opacity: 0.9;
-            font-weight: 500;
-        }
-        
-        .main-content {
-            padding: 25px 20px;
-        }
-        
-        .back-link {
-            display: inline-block;
-            margin-bottom: 25px;
-            padding: 12px 20px;
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            color: white;
-            text-decoration: none;
-            border-radius: 14px;
-            font-size: 0.9rem;
-            font-weight: 600;
-            box-shadow: 0 4px 12px rgba(40, 167, 69, 0.3);
-            transition: all 0.3s ease;
-            width: 100%;
-            text-align: center;
-            box-sizing: border-box;
-        }
-        
-        .back-link:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 16px rgba(40, 167, 69, 0.4);
-        }
-        
-        /* Log Files Section */
-        .log-section {
-            background: white;
-            border-radius: 18px;
-            padding: 20px;
-            margin-bottom: 25px;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-            border: 1px solid #e9ecef;
-        }
-        
-        .section-title {
-            font-size: 1.1rem;
-            font-weight: 700;
-            color: #495057;
-            margin-bottom: 15px;
-            text-align: center;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 8px;
-        }
-        
-        .log-links {
-            display: grid;
-            grid-template-columns: 1fr;
-            gap: 12px;
-        }
-        
-        .log-links a {
-            padding: 16px;
-            border-radius: 14px;
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 0.85rem;
-            text-align: center;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 10px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }
-        
-        .log-links a:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-        }
-        
-        .log-links a.download {
-            background: linear-gradient(135deg, #ffc107 0%, #e0a800 100%);
-            color: #212529;
-        }
-        
-        .log-links a.download:hover {
-            box-shadow: 0 4px 12px rgba(255, 193, 7, 0.3);
-        }
-        
-        /* Stats Section */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: 1fr;
-            gap: 12px;
-        }
-        
-        .stat-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 12px 0;
-            border-bottom: 1px solid #f8f9fa;
-        }
-        
-        .stat-item:last-child {
-            border-bottom: none;
-        }
-        
-        .stat-label {
-            font-weight: 600;
-            color: #6c757d;
-            font-size: 0.85rem;
-        }
-        
-        .stat-value {
-            font-weight: 700;
-            color: #495057;
-            font-size: 0.9rem;
-        }
-        
-        /* Footer */
-        .footer {
-            text-align: center;
-            padding: 20px;
-            font-size: 0.75rem;
-            color: #6c757d;
-            border-top: 1px solid #f8f9fa;
-        }
-        
-        .footer a {
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-        }
-        
-        /* Mobile Optimizations */
-        @media (max-width: 480px) {
-            body { padding: 10px; }
-            .container { max-width: 100%; }
-            .header { padding: 20px 15px; }
-            .main-content { padding: 20px 15px; }
-            .header h1 { font-size: 1.6rem; }
-        }
-        
-        /* Touch feedback */
-        .log-links a {
-            -webkit-tap-highlight-color: transparent;
-        }
-        
-        /* Responsive adjustments */
-        @media (min-width: 481px) and (max-width: 768px) {
-            .container { max-width: 480px; }
-            .log-links { grid-template-columns: 1fr 1fr; }
-            .log-links a.download { grid-column: 1 / -1; }
-        }
-        
-        @media (min-width: 769px) {
-            .container { max-width: 600px; }
-            .log-links { grid-template-columns: 1fr 1fr; }
-            .log-links a.download { grid-column: 1 / -1; }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div class="header-content">
-                <h1>
-                    📋 CRYPTIX<br>Trading Logs
-                </h1>
-                <div class="subtitle">Activity & Performance Monitoring</div>
-            </div>
-        </div>
-        
-        <div class="main-content">
-            <a href="/" class="back-link">← Back to Dashboard</a>
-            
-            <!-- Log Files Section -->
-            <div class="log-section">
-                <div class="section-title">
-                    📊 Available Log Files
-                </div>
-                <div class="log-links">
-                    <a href="/logs/trades">
-                        📊 <span>Trade History</span>
-                    </a>
-                    <a href="/logs/signals">
-                        📈 <span>Signal History</span>
-                    </a>
-                    <a href="/logs/performance">
-                        📉 <span>Daily Performance</span>
-                    </a>
-                    <a href="/logs/errors">
-                        ❌ <span>Error Log</span>
-                    </a>
-                    <a href="/download_logs" class="download">
-                        💾 <span>Download All CSV Files</span>
-                    </a>
-                </div>
-            </div>
-            
-            <!-- Quick Stats Section -->
-            <div class="log-section">
-                <div class="section-title">
-                    📈 Quick Statistics
-                </div>
-                <div class="stats-grid">
-                    <div class="stat-item">
-                        <span class="stat-label">Total Trades Logged</span>
-                        <span class="stat-value">{{ total_trades }}</span>
-                    </div>
-                    <div class="stat-item">
-                        <span class="stat-label">CSV Files Location</span>
-                        <span class="stat-value">/logs/</span>
-                    </div>
-                    <div class="stat-item">
-                        <span class="stat-label">Last Updated</span>
-                        <span class="stat-value">{{ current_time }}</span>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="footer">
-            <div style="margin-bottom: 10px;">
-                <strong>Cairo Time: {{ current_time }}</strong>
-            </div>
-            <a href="javascript:location.reload()">Refresh Data</a>
-        </div>
-    </div>
-    
-    <script>
-        // Add touch feedback for mobile
-        document.querySelectorAll('.log-links a, .back-link').forEach(button => {
-            button.addEventListener('touchstart', function() {
-                this.style.transform = 'scale(0.98)';
-            });
-            button.addEventListener('touchend', function() {
-                this.style.transform = '';
-            });
-        });
-    </script>
-</body>
-</html>
-    """, total_trades=len(get_csv_trade_history()), current_time=format_cairo_time())
+    return render_template('logs.html', total_trades=count_log('trades'), current_time=format_cairo_time())
 
 @app.route('/logs/trades')
+@cached_view(PAGE_CACHE_SECONDS)
 def view_trade_logs():
     """View trade history CSV"""
-    trades = get_csv_trade_history(30)  # Last 30 days
+    try:
+        page = query_log('trades', limit=100, cursor=request.args.get('cursor'), days=30)  # Last 30 days
+    except Exception as e:
+        log_error_to_csv(f"Error reading CSV trade history: {e}", 
+                       "CSV_READ_ERROR", "view_trade_logs", "ERROR")
+        return f"Error loading trade logs: {e}", 500
+    trades = page['rows']
     
-    return render_template_string("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Trade History</title>
-    <style>
-        body { 
-            font-family: Arial, sans-serif; 
-            margin: 0; 
-            background: #f5f5f5;
-            padding: 10px;
-        }
-        .container { 
-            max-width: 1400px; 
-            margin: 0 auto; 
-            background: white; 
-            padding: 15px; 
-            border-radius: 10px;
-            overflow-x: hidden;
-        }
-        .table-wrapper {
-            overflow-x: auto;
-            -webkit-overflow-scrolling: touch;
-            margin: 0 -15px;
-            padding: 0 15px;
-        }
-        table { 
-            width: 100%; 
-            border-collapse: collapse; 
-            margin-top: 15px; 
-            font-size: 0.85rem;
-            min-width: 800px;
-        }
-        th, td { 
-            padding: 10px 12px; 
-            border: 1px solid #ddd; 
-            text-align: left;
-            white-space: nowrap;
-        }
-        th { 
-            background: #f8f9fa; 
-            font-weight: bold; 
-            position: sticky; 
-            top: 0;
-            z-index: 1;
-        }
-        tr:nth-child(even) { background: #f9f9f9; }
-        .back-link { 
-            display: inline-block; 
-            margin-bottom: 20px; 
-            padding: 12px 20px; 
-            background: #28a745; 
-            color: white; 
-            text-decoration: none; 
-            border-radius: 5px;
-            font-size: 0.9rem;
-        }
-        .back-link:hover {
-            background: #218838;
-        }
-        h1 {
-            font-size: 1.8rem;
-            margin: 15px 0;
-        }
-        .status-success { background: #d4edda; }
-        .status-simulated { background: #d1ecf1; }
-        .status-error { background: #f8d7da; }
-        .signal-buy { color: #28a745; font-weight: bold; }
-        .signal-sell { color: #dc3545; font-weight: bold; }
-        .signal-hold { color: #ffc107; font-weight: bold; }
-        
-        @media (max-width: 768px) {
-            body {
-                padding: 5px;
-            }
-            .container {
-                padding: 10px;
-            }
-            h1 {
-                font-size: 1.5rem;
-                margin: 10px 0;
-            }
-            table {
-                font-size: 0.8rem;
-            }
-            th, td {
-                padding: 8px 10px;
-            }
-            .back-link {
-                width: 100%;
-                text-align: center;
-                box-sizing: border-box;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <a href="/logs" class="back-link">← Back to Logs</a>
-        <h1>📊 Trade History (Last 30 Days - Newest First)</h1>
-        
-        {% if trades %}
-        <table>
-            <thead>
-                <tr>
-                    <th>Time (Cairo)</th>
-                    <th>Signal</th>
-                    <th>Symbol</th>
-                    <th>Quantity</th>
-                    <th>Price</th>
-                    <th>Value</th>
-                    <th>Fee</th>
-                    <th>Status</th>
-                    <th>RSI</th>
-                    <th>MACD</th>
-                    <th>Sentiment</th>
-                    <th>P&L</th>
-                </tr>
-            </thead>
-            <tbody>
-                {% for trade in trades %}
-                <tr class="status-{{ trade.status }}">
-                    <td>{{ trade.cairo_time }}</td>
-                    <td class="signal-{{ trade.signal.lower() }}">{{ trade.signal }}</td>
-                    <td>{{ trade.symbol }}</td>
-                    <td>{{ "%.6f"|format(trade.quantity) }}</td>
-                    <td>${{ "%.2f"|format(trade.price) }}</td>
-                    <td>${{ "%.2f"|format(trade.value) }}</td>
-                    <td>${{ "%.4f"|format(trade.fee) }}</td>
-                    <td>{{ trade.status }}</td>
-                    <td>{{ "%.1f"|format(trade.rsi) }}</td>
-                    <td>{{ trade.macd_trend }}</td>
-                    <td>{{ trade.sentiment }}</td>
-                    <td>${{ "%.2f"|format(trade.profit_loss) }}</td>
-                </tr>
-                {% endfor %}
-            </tbody>
-        </table>
-        {% else %}
-        <p>No trades found in the last 30 days.</p>
-        {% endif %}
-    </div>
-</body>
-</html>
-    """, trades=trades)
+    return render_template('trade_logs.html', trades=trades, next_cursor=page['next_cursor'])
 
 @app.route('/logs/signals')
+@cached_view(PAGE_CACHE_SECONDS)
 def view_signal_logs():
     """View signal history CSV"""
     try:
-        csv_files = setup_csv_logging()
+        # Newest 100 signals per page from the indexed journal
+        page = query_log('signals', limit=100, cursor=request.args.get('cursor'))
+        signals = page['rows']
         
-        if not csv_files['signals'].exists():
-            signals = []
-        else:
-            df = pd.read_csv(csv_files['signals'])
-            # Sort by timestamp column to show newest first, then get last 100
-            if not df.empty and 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-                df = df.sort_values('timestamp', ascending=False).head(100)
-            else:
-                # Fallback: get last 100 signals and reverse order
-                df = df.tail(100).iloc[::-1]
-            signals = df.to_dict('records')
-        
-        return render_template_string("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Signal History</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
-        .container { max-width: 1400px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; }
-        table { width: 100%; border-collapse: collapse; margin-top: 15px; font-size: 0.8rem; }
-        th, td { padding: 6px 8px; border: 1px solid #ddd; text-align: left; }
-        th { background: #f8f9fa; font-weight: bold; position: sticky; top: 0; }
-        tr:nth-child(even) { background: #f9f9f9; }
-        .back-link { display: inline-block; margin-bottom: 20px; padding: 10px 20px; background: #28a745; color: white; text-decoration: none; border-radius: 5px; }
-        .signal-buy { color: #28a745; font-weight: bold; }
-        .signal-sell { color: #dc3545; font-weight: bold; }
-        .signal-hold { color: #ffc107; font-weight: bold; }
-        .sentiment-bullish { color: #28a745; }
-        .sentiment-bearish { color: #dc3545; }
-        .sentiment-neutral { color: #6c757d; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <a href="/logs" class="back-link">← Back to Logs</a>
-        <h1>📈 Signal History (Latest 100 Signals - Newest First)</h1>
-        
-        {% if signals %}
-        <table>
-            <thead>
-                <tr>
-                    <th>Time (Cairo)</th>
-                    <th>Signal</th>
-                    <th>Symbol</th>
-                    <th>Price</th>
-                    <th>RSI</th>
-                    <th>MACD</th>
-                    <th>MACD Trend</th>
-                    <th>Sentiment</th>
-                    <th>SMA5</th>
-                    <th>SMA20</th>
-                    <th>Reason</th>
-                </tr>
-            </thead>
-            <tbody>
-                {% for signal in signals %}
-                <tr>
-                    <td>{{ signal.cairo_time }}</td>
-                    <td class="signal-{{ signal.signal.lower() }}">{{ signal.signal }}</td>
-                    <td>{{ signal.symbol }}</td>
-                    <td>${{ "%.2f"|format(signal.price) }}</td>
-                    <td>{{ "%.1f"|format(signal.rsi) }}</td>
-                    <td>{{ "%.6f"|format(signal.macd) }}</td>
-                    <td>{{ signal.macd_trend }}</td>
-                    <td class="sentiment-{{ signal.sentiment }}">{{ signal.sentiment }}</td>
-                    <td>${{ "%.2f"|format(signal.sma5) }}</td>
-                    <td>${{ "%.2f"|format(signal.sma20) }}</td>
-                    <td style="font-size: 0.7rem;">{{ signal.reason[:100] }}...</td>
-                </tr>
-                {% endfor %}
-            </tbody>
-        </table>
-        {% else %}
-        <p>No signals found.</p>
-        {% endif %}
-    </div>
-</body>
-</html>
-        """, signals=signals)
+        return render_template('signal_logs.html', signals=signals, next_cursor=page['next_cursor'])
         
     except Exception as e:
-        return f"Error loading signal logs: {e}"
+        return f"Error loading signal logs: {e}", 500
 
 @app.route('/logs/performance')
+@cached_view(PAGE_CACHE_SECONDS)
 def view_performance_logs():
     """View daily performance CSV in simple format"""
     try:
-        csv_files = setup_csv_logging()
-        performance_data = []
-        
-        if csv_files['performance'].exists():
-            df = pd.read_csv(csv_files['performance'])
-            # Convert to list of dictionaries, newest first (reverse order)
-            performance_data = df.iloc[::-1].to_dict('records')
-        
-        return render_template_string("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Daily Performance</title>
-    <style>
-        body { 
-            font-family: Arial, sans-serif; 
-            margin: 0; 
-            background: #f5f5f5;
-            padding: 10px;
-        }
-        .container { 
-            max-width: 1400px; 
-            margin: 0 auto; 
-            background: white; 
-            padding: 15px; 
-            border-radius: 10px;
-            overflow-x: hidden;
-        }
-        .table-wrapper {
-            overflow-x: auto;
-            -webkit-overflow-scrolling: touch;
-            margin: 0 -15px;
-            padding: 0 15px;
-        }
-        table { 
-            width: 100%; 
-            border-collapse: collapse; 
-            margin-top: 15px; 
-            font-size: 0.85rem;
-            min-width: 800px;
-        }
-        th, td { 
-            padding: 10px 12px; 
-            border: 1px solid #ddd; 
-            text-align: left;
-            white-space: nowrap;
-        }
-        th { 
-            background: #f8f9fa; 
-            font-weight: bold; 
-            position: sticky; 
-            top: 0;
-            z-index: 1;
-        }
-        tr:nth-child(even) { background: #f9f9f9; }
-        .back-link { 
-            display: inline-block; 
-            margin-bottom: 20px; 
-            padding: 12px 20px; 
-            background: #28a745; 
-            color: white; 
-            text-decoration: none; 
-            border-radius: 5px;
-            font-size: 0.9rem;
-        }
-        .back-link:hover {
-            background: #218838;
-        }
-        h1 {
-            font-size: 1.8rem;
-            margin: 15px 0;
-        }
-        .positive { color: #28a745; font-weight: bold; }
-        .negative { color: #dc3545; font-weight: bold; }
-        .neutral { color: #6c757d; font-weight: bold; }
+        # Newest days first from the indexed journal
+        page = query_log('performance', limit=100, cursor=request.args.get('cursor'))
+        performance_data = page['rows']
         
-        @media (max-width: 768px) {
-            body {
-                padding: 5px;
-            }
-            .container {
-                padding: 10px;
-            }
-            h1 {
-                font-size: 1.5rem;
-                margin: 10px 0;
-            }
-            table {
-                font-size: 0.8rem;
-            }
-            th, td {
-                padding: 8px 10px;
-            }
-            .back-link {
-                width: 100%;
-                text-align: center;
-                box-sizing: border-box;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <a href="/logs" class="back-link">← Back to Logs</a>
-        <h1>📊 Daily Performance (CSV Format)</h1>
-        
-        {% if performance_data %}
-        <div class="table-wrapper">
-            <table>
-                <thead>
-                    <tr>
-                        <th>Date</th>
-                        <th>Total Trades</th>
-                        <th>Successful Trades</th>
-                        <th>Failed Trades</th>
-                        <th>Win Rate (%)</th>
-                        <th>Total Revenue</th>
-                        <th>Daily P&L</th>
-                        <th>Total Volume</th>
-                        <th>Max Drawdown</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for row in performance_data %}
-                    <tr>
-                        <td>{{ row.date }}</td>
-                        <td>{{ row.total_trades }}</td>
-                        <td>{{ row.successful_trades }}</td>
-                        <td>{{ row.failed_trades }}</td>
-                        <td class="{{ 'positive' if row.win_rate > 60 else 'negative' if row.win_rate < 40 else 'neutral' }}">
-                            {{ "%.1f"|format(row.win_rate) }}%
-                        </td>
-                        <td class="{{ 'positive' if row.total_revenue > 0 else 'negative' if row.total_revenue < 0 else 'neutral' }}">
-                            ${{ "%.2f"|format(row.total_revenue) }}
-                        </td>
-                        <td class="{{ 'positive' if row.daily_pnl > 0 else 'negative' if row.daily_pnl < 0 else 'neutral' }}">
-                            ${{ "%.2f"|format(row.daily_pnl) }}
-                        </td>
-                        <td>${{ "%.2f"|format(row.total_volume) }}</td>
-                        <td>{{ "%.2f"|format(row.max_drawdown) if row.max_drawdown else '0.00' }}</td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        {% else %}
-        <p>No daily performance data found. Performance data will appear here once the bot starts trading and logging daily summaries.</p>
-        {% endif %}
-    </div>
-</body>
-</html>
-        """, performance_data=performance_data)
+        return render_template('performance_logs.html', performance_data=performance_data, next_cursor=page['next_cursor'])
         
     except Exception as e:
-        return f"Error loading performance logs: {e}"
+        return f"Error loading performance logs: {e}", 500
 
 @app.route('/logs/errors')
+@cached_view(PAGE_CACHE_SECONDS)
 def view_error_logs():
     """View error log CSV"""
     try:
-        csv_files = setup_csv_logging()
+        # Newest 50 errors per page from the indexed journal
+        page = query_log('errors', limit=50, cursor=request.args.get('cursor'))
+        errors = page['rows']
         
-        if not csv_files['errors'].exists():
-            errors = []
-        else:
-            df = pd.read_csv(csv_files['errors'])
-            # Sort by timestamp to show newest first, then get last 50
-            if not df.empty and 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-                df = df.dropna(subset=['timestamp'])
-                df = df.sort_values('timestamp', ascending=False).head(50)
-            else:
-                # Fallback: get last 50 errors and reverse order to show newest first
-                df = df.tail(50).iloc[::-1]
-            errors = df.to_dict('records')
-        
-        return render_template_string("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Error Log</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
-        .container { max-width: 1400px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; }
-        table { width: 100%; border-collapse: collapse; margin-top: 15px; font-size: 0.8rem; }
-        th, td { padding: 6px 8px; border: 1px solid #ddd; text-align: left; }
-        th { background: #f8f9fa; font-weight: bold; position: sticky; top: 0; }
-        tr:nth-child(even) { background: #f9f9f9; }
-        .back-link { display: inline-block; margin-bottom: 20px; padding: 10px 20px; background: #28a745; color: white; text-decoration: none; border-radius: 5px; }
-        .error { background: #f8d7da; }
-        .warning { background: #fff3cd; }
-        .critical { background: #f5c6cb; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <a href="/logs" class="back-link">← Back to Logs</a>
-        <h1>❌ Error Log (Last 50 Errors - Newest First)</h1>
-        
-        {% if errors %}
-        <table>
-            <thead>
-                <tr>
-                    <th>Time (Cairo)</th>
-                    <th>Severity</th>
-                    <th>Error Type</th>
-                    <th>Function</th>
-                    <th>Error Message</th>
-                    <th>Bot Status</th>
-                </tr>
-            </thead>
-            <tbody>
-                {% for error in errors %}
-                <tr class="{{ error.severity.lower() }}">
-                    <td>{{ error.cairo_time }}</td>
-                    <td>{{ error.severity }}</td>
-                    <td>{{ error.error_type }}</td>
-                    <td>{{ error.function_name }}</td>
-                    <td style="max-width: 300px; word-wrap: break-word;">{{ error.error_message }}</td>
-                    <td>{{ error.bot_status }}</td>
-                </tr>
-                {% endfor %}
-            </tbody>
-        </table>
-        {% else %}
-        <p>No errors found.</p>
-        {% endif %}
-    </div>
-</body>
-</html>
-        """, errors=errors)
+        return render_template('error_logs.html', errors=errors, next_cursor=page['next_cursor'])
         
     except Exception as e:
-        return f"Error loading error logs: {e}"
+        return f"Error loading error logs: {e}", 500
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Stage latency histograms and counters in Prometheus text format"""
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 @app.route('/ping')
 def ping():
@@ -4821,7 +3946,7 @@ def health():
             'bot_running': bot_status.get('running', False),
             'api_connected': bot_status.get('api_connected', False),
             'last_update': bot_status.get('last_update', 'Never'),
-            'error_count': len(bot_status.get('errors', [])),
+            'error_count': bot_status['errors'].total,
             'consecutive_errors': bot_status.get('consecutive_errors', 0),
             'uptime_seconds': (get_cairo_time() - bot_status.get('start_time', get_cairo_time())).total_seconds(),
             'account_type': bot_status.get('account_type', 'Unknown'),
@@ -4842,6 +3967,26 @@ def health():
             env_check['api_key_preview'] = f"{api_key_val[:8]}...{api_key_val[-4:]}" if len(api_key_val) >= 12 else "invalid"
         
         health_data['environment'] = env_check
+        health_data['sentiment'] = sentiment_service.get_stats()
+        health_data['error_aggregation'] = error_aggregator.get_stats()
+        health_data['view_cache'] = view_cache.get_stats()
+        health_data['status_stream'] = status_broadcaster.get_stats()
+        health_data['candles'] = candle_store.get_stats()
+        health_data['regime'] = regime_engine.get_stats()
+        health_data['stages'] = metrics.stage_summary()
+        if api_tape is not None:
+            health_data['recording'] = api_tape.get_stats()
+        if hasattr(client, 'get_stats'):
+            health_data['exchange'] = client.get_stats()  # Simulated exchange: requests, weight, rate limits
+        health_data['startup'] = startup_profiler.report()
+        health_data['engine'] = {
+            'mode': _engine_mode(),
+            'role': bot_status.get('engine_role', 'idle'),
+            'pid': os.getpid(),
+            'leader_pid': engine_lock.holder_pid()
+        }
+        if async_engine is not None:
+            health_data['engine']['async'] = async_engine.get_stats()
         
         # Try to get memory info if psutil is available
         try:
@@ -4870,25 +4015,64 @@ def health():
             'timestamp': format_cairo_time()
         }), 500
 
+startup_profiler.checkpoint('routes')
+print(f"⏱️ Startup: {startup_profiler.summary()}")
+
+def _timed_client_init():
+    started = time.perf_counter()
+    ok = initialize_client()
+    startup_profiler.record('api client init', started, time.perf_counter() - started)
+    if not ok:
+        print("❌ Failed to initialize API client at startup")
+    return ok
+
+def prepare_runtime(background=False):
+    """One-time process setup shared by __main__ and wsgi.py.
+    With background=True the API client connects on a separate thread so the server
+    can answer /ping immediately; otherwise returns False if the client failed.
+    """
+    if bot_status.get('api_connected', False):
+        return True
+    print("🔧 Initializing API client...")
+    if background:
+        threading.Thread(target=_timed_client_init, daemon=True, name='client_init').start()
+        return True
+    return _timed_client_init()
+
+def run_server(host, port, debug=False):
+    """Serve the app: Flask dev server in development/debug, multi-threaded WSGI otherwise"""
+    if debug or _server_config.get('mode', 'production') == 'development':
+        print(f"🌐 Starting Flask development server on {host}:{port} (debug={'ON' if debug else 'OFF'})")
+        startup_profiler.mark_ready()
+        app.run(host=host, port=port, debug=debug, threaded=True)
+        return
+
+    threads = _server_config.get('threads', 8)
+    try:
+        from waitress import serve  # Optional production WSGI server
+    except ImportError:
+        print(f"🌐 waitress not installed; serving with threaded Werkzeug on {host}:{port}")
+        startup_profiler.mark_ready()
+        app.run(host=host, port=port, debug=False, threaded=True, use_reloader=False)
+        return
+    print(f"🌐 Starting waitress on {host}:{port} ({threads} threads)")
+    startup_profiler.mark_ready()
+    serve(app, host=host, port=port, threads=threads, ident='CRYPTIX')
+
 if __name__ == '__main__':
     print("\n🚀 Starting CRYPTIX AI Trading Bot...")
     print("=" * 50)
     
     # Initialize bot systems
     try:
-        # Initialize API client once at startup
-        if not bot_status.get('api_connected', False):
-            print("🔧 Initializing API client...")
-            if not initialize_client():
-                print("❌ Failed to initialize API client at startup")
-                raise RuntimeError("API client init failed")
+        # Connect the API client in the background so the server starts answering right away
+        prepare_runtime(background=True)
 
-        # Configure Flask for production by default; override with FLASK_DEBUG=1
-        flask_host = os.getenv('FLASK_HOST', '0.0.0.0')
-        flask_port = 10000
+        # Production serving by default; override with FLASK_DEBUG=1 or SERVER['mode']
+        flask_host = os.getenv('FLASK_HOST', _server_config.get('host', '0.0.0.0'))
+        flask_port = int(os.getenv('PORT', _server_config.get('port', 10000)))
         flask_debug = str(os.getenv('FLASK_DEBUG', '0')).strip().lower() in ['1', 'true', 'yes', 'on']
-        print(f"🌐 Starting Flask server on {flask_host}:{flask_port} (debug={'ON' if flask_debug else 'OFF'})")
-        app.run(host=flask_host, port=flask_port, debug=flask_debug)
+        run_server(flask_host, flask_port, debug=flask_debug)
     except Exception as e:
         print(f"Failed to start application: {e}")
         log_error_to_csv(str(e), "STARTUP_ERROR", "main", "CRITICAL")
@@ -0,0 +1,14 @@
+"""
+WSGI entry point for CRYPTIX Trading Bot
+
+    waitress-serve --port=10000 --threads=8 wsgi:app
+    gunicorn --workers 1 --threads 8 --bind 0.0.0.0:10000 wsgi:app
+
+Serve from a single worker process: bot state, the dashboard and the
+/start and /stop controls all live in the process running the trading loop.
+Scale request handling with threads, not workers.
+"""
+
+from web_bot import app, prepare_runtime
+
+prepare_runtime(background=True)